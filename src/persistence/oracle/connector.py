@@ -14,7 +14,7 @@ import logging
 from typing import Dict, Any, Optional, List
 from contextlib import contextmanager
 
-import cx_Oracle
+import oracledb as cx_Oracle
 
 # Configuração de logging
 logger = logging.getLogger(__name__)
@@ -58,10 +58,11 @@ class OracleConnector:
 
         # Configurações de pool
         pool_config = self.config.get('pool', {})
-        self.min_connections = pool_config.get('min', 1)
-        self.max_connections = pool_config.get('max', 5)
+        self.min_connections = pool_config.get('min', 2)
+        self.max_connections = pool_config.get('max', 8)
         self.increment = pool_config.get('increment', 1)
         self.timeout = pool_config.get('timeout', 60)
+        self.stmtcachesize = pool_config.get('stmtcachesize', 50)
 
         # Políticas de retry
         retry_config = self.config.get('retry', {})
@@ -136,11 +137,11 @@ class OracleConnector:
             'sessions': """
                 CREATE TABLE sessions (
                     session_id VARCHAR2(50) PRIMARY KEY,
-                    start_timestamp TIMESTAMP,
-                    end_timestamp TIMESTAMP,
+                    start_timestamp TIMESTAMP WITH TIME ZONE,
+                    end_timestamp TIMESTAMP WITH TIME ZONE,
                     status VARCHAR2(20),
                     created_by VARCHAR2(30),
-                    last_updated TIMESTAMP,
+                    last_updated TIMESTAMP WITH TIME ZONE,
                     version NUMBER(10) DEFAULT 1
                 )
             """,
@@ -203,8 +204,14 @@ class OracleConnector:
             """,
             # Índices para otimização de consultas
             'indices': [
-                """CREATE INDEX idx_sensor_session_time
-                   ON sensor_data(session_id, timestamp)""",
+                """CREATE INDEX idx_sensor_session_ts_type
+                   ON sensor_data(session_id, timestamp, sensor_type)
+                   COMPRESS 1""",
+                """CREATE INDEX idx_sensor_session_type_time
+                   ON sensor_data(session_id, sensor_type, timestamp DESC)""",
+                """CREATE INDEX idx_sessions_active
+                   ON sessions(CASE WHEN status = 'active'
+                               THEN start_timestamp END)""",
                 """CREATE INDEX idx_emissions_session_cat
                    ON ghg_emissions(session_id, category)""",
                 """CREATE INDEX idx_carbon_session_type
@@ -252,7 +259,8 @@ class OracleConnector:
                 increment=self.increment,
                 threaded=True,
                 timeout=self.timeout,
-                getmode=cx_Oracle.SPOOL_ATTRVAL_WAIT
+                getmode=cx_Oracle.SPOOL_ATTRVAL_WAIT,
+                stmtcachesize=self.stmtcachesize
             )
 
             # Testa pool com uma conexão
@@ -291,6 +299,10 @@ class OracleConnector:
         """
         if self.simulated_mode:
             # Em modo simulado, retorna um objeto fictício
+            class DummyVariable:
+                def getvalue(self, pos=0):
+                    return [1]
+
             class DummyCursor:
                 def __init__(self):
                     # Simula descrição de coluna Oracle (7-tuple por coluna)
@@ -304,10 +316,30 @@ class OracleConnector:
                         ("status", None, None, None, None, None, None)
                     ]
                     self.rowcount = 1
+                    self.arraysize = 100
+                    self.prefetchrows = 2
 
                 def execute(self, *args, **kwargs):
                     pass
 
+                def executemany(self, *args, **kwargs):
+                    pass
+
+                def prepare(self, *args, **kwargs):
+                    pass
+
+                def setinputsizes(self, *args, **kwargs):
+                    pass
+
+                def getbatcherrors(self):
+                    return []
+
+                def getarraydmlrowcounts(self):
+                    return []
+
+                def var(self, *args, **kwargs):
+                    return DummyVariable()
+
                 def fetchone(self):
                     return [1, "dummy_session", "2025-04-21 00:00:00",
                         None, "active"]
@@ -316,6 +348,12 @@ class OracleConnector:
                     return [[1, "dummy_session", "2025-04-21 00:00:00",
                             None, "active"]]
 
+                def fetchmany(self, *args, **kwargs):
+                    return []
+
+                def __iter__(self):
+                    return iter(self.fetchall())
+
                 def close(self):
                     pass
 
@@ -335,6 +373,21 @@ class OracleConnector:
             yield DummyConnection()
             return
 
+        # Inicialização tardia: cria o pool no primeiro uso, se necessário
+        if self.pool is None and not self.initialize():
+            raise RuntimeError("Pool de conexões não inicializado")
+
+        # Conexão emprestada do pool: evita autenticação a cada chamada e
+        # é sempre devolvida, mesmo em caso de erro
+        conn = self.pool.acquire()
+        try:
+            yield conn
+        except cx_Oracle.Error:
+            conn.rollback()
+            raise
+        finally:
+            self.pool.release(conn)
+
 
     def shutdown(self) -> bool:
         """
@@ -13,7 +13,7 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, List
 
-import cx_Oracle
+import oracledb as cx_Oracle
 
 from persistence.oracle.connector import OracleConnector
 from persistence.oracle.error_handler import with_error_handling, with_retry
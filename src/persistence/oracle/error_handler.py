@@ -10,13 +10,35 @@ especialmente no contexto de monitoramento de perdas na colheita.
 """
 
 import logging
-import cx_Oracle
+import random
+import time
+import oracledb as cx_Oracle
 from typing import Dict, Any, Optional, Callable, Union
 
 # Configuração de logging
 logger = logging.getLogger(__name__)
 
 
+class OptimisticLockConflict(Exception):
+    """
+    Indica que um registro foi alterado por outro escritor.
+
+    Lançada quando a versão esperada pelo chamador não é mais a atual,
+    permitindo nova tentativa com releitura (ver with_optimistic_retry).
+    """
+
+    def __init__(self, message: str, current_version: Optional[int] = None):
+        """
+        Inicializa conflito com a versão encontrada no banco.
+
+        Args:
+            message: Descrição do conflito
+            current_version: Versão atual do registro, se conhecida
+        """
+        super().__init__(message)
+        self.current_version = current_version
+
+
 class OracleError:
     """
     Representa um erro Oracle classificado para tratamento apropriado.
@@ -468,6 +490,9 @@ def with_error_handling(func: Callable) -> Callable:
         handler = ErrorHandler()
         try:
             return func(*args, **kwargs)
+        except OptimisticLockConflict:
+            # Conflitos sobem intactos para permitir nova tentativa
+            raise
         except cx_Oracle.Error as e:
             context = {
                 "function": func.__name__,
@@ -501,8 +526,6 @@ def with_retry(retry_policy: Optional[RetryPolicy] = None) -> Callable:
 
     def decorator(func: Callable) -> Callable:
         def wrapper(*args, **kwargs):
-            import time
-
             attempt = 0
             last_error = None
 
@@ -525,6 +548,9 @@ def with_retry(retry_policy: Optional[RetryPolicy] = None) -> Callable:
                         time.sleep(delay)
                     else:
                         break
+                except OptimisticLockConflict:
+                    # Tratado por with_optimistic_retry no nível do chamador
+                    raise
                 except Exception as e:
                     # Não faz retry para erros não-Oracle
                     logger.error(f"Erro não-Oracle: {str(e)}", exc_info=True)
@@ -545,3 +571,43 @@ def with_retry(retry_policy: Optional[RetryPolicy] = None) -> Callable:
         return wrapper
 
     return decorator
+
+
+def with_optimistic_retry(max_depth: int = 5, base_delay: float = 0.05,
+                          jitter: float = 0.25) -> Callable:
+    """
+    Decorador para repetir operações em conflito de concorrência otimista.
+
+    Destina-se a funções de leitura-modificação-escrita que releem a versão
+    do registro a cada execução. A espera cresce exponencialmente
+    (base_delay * 2^tentativa) com variação aleatória de ±jitter, evitando
+    que escritores concorrentes colidam repetidamente.
+
+    Args:
+        max_depth: Número máximo de novas tentativas
+        base_delay: Atraso inicial entre tentativas (segundos)
+        jitter: Variação relativa aplicada ao atraso
+
+    Returns:
+        Callable: Decorador configurado
+    """
+    def decorator(func: Callable) -> Callable:
+        def wrapper(*args, **kwargs):
+            for depth in range(max_depth + 1):
+                try:
+                    return func(*args, **kwargs)
+                except OptimisticLockConflict as e:
+                    if depth == max_depth:
+                        raise
+
+                    delay = base_delay * (2 ** depth)
+                    delay *= random.uniform(1 - jitter, 1 + jitter)
+                    logger.info(
+                        f"Conflito de concorrência em {func.__name__} "
+                        f"(tentativa {depth + 1}), repetindo em {delay:.3f}s: {e}"
+                    )
+                    time.sleep(delay)
+
+        return wrapper
+
+    return decorator
@@ -14,7 +14,7 @@ import json
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 
-import cx_Oracle
+import oracledb as cx_Oracle
 
 from persistence.oracle.connector import OracleConnector
 from persistence.oracle.error_handler import with_error_handling, with_retry
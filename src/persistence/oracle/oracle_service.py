@@ -14,15 +14,60 @@ import logging
 import os
 import json
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
-from typing import Dict, Any, List, Optional, Union
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Union
 
-import cx_Oracle
+import oracledb as cx_Oracle
+
+# orjson é opcional; sem ele, usa o parser da biblioteca padrão
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 # Configuração de logging
 logger = logging.getLogger(__name__)
 
+# Limite de categorias exportadas em paralelo
+MAX_EXPORT_WORKERS = 5
+
+# Caracteres removidos de strings numéricas (tudo exceto dígitos, ponto e sinal)
+_NON_NUMERIC_RE = re.compile(r'[^\d.-]')
+
+
+def _utc_now() -> datetime:
+    """
+    Retorna o instante atual em UTC, sem fuso anexado.
+
+    Mesma convenção de SessionDAO: o bind leva a hora UTC "ingênua" e o SQL
+    a marca com FROM_TZ(..., 'UTC') ao gravar em sessions.
+
+    Returns:
+        datetime: Hora UTC atual
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@lru_cache(maxsize=128)
+def _session_file_matcher(session_id: str):
+    """
+    Compila o padrão dos arquivos JSON de uma sessão ("<session_id>-*.json").
+
+    Args:
+        session_id: Identificador da sessão
+
+    Returns:
+        Callable: Método match do padrão compilado
+    """
+    return re.compile(rf'{re.escape(session_id)}-.*\.json\Z', re.DOTALL).match
+
+
 class OracleService:
     """
     Gerencia operações de persistência no Oracle para dados de colheita.
@@ -31,17 +76,33 @@ class OracleService:
     no banco Oracle com validação adequada e tratamento de erros.
     """
 
+    # Categorias exportadas: (diretório, método de persistência,
+    # contador em results["counts"], descrição usada nos erros)
+    EXPORT_SPECS = (
+        ("sensor_data", "save_sensor_data", "sensor_data", "dados de sensores"),
+        ("analysis", "save_analysis_data", "analysis", "dados de análise"),
+        ("ghg_inventory", "save_emission_data", "emissions", "dados de emissões"),
+        ("carbon_stocks", "save_carbon_stock_data", "carbon_stocks",
+         "dados de estoque"),
+    )
+
     def __init__(self, config: Dict[str, Any] = None):
         """
         Inicializa o serviço Oracle com configurações fornecidas.
 
         Args:
             config: Configurações de conexão Oracle e comportamento
+
+        Raises:
+            ValueError: Se batch_size não for um inteiro positivo
         """
         self.config = config or {}
-        self.connection = None
+        self.pool = None
         self.initialized = False
 
+        # Sessões já presentes no Oracle, para evitar consultas repetidas
+        self._registered_sessions = set()
+
         # Configurações de conexão
         self.host = self.config.get('host', 'localhost')
         self.port = self.config.get('port', 1521)
@@ -49,6 +110,24 @@ class OracleService:
         self.username = self.config.get('username', 'system')
         self.password = self.config.get('password', 'oracle')
 
+        # Tamanho da unidade de dados da sessão (SDU), em bytes
+        self.sdu = self.config.get('sdu', 65535)
+
+        # Configurações do pool de sessões
+        self.pool_min = self.config.get('pool_min', 2)
+        self.pool_max = self.config.get('pool_max', 16)
+        self.pool_increment = self.config.get('pool_increment', 1)
+        self.stmtcachesize = self.config.get('stmtcachesize', 200)
+
+        # Linhas por chamada de executemany (limita o array de binds)
+        self.batch_size = self.config.get('batch_size', 10000)
+        if not isinstance(self.batch_size, int) or self.batch_size < 1:
+            raise ValueError("batch_size deve ser um inteiro positivo")
+
+        # Categorias exportadas em paralelo, cada uma com conexão do pool
+        self.export_workers = min(self.config.get('export_workers', 4),
+                                  MAX_EXPORT_WORKERS)
+
         # Modo simulado para desenvolvimento/testes
         self.simulated_mode = self.config.get('simulated_mode', False)
 
@@ -62,7 +141,8 @@ class OracleService:
 
     def initialize(self) -> bool:
         """
-        Inicializa o serviço Oracle, estabelecendo conexão e criando tabelas.
+        Inicializa o serviço Oracle, criando o pool de sessões compartilhado
+        pelas operações de persistência.
 
         Returns:
             bool: True se inicialização for bem-sucedida, False caso contrário
@@ -77,23 +157,33 @@ class OracleService:
 
         try:
             # Constrói string de conexão
-            dsn = cx_Oracle.makedsn(
-                self.host,
-                self.port,
-                service_name=self.service_name
+            # Descritor explícito para definir o SDU (makedsn usa o padrão de
+            # 8 KB); o listener deve aceitar o mesmo valor no sqlnet.ora
+            dsn = (
+                f"(DESCRIPTION=(SDU={self.sdu})"
+                f"(ADDRESS=(PROTOCOL=TCP)(HOST={self.host})(PORT={self.port}))"
+                f"(CONNECT_DATA=(SERVICE_NAME={self.service_name})))"
             )
 
-            # Estabelece conexão
-            self.connection = cx_Oracle.connect(
+            # Cria pool de sessões reutilizado entre operações
+            self.pool = cx_Oracle.SessionPool(
                 user=self.username,
                 password=self.password,
-                dsn=dsn
+                dsn=dsn,
+                min=self.pool_min,
+                max=self.pool_max,
+                increment=self.pool_increment,
+                threaded=True,
+                events=False,
+                getmode=cx_Oracle.SPOOL_ATTRVAL_WAIT,
+                stmtcachesize=self.stmtcachesize
             )
 
-            # Testa a conexão
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT 1 FROM DUAL")
-            cursor.close()
+            # Testa uma conexão do pool
+            with self._acquire_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT 1 FROM DUAL")
+                cursor.close()
 
             self.initialized = True
             logger.info("Serviço Oracle inicializado com sucesso")
@@ -101,7 +191,7 @@ class OracleService:
 
         except cx_Oracle.Error as e:
             error_obj, = e.args
-            logger.error(f"Erro ao inicializar Oracle: {error_obj.message}")
+            logger.error("Erro ao inicializar Oracle: %s", error_obj.message)
             return False
 
     def get_connection_info(self) -> Dict[str, str]:
@@ -111,7 +201,7 @@ class OracleService:
         Returns:
             Dict: Informações da conexão Oracle
         """
-        if self.simulated_mode or not self.connection:
+        if self.simulated_mode or not self.pool:
             return {
                 "version": "Oracle Database Simulado",
                 "instance": "SIMULATED",
@@ -119,19 +209,20 @@ class OracleService:
             }
 
         try:
-            cursor = self.connection.cursor()
+            with self._acquire_connection() as conn:
+                cursor = conn.cursor()
 
-            # Versão do banco
-            cursor.execute("""
-                SELECT banner FROM v$version WHERE banner LIKE 'Oracle%'
-            """)
-            version = cursor.fetchone()[0]
+                # Versão do banco
+                cursor.execute("""
+                    SELECT banner FROM v$version WHERE banner LIKE 'Oracle%'
+                """)
+                version = cursor.fetchone()[0]
 
-            # Nome da instância
-            cursor.execute("SELECT instance_name FROM v$instance")
-            instance = cursor.fetchone()[0]
+                # Nome da instância
+                cursor.execute("SELECT instance_name FROM v$instance")
+                instance = cursor.fetchone()[0]
 
-            cursor.close()
+                cursor.close()
 
             return {
                 "version": version,
@@ -141,7 +232,7 @@ class OracleService:
 
         except cx_Oracle.Error as e:
             error_obj, = e.args
-            logger.error(f"Erro ao obter informações da conexão: {error_obj.message}")
+            logger.error("Erro ao obter informações da conexão: %s", error_obj.message)
             return {
                 "version": "Desconhecida",
                 "instance": "Desconhecida",
@@ -159,14 +250,15 @@ class OracleService:
         if self.simulated_mode:
             return True
 
-        if not self.connection:
+        if not self.pool:
             return False
 
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT 1 FROM DUAL")
-            result = cursor.fetchone()
-            cursor.close()
+            with self._acquire_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT 1 FROM DUAL")
+                result = cursor.fetchone()
+                cursor.close()
             return result[0] == 1
         except cx_Oracle.Error:
             return False
@@ -175,63 +267,89 @@ class OracleService:
         """
         Registra uma sessão de colheita no Oracle.
 
+        Sessões já registradas por este serviço são reconhecidas sem nova
+        consulta ao banco.
+
         Args:
             session_id: Identificador único da sessão
 
         Returns:
-            bool: True se operação bem-sucedida, False caso contrário
+            bool: True se a sessão foi registrada agora, False se já existia
+                ou em caso de erro
         """
         if not self.initialized and not self.initialize():
             return False
 
         if self.simulated_mode:
-            logger.info(f"Registrando sessão {session_id} no Oracle (simulado)")
+            logger.info("Registrando sessão %s no Oracle (simulado)", session_id)
             return True
 
-        try:
-            cursor = self.connection.cursor()
+        if session_id in self._registered_sessions:
+            logger.debug("Sessão %s já registrada (cache)", session_id)
+            return False
 
-            # Verifica se sessão já existe
-            cursor.execute(
-                "SELECT COUNT(*) FROM sessions WHERE session_id = :session_id",
-                session_id=session_id
-            )
+        try:
+            with self._acquire_connection() as conn:
+                cursor = conn.cursor()
 
-            if cursor.fetchone()[0] > 0:
-                logger.warning(f"Sessão {session_id} já pode estar registrada")
-                cursor.close()
-                return False
+                # Verifica se sessão já existe
+                cursor.execute(
+                    "SELECT COUNT(*) FROM sessions WHERE session_id = :session_id",
+                    session_id=session_id
+                )
 
-            # Insere nova sessão
-            cursor.execute("""
-                INSERT INTO sessions (
-                    session_id, start_timestamp, status, created_by, last_updated, version
-                ) VALUES (
-                    :session_id, :start_timestamp, :status, :created_by,
-                    :last_updated, 1
+                if cursor.fetchone()[0] > 0:
+                    logger.warning("Sessão %s já pode estar registrada", session_id)
+                    cursor.close()
+                    self._registered_sessions.add(session_id)
+                    return False
+
+                # Insere nova sessão, com horários em UTC
+                now = _utc_now()
+                cursor.execute("""
+                    INSERT INTO sessions (
+                        session_id, start_timestamp, status, created_by, last_updated, version
+                    ) VALUES (
+                        :session_id,
+                        FROM_TZ(CAST(:start_timestamp AS TIMESTAMP), 'UTC'),
+                        :status, :created_by,
+                        FROM_TZ(CAST(:last_updated AS TIMESTAMP), 'UTC'), 1
+                    )
+                """,
+                    session_id=session_id,
+                    start_timestamp=now,
+                    status='active',
+                    created_by='system',
+                    last_updated=now
                 )
-            """,
-                session_id=session_id,
-                start_timestamp=datetime.now(),
-                status='active',
-                created_by='system',
-                last_updated=datetime.now()
-            )
 
-            self.connection.commit()
-            cursor.close()
+                conn.commit()
+                cursor.close()
 
-            logger.info(f"Sessão {session_id} registrada com sucesso")
+            self._registered_sessions.add(session_id)
+            logger.info("Sessão %s registrada com sucesso", session_id)
             return True
 
         except cx_Oracle.Error as e:
             error_obj, = e.args
-            logger.error(f"Erro ao iniciar sessão: {error_obj.message}")
+            logger.error("Erro ao iniciar sessão: %s", error_obj.message)
             if hasattr(error_obj, 'code'):
-                logger.error(f"Help: https://docs.oracle.com/error-help/db/ora-{error_obj.code:05d}/")
-            self.connection.rollback()
+                logger.error("Help: https://docs.oracle.com/error-help/db/ora-%05d/",
+                             error_obj.code)
             return False
 
+    def invalidate_session_cache(self, session_id: Optional[str] = None) -> None:
+        """
+        Remove sessões do cache de sessões registradas.
+
+        Args:
+            session_id: Sessão a remover; se None, limpa todo o cache
+        """
+        if session_id is None:
+            self._registered_sessions.clear()
+        else:
+            self._registered_sessions.discard(session_id)
+
     def save_sensor_data(self, session_id: str, filepath: str) -> bool:
         """
         Salva dados de sensores no Oracle a partir de um arquivo JSON.
@@ -248,19 +366,19 @@ class OracleService:
 
         try:
             # Carrega dados do arquivo
-            with open(filepath, 'r') as f:
-                file_data = json.load(f)
+            file_data = _loads(Path(filepath).read_bytes())
 
             # Verifica se estrutura é válida
             if 'data' not in file_data:
-                logger.warning(f"Estrutura de dados inválida no arquivo: {filepath}")
+                logger.warning("Estrutura de dados inválida no arquivo: %s", filepath)
                 return False
 
             sensor_data = file_data['data']
             timestamp = self._parse_timestamp(file_data.get('timestamp'))
 
             if self.simulated_mode:
-                logger.info(f"Dados de sensores salvos: {os.path.basename(filepath)} (simulado)")
+                logger.info("Dados de sensores salvos: %s (simulado)",
+                            os.path.basename(filepath))
                 return True
 
             # Processa dados para o Oracle
@@ -289,60 +407,61 @@ class OracleService:
                 try:
                     validated_value = self._validate_number(sensor_value)
 
-                    processed_data.append({
-                        'session_id': session_id,
-                        'timestamp': sensor_timestamp,
-                        'sensor_type': self._validate_string(sensor_name, 30),
-                        'sensor_value': validated_value,
-                        'unit': self._validate_string(sensor_unit, 10),
-                        'quality_flag': 'GOOD'
-                    })
+                    processed_data.append((
+                        session_id,
+                        sensor_timestamp,
+                        self._validate_string(sensor_name, 30),
+                        validated_value,
+                        self._validate_string(sensor_unit, 10),
+                        'GOOD'
+                    ))
                 except (ValueError, TypeError, InvalidOperation) as e:
-                    logger.warning(
-                        f"Valor inválido para sensor {sensor_name}: {sensor_value}. "
-                        f"Erro: {str(e)}"
-                    )
+                    logger.warning("Valor inválido para sensor %s: %s. Erro: %s",
+                                   sensor_name, sensor_value, e)
                     # Continua processando outros sensores
 
             # Se não houver dados válidos após processamento
             if not processed_data:
-                logger.warning(f"Nenhum dado válido para salvar em: {filepath}")
+                logger.warning("Nenhum dado válido para salvar em: %s", filepath)
                 return False
 
-            # Salva dados no Oracle
-            cursor = self.connection.cursor()
-
             # Prepara SQL
             sql = """
                 INSERT INTO sensor_data (
                     session_id, timestamp, sensor_type,
                     sensor_value, unit, quality_flag
                 ) VALUES (
-                    :session_id, :timestamp, :sensor_type,
-                    :sensor_value, :unit, :quality_flag
+                    :1, :2, :3, :4, :5, :6
                 )
             """
 
-            # Executa inserção em lote
-            cursor.executemany(sql, processed_data)
+            # Salva dados no Oracle
+            with self._acquire_connection() as conn:
+                cursor = conn.cursor()
+
+                # Executa inserção em lote
+                saved = self._execute_batch(cursor, sql, processed_data)
 
-            self.connection.commit()
-            cursor.close()
+                conn.commit()
+                cursor.close()
+
+            if not saved:
+                logger.warning("Nenhum dado de sensor aceito pelo Oracle: %s", filepath)
+                return False
 
-            logger.info(f"Dados de sensores salvos: {os.path.basename(filepath)}")
+            logger.info("Dados de sensores salvos: %s", os.path.basename(filepath))
             return True
 
         except (json.JSONDecodeError, IOError) as e:
-            logger.error(f"Erro ao ler arquivo {filepath}: {str(e)}")
+            logger.error("Erro ao ler arquivo %s: %s", filepath, e)
             return False
         except cx_Oracle.Error as e:
             error_obj, = e.args
-            logger.error(f"Erro ao salvar dados de sensores: {error_obj.message}")
+            logger.error("Erro ao salvar dados de sensores: %s", error_obj.message)
             if hasattr(error_obj, 'code'):
-                logger.error(f"Help: https://docs.oracle.com/error-help/db/ora-{error_obj.code:05d}/")
-            logger.warning(f"Falha ao salvar dados: {os.path.basename(filepath)}")
-            if self.connection:
-                self.connection.rollback()
+                logger.error("Help: https://docs.oracle.com/error-help/db/ora-%05d/",
+                             error_obj.code)
+            logger.warning("Falha ao salvar dados: %s", os.path.basename(filepath))
             return False
 
     def save_analysis_data(self, session_id: str, filepath: str) -> bool:
@@ -361,19 +480,19 @@ class OracleService:
 
         try:
             # Carrega dados do arquivo
-            with open(filepath, 'r') as f:
-                file_data = json.load(f)
+            file_data = _loads(Path(filepath).read_bytes())
 
             # Verifica se estrutura é válida
             if 'analysis' not in file_data:
-                logger.warning(f"Estrutura de análise inválida no arquivo: {filepath}")
+                logger.warning("Estrutura de análise inválida no arquivo: %s", filepath)
                 return False
 
             analysis_data = file_data['analysis']
             timestamp = self._parse_timestamp(file_data.get('timestamp'))
 
             if self.simulated_mode:
-                logger.info(f"Dados de análise salvos: {os.path.basename(filepath)} (simulado)")
+                logger.info("Dados de análise salvos: %s (simulado)",
+                            os.path.basename(filepath))
                 return True
 
             # Extrai dados relevantes para Oracle
@@ -394,9 +513,6 @@ class OracleService:
                 10
             )
 
-            # Salva dados no Oracle
-            cursor = self.connection.cursor()
-
             # Prepara SQL
             sql = """
                 INSERT INTO harvest_losses (
@@ -408,32 +524,34 @@ class OracleService:
                 )
             """
 
-            cursor.execute(
-                sql,
-                session_id=session_id,
-                timestamp=timestamp,
-                loss_percent=loss_estimate,
-                factors=factors_json,
-                confidence_level=loss_category,
-                field_conditions=None  # Não disponível nos dados analisados
-            )
+            # Salva dados no Oracle
+            with self._acquire_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    sql,
+                    session_id=session_id,
+                    timestamp=timestamp,
+                    loss_percent=loss_estimate,
+                    factors=factors_json,
+                    confidence_level=loss_category,
+                    field_conditions=None  # Não disponível nos dados analisados
+                )
 
-            self.connection.commit()
-            cursor.close()
+                conn.commit()
+                cursor.close()
 
-            logger.info(f"Dados de análise salvos: {os.path.basename(filepath)}")
+            logger.info("Dados de análise salvos: %s", os.path.basename(filepath))
             return True
 
         except (json.JSONDecodeError, IOError) as e:
-            logger.error(f"Erro ao ler arquivo {filepath}: {str(e)}")
+            logger.error("Erro ao ler arquivo %s: %s", filepath, e)
             return False
         except cx_Oracle.Error as e:
             error_obj, = e.args
-            logger.error(f"Erro ao salvar dados de análise: {error_obj.message}")
+            logger.error("Erro ao salvar dados de análise: %s", error_obj.message)
             if hasattr(error_obj, 'code'):
-                logger.error(f"Help: https://docs.oracle.com/error-help/db/ora-{error_obj.code:05d}/")
-            if self.connection:
-                self.connection.rollback()
+                logger.error("Help: https://docs.oracle.com/error-help/db/ora-%05d/",
+                             error_obj.code)
             return False
 
     def save_emission_data(self, session_id: str, filepath: str) -> bool:
@@ -452,19 +570,20 @@ class OracleService:
 
         try:
             # Carrega dados do arquivo
-            with open(filepath, 'r') as f:
-                file_data = json.load(f)
+            file_data = _loads(Path(filepath).read_bytes())
 
             # Verifica se estrutura é válida
             if 'inventory' not in file_data:
-                logger.warning(f"Estrutura de emissões inválida no arquivo: {filepath}")
+                logger.warning("Estrutura de emissões inválida no arquivo: %s",
+                               filepath)
                 return False
 
             emissions_data = file_data['inventory']
             timestamp = self._parse_timestamp(file_data.get('timestamp'))
 
             if self.simulated_mode:
-                logger.info(f"Dados de emissões salvos: {os.path.basename(filepath)} (simulado)")
+                logger.info("Dados de emissões salvos: %s (simulado)",
+                            os.path.basename(filepath))
                 return True
 
             # Processa dados para o Oracle
@@ -491,22 +610,22 @@ class OracleService:
                             for gas, value in source_data.items():
                                 if gas in ['CO2', 'CH4', 'N2O', 'CO2e']:
                                     try:
-                                        processed_emissions.append({
-                                            'session_id': session_id,
-                                            'timestamp': timestamp,
-                                            'scope': scope_num,
-                                            'category': self._validate_string(category, 30),
-                                            'source': self._validate_string(source, 50),
-                                            'gas': gas,
-                                            'value': self._validate_number(value),
-                                            'unit': 'kg',
-                                            'calculation_method': 'tier1',
-                                            'uncertainty_percent': 10.0
-                                        })
+                                        processed_emissions.append((
+                                            session_id,
+                                            timestamp,
+                                            scope_num,
+                                            self._validate_string(category, 30),
+                                            self._validate_string(source, 50),
+                                            gas,
+                                            self._validate_number(value),
+                                            'kg',
+                                            'tier1',
+                                            10.0
+                                        ))
                                     except (ValueError, TypeError) as e:
                                         logger.warning(
-                                            f"Valor inválido para emissão {gas} em {source}: {value}. "
-                                            f"Erro: {str(e)}"
+                                            "Valor inválido para emissão %s em %s: %s. Erro: %s",
+                                            gas, source, value, e
                                         )
                 else:
                     # Escopos 2 e 3 são mais simples
@@ -514,62 +633,66 @@ class OracleService:
                         for gas, value in source_data.items():
                             if gas in ['CO2', 'CH4', 'N2O', 'CO2e']:
                                 try:
-                                    processed_emissions.append({
-                                        'session_id': session_id,
-                                        'timestamp': timestamp,
-                                        'scope': scope_num,
-                                        'category': '',  # Não tem categoria
-                                        'source': self._validate_string(source, 50),
-                                        'gas': gas,
-                                        'value': self._validate_number(value),
-                                        'unit': 'kg',
-                                        'calculation_method': 'tier1',
-                                        'uncertainty_percent': 10.0
-                                    })
+                                    processed_emissions.append((
+                                        session_id,
+                                        timestamp,
+                                        scope_num,
+                                        '',  # Não tem categoria
+                                        self._validate_string(source, 50),
+                                        gas,
+                                        self._validate_number(value),
+                                        'kg',
+                                        'tier1',
+                                        10.0
+                                    ))
                                 except (ValueError, TypeError) as e:
                                     logger.warning(
-                                        f"Valor inválido para emissão {gas} em {source}: {value}. "
-                                        f"Erro: {str(e)}"
+                                        "Valor inválido para emissão %s em %s: %s. Erro: %s",
+                                        gas, source, value, e
                                     )
 
             # Se não houver dados válidos após processamento
             if not processed_emissions:
-                logger.warning(f"Nenhum dado de emissão válido para salvar em: {filepath}")
+                logger.warning("Nenhum dado de emissão válido para salvar em: %s",
+                               filepath)
                 return False
 
-            # Salva dados no Oracle
-            cursor = self.connection.cursor()
-
             # Prepara SQL
             sql = """
                 INSERT INTO ghg_emissions (
                     session_id, timestamp, scope, category, source,
                     gas, value, unit, calculation_method, uncertainty_percent
                 ) VALUES (
-                    :session_id, :timestamp, :scope, :category, :source,
-                    :gas, :value, :unit, :calculation_method, :uncertainty_percent
+                    :1, :2, :3, :4, :5, :6, :7, :8, :9, :10
                 )
             """
 
-            # Executa inserção em lote
-            cursor.executemany(sql, processed_emissions)
+            # Salva dados no Oracle
+            with self._acquire_connection() as conn:
+                cursor = conn.cursor()
+
+                # Executa inserção em lote
+                saved = self._execute_batch(cursor, sql, processed_emissions)
+
+                conn.commit()
+                cursor.close()
 
-            self.connection.commit()
-            cursor.close()
+            if not saved:
+                logger.warning("Nenhuma emissão aceita pelo Oracle: %s", filepath)
+                return False
 
-            logger.info(f"Dados de emissões salvos: {os.path.basename(filepath)}")
+            logger.info("Dados de emissões salvos: %s", os.path.basename(filepath))
             return True
 
         except (json.JSONDecodeError, IOError) as e:
-            logger.error(f"Erro ao ler arquivo {filepath}: {str(e)}")
+            logger.error("Erro ao ler arquivo %s: %s", filepath, e)
             return False
         except cx_Oracle.Error as e:
             error_obj, = e.args
-            logger.error(f"Erro ao salvar dados de emissões: {error_obj.message}")
+            logger.error("Erro ao salvar dados de emissões: %s", error_obj.message)
             if hasattr(error_obj, 'code'):
-                logger.error(f"Help: https://docs.oracle.com/error-help/db/ora-{error_obj.code:05d}/")
-            if self.connection:
-                self.connection.rollback()
+                logger.error("Help: https://docs.oracle.com/error-help/db/ora-%05d/",
+                             error_obj.code)
             return False
 
     def save_carbon_stock_data(self, session_id: str, filepath: str) -> bool:
@@ -588,19 +711,19 @@ class OracleService:
 
         try:
             # Carrega dados do arquivo
-            with open(filepath, 'r') as f:
-                file_data = json.load(f)
+            file_data = _loads(Path(filepath).read_bytes())
 
             # Verifica se estrutura é válida
             if 'carbon_stocks' not in file_data:
-                logger.warning(f"Estrutura de estoque inválida no arquivo: {filepath}")
+                logger.warning("Estrutura de estoque inválida no arquivo: %s", filepath)
                 return False
 
             stock_data = file_data['carbon_stocks']
             timestamp = self._parse_timestamp(file_data.get('timestamp'))
 
             if self.simulated_mode:
-                logger.info(f"Dados de estoque salvos: {os.path.basename(filepath)} (simulado)")
+                logger.info("Dados de estoque salvos: %s (simulado)",
+                            os.path.basename(filepath))
                 return True
 
             # Processa dados para o Oracle
@@ -626,83 +749,132 @@ class OracleService:
                         30
                     )
 
-                    processed_stocks.append({
-                        'session_id': session_id,
-                        'timestamp': timestamp,
-                        'stock_type': stock_type,
-                        'change': change,
-                        'amortization_period': amort_period,
-                        'unit': 'kg CO2',
-                        'measurement_method': method
-                    })
+                    processed_stocks.append((
+                        session_id,
+                        timestamp,
+                        stock_type,
+                        change,
+                        amort_period,
+                        'kg CO2',
+                        method
+                    ))
                 except (ValueError, TypeError) as e:
-                    logger.warning(
-                        f"Valor inválido para estoque {stock_type}: {stock_info}. "
-                        f"Erro: {str(e)}"
-                    )
+                    logger.warning("Valor inválido para estoque %s: %s. Erro: %s",
+                                   stock_type, stock_info, e)
 
             # Se não houver dados válidos após processamento
             if not processed_stocks:
-                logger.warning(f"Nenhum dado de estoque válido para salvar em: {filepath}")
+                logger.warning("Nenhum dado de estoque válido para salvar em: %s",
+                               filepath)
                 return False
 
-            # Salva dados no Oracle
-            cursor = self.connection.cursor()
-
             # Prepara SQL
             sql = """
                 INSERT INTO carbon_stocks (
                     session_id, timestamp, stock_type, change,
                     amortization_period, unit, measurement_method
                 ) VALUES (
-                    :session_id, :timestamp, :stock_type, :change,
-                    :amortization_period, :unit, :measurement_method
+                    :1, :2, :3, :4, :5, :6, :7
                 )
             """
 
-            # Executa inserção em lote
-            cursor.executemany(sql, processed_stocks)
+            # Salva dados no Oracle
+            with self._acquire_connection() as conn:
+                cursor = conn.cursor()
+
+                # Executa inserção em lote
+                saved = self._execute_batch(cursor, sql, processed_stocks)
 
-            self.connection.commit()
-            cursor.close()
+                conn.commit()
+                cursor.close()
 
-            logger.info(f"Dados de estoque salvos: {os.path.basename(filepath)}")
+            if not saved:
+                logger.warning("Nenhum estoque aceito pelo Oracle: %s", filepath)
+                return False
+
+            logger.info("Dados de estoque salvos: %s", os.path.basename(filepath))
             return True
 
         except (json.JSONDecodeError, IOError) as e:
-            logger.error(f"Erro ao ler arquivo {filepath}: {str(e)}")
+            logger.error("Erro ao ler arquivo %s: %s", filepath, e)
             return False
         except cx_Oracle.Error as e:
             error_obj, = e.args
-            logger.error(f"Erro ao salvar dados de estoque: {error_obj.message}")
+            logger.error("Erro ao salvar dados de estoque: %s", error_obj.message)
             if hasattr(error_obj, 'code'):
-                logger.error(f"Help: https://docs.oracle.com/error-help/db/ora-{error_obj.code:05d}/")
-            if self.connection:
-                self.connection.rollback()
+                logger.error("Help: https://docs.oracle.com/error-help/db/ora-%05d/",
+                             error_obj.code)
             return False
 
     def close(self) -> bool:
         """
-        Fecha conexão com o banco Oracle.
+        Fecha o pool de conexões com o banco Oracle.
 
         Returns:
             bool: True se fechamento for bem-sucedido, False caso contrário
         """
-        if self.simulated_mode or not self.connection:
+        if self.simulated_mode or not self.pool:
             self.initialized = False
             return True
 
         try:
-            self.connection.close()
-            self.connection = None
+            self.pool.close()
+            self.pool = None
             self.initialized = False
-            logger.info("Conexão Oracle fechada com sucesso")
+            logger.info("Pool de conexões Oracle fechado com sucesso")
             return True
         except cx_Oracle.Error as e:
             error_obj, = e.args
-            logger.error(f"Erro ao fechar conexão Oracle: {error_obj.message}")
+            logger.error("Erro ao fechar conexão Oracle: %s", error_obj.message)
             return False
 
+    def _execute_batch(self, cursor, sql: str, rows: List[tuple]) -> int:
+        """
+        Executa inserção em lote, registrando falhas linha a linha.
+
+        Linhas rejeitadas pelo Oracle não invalidam o restante do lote. As
+        linhas são enviadas em blocos de batch_size para não exceder o
+        limite do array de binds (DPI-1015).
+
+        Args:
+            cursor: Cursor Oracle
+            sql: Comando SQL com binds posicionais
+            rows: Tuplas com os valores de cada linha
+
+        Returns:
+            int: Número de linhas aceitas
+        """
+        rejected = 0
+        for start in range(0, len(rows), self.batch_size):
+            cursor.executemany(sql, rows[start:start + self.batch_size],
+                               batcherrors=True)
+
+            for error in cursor.getbatcherrors():
+                logger.warning("Linha %s rejeitada: %s",
+                               start + error.offset, error.message)
+                rejected += 1
+
+        return len(rows) - rejected
+
+    @contextmanager
+    def _acquire_connection(self):
+        """
+        Obtém conexão do pool, devolvendo-a ao final do uso.
+
+        Transações pendentes são desfeitas em caso de erro Oracle.
+
+        Yields:
+            Connection: Conexão Oracle do pool
+        """
+        conn = self.pool.acquire()
+        try:
+            yield conn
+        except cx_Oracle.Error:
+            conn.rollback()
+            raise
+        finally:
+            self.pool.release(conn)
+
     def _parse_timestamp(self, timestamp_str: Optional[str]) -> datetime:
         """
         Converte string de timestamp para objeto datetime.
@@ -746,10 +918,14 @@ class OracleService:
         if isinstance(value, bool):
             raise ValueError("Valor booleano não pode ser convertido para número")
 
+        # Números nativos já convertem sem perda: dispensa o desvio por Decimal
+        if type(value) is float or type(value) is int:
+            return float(value)
+
         # Tentativa de conversão através de Decimal para maior precisão
         if isinstance(value, str):
             # Remove caracteres não numéricos exceto ponto e sinal
-            value = re.sub(r'[^\d.-]', '', value)
+            value = _NON_NUMERIC_RE.sub('', value)
 
         try:
             # Converte para Decimal e depois para float para evitar problemas de precisão
@@ -820,77 +996,109 @@ class OracleService:
             "errors": []
         }
 
-        # Registra sessão
-        session_registered = self.register_session(session_id)
-        if session_registered:
-            results["counts"]["sessions"] = 1
-
-        # Diretórios de dados
-        dirs = {
-            "sensor_data": os.path.join(data_path, "sensor_data"),
-            "analysis": os.path.join(data_path, "analysis"),
-            "ghg_inventory": os.path.join(data_path, "ghg_inventory"),
-            "carbon_stocks": os.path.join(data_path, "carbon_stocks")
-        }
-
-        # Exporta dados de sensores
-        if os.path.exists(dirs["sensor_data"]):
-            for filename in os.listdir(dirs["sensor_data"]):
-                if filename.startswith(f"{session_id}-") and filename.endswith('.json'):
-                    filepath = os.path.join(dirs["sensor_data"], filename)
-                    success = self.save_sensor_data(session_id, filepath)
-
-                    if success:
-                        results["counts"]["sensor_data"] += 1
-                    else:
-                        results["errors"].append(
-                            f"Falha ao salvar dados de sensores: {filename}"
-                        )
-
-        # Exporta dados de análise
-        if os.path.exists(dirs["analysis"]):
-            for filename in os.listdir(dirs["analysis"]):
-                if filename.startswith(f"{session_id}-") and filename.endswith('.json'):
-                    filepath = os.path.join(dirs["analysis"], filename)
-                    success = self.save_analysis_data(session_id, filepath)
-
-                    if success:
-                        results["counts"]["analysis"] += 1
-                    else:
-                        results["errors"].append(
-                            f"Falha ao salvar dados de análise: {filename}"
-                        )
-
-        # Exporta dados de emissões
-        if os.path.exists(dirs["ghg_inventory"]):
-            for filename in os.listdir(dirs["ghg_inventory"]):
-                if filename.startswith(f"{session_id}-") and filename.endswith('.json'):
-                    filepath = os.path.join(dirs["ghg_inventory"], filename)
-                    success = self.save_emission_data(session_id, filepath)
-
-                    if success:
-                        results["counts"]["emissions"] += 1
-                    else:
-                        results["errors"].append(
-                            f"Falha ao salvar dados de emissões: {filename}"
-                        )
-
-        # Exporta dados de estoque de carbono
-        if os.path.exists(dirs["carbon_stocks"]):
-            for filename in os.listdir(dirs["carbon_stocks"]):
-                if filename.startswith(f"{session_id}-") and filename.endswith('.json'):
-                    filepath = os.path.join(dirs["carbon_stocks"], filename)
-                    success = self.save_carbon_stock_data(session_id, filepath)
-
-                    if success:
-                        results["counts"]["carbon_stocks"] += 1
-                    else:
-                        results["errors"].append(
-                            f"Falha ao salvar dados de estoque: {filename}"
-                        )
+        # Padrão dos arquivos da sessão, compilado uma única vez
+        matcher = _session_file_matcher(session_id)
+
+        # Varre os diretórios em segundo plano enquanto a sessão é registrada
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            scan = executor.submit(self._scan_session_files, data_path, matcher)
+
+            session_registered = self.register_session(session_id)
+            if session_registered:
+                results["counts"]["sessions"] = 1
+
+            session_files = scan.result()
+
+        # Exporta as categorias em paralelo: as tabelas são independentes e
+        # cada save_* obtém sua própria conexão do pool
+        workers = max(1, min(self.export_workers, len(self.EXPORT_SPECS)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (count_key, executor.submit(
+                    self._export_files, session_files[dir_name], session_id,
+                    getattr(self, save_method), err_label
+                ))
+                for dir_name, save_method, count_key, err_label
+                in self.EXPORT_SPECS
+            ]
+
+            # Consolida no resumo a partir da thread principal
+            for count_key, future in futures:
+                saved, failed = future.result()
+                results["counts"][count_key] += saved
+                results["errors"].extend(failed)
 
         # Determina sucesso geral
         if results["errors"]:
             results["success"] = False
 
         return results
+
+    def _export_files(self, entries: List[os.DirEntry], session_id: str,
+                      save_fn, err_label: str) -> Tuple[int, List[str]]:
+        """
+        Exporta os arquivos de uma categoria de dados da sessão.
+
+        Args:
+            entries: Arquivos JSON da sessão na categoria
+            session_id: Identificador da sessão
+            save_fn: Método de persistência a aplicar em cada arquivo
+            err_label: Descrição dos dados usada nas mensagens de erro
+
+        Returns:
+            Tuple: Arquivos salvos e mensagens de erro das falhas
+        """
+        saved = 0
+        failed = []
+
+        for entry in entries:
+            if save_fn(session_id, entry.path):
+                saved += 1
+            else:
+                failed.append(f"Falha ao salvar {err_label}: {entry.name}")
+
+        return saved, failed
+
+    def _scan_session_files(self, data_path: str,
+                            matcher) -> Dict[str, List[os.DirEntry]]:
+        """
+        Lista os arquivos da sessão em todos os diretórios de exportação.
+
+        Args:
+            data_path: Caminho base para os diretórios de dados
+            matcher: Função que reconhece os nomes de arquivo da sessão
+
+        Returns:
+            Dict: Arquivos encontrados, por nome de diretório
+        """
+        return {
+            dir_name: list(self._iter_session_files(
+                os.path.join(data_path, dir_name), matcher
+            ))
+            for dir_name, _, _, _ in self.EXPORT_SPECS
+        }
+
+    @staticmethod
+    def _iter_session_files(dir_path: str, matcher):
+        """
+        Percorre os arquivos JSON de uma sessão em um diretório.
+
+        Diretórios ausentes são tratados como vazios, sem consulta prévia
+        ao sistema de arquivos.
+
+        Args:
+            dir_path: Diretório a percorrer
+            matcher: Função que reconhece os nomes de arquivo da sessão
+
+        Yields:
+            os.DirEntry: Entrada de cada arquivo da sessão
+        """
+        try:
+            entries = os.scandir(dir_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return
+
+        with entries:
+            for entry in entries:
+                if matcher(entry.name):
+                    yield entry
@@ -14,7 +14,7 @@ import os
 import sys
 import logging
 import argparse
-import cx_Oracle
+import oracledb as cx_Oracle
 
 # Configuração de logging
 logging.basicConfig(
@@ -32,6 +32,164 @@ class SchemaInitializer:
     de cana-de-açúcar.
     """
 
+    # Tabelas do esquema (nome, DDL), em ordem segura para as chaves
+    # estrangeiras
+    TABLE_SPECS = (
+        ('sessions', """
+            CREATE TABLE sessions (
+                session_id VARCHAR2(50) PRIMARY KEY,
+                start_timestamp TIMESTAMP WITH TIME ZONE,
+                end_timestamp TIMESTAMP WITH TIME ZONE,
+                status VARCHAR2(20),
+                created_by VARCHAR2(30),
+                last_updated TIMESTAMP WITH TIME ZONE,
+                version NUMBER(10) DEFAULT 1
+            )
+        """),
+        ('sensor_data', """
+            CREATE TABLE sensor_data (
+                id NUMBER GENERATED ALWAYS AS IDENTITY,
+                session_id VARCHAR2(50),
+                timestamp TIMESTAMP,
+                sensor_type VARCHAR2(30),
+                sensor_value NUMBER(10,2),
+                unit VARCHAR2(10),
+                quality_flag VARCHAR2(10),
+                PRIMARY KEY (id),
+                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+            )
+        """),
+        ('ghg_emissions', """
+            CREATE TABLE ghg_emissions (
+                id NUMBER GENERATED ALWAYS AS IDENTITY,
+                session_id VARCHAR2(50),
+                timestamp TIMESTAMP,
+                scope NUMBER(1),
+                category VARCHAR2(30),
+                source VARCHAR2(50),
+                gas VARCHAR2(10),
+                value NUMBER(10,2),
+                unit VARCHAR2(10),
+                calculation_method VARCHAR2(20),
+                uncertainty_percent NUMBER(5,2),
+                PRIMARY KEY (id),
+                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+            )
+        """),
+        ('carbon_stocks', """
+            CREATE TABLE carbon_stocks (
+                id NUMBER GENERATED ALWAYS AS IDENTITY,
+                session_id VARCHAR2(50),
+                timestamp TIMESTAMP,
+                stock_type VARCHAR2(30),
+                change NUMBER(10,2),
+                amortization_period NUMBER(3),
+                unit VARCHAR2(10),
+                measurement_method VARCHAR2(30),
+                PRIMARY KEY (id),
+                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+            )
+        """),
+        ('harvest_losses', """
+            CREATE TABLE harvest_losses (
+                id NUMBER GENERATED ALWAYS AS IDENTITY,
+                session_id VARCHAR2(50),
+                timestamp TIMESTAMP,
+                loss_percent NUMBER(5,2),
+                factors VARCHAR2(4000),
+                confidence_level VARCHAR2(10),
+                field_conditions VARCHAR2(4000),
+                PRIMARY KEY (id),
+                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+            )
+        """),
+    )
+
+    # Índices para otimização (nome, DDL)
+    INDEX_DDL = (
+        # Cobre filtro e ordenação das consultas por sessão/intervalo de
+        # tempo (ORDER BY timestamp, sensor_type sem SORT); COMPRESS 1
+        # deduplica o session_id repetido nas folhas
+        ('idx_sensor_session_ts_type',
+         """CREATE INDEX idx_sensor_session_ts_type
+            ON sensor_data(session_id, timestamp, sensor_type) COMPRESS 1"""),
+        ('idx_sensor_session_type_time',
+         """CREATE INDEX idx_sensor_session_type_time
+            ON sensor_data(session_id, sensor_type, timestamp DESC)"""),
+        # Índice funcional "parcial": só sessões ativas têm chave não nula,
+        # então o índice contém apenas elas, já ordenadas por início
+        ('idx_sessions_active',
+         """CREATE INDEX idx_sessions_active
+            ON sessions(CASE WHEN status = 'active' THEN start_timestamp END)"""),
+        ('idx_emissions_session',
+         """CREATE INDEX idx_emissions_session
+            ON ghg_emissions(session_id)"""),
+        ('idx_carbon_session',
+         """CREATE INDEX idx_carbon_session
+            ON carbon_stocks(session_id)"""),
+        ('idx_losses_session',
+         """CREATE INDEX idx_losses_session
+            ON harvest_losses(session_id)"""),
+    )
+
+    # Tabelas gerenciadas pelo esquema (nomes em maiúsculas, como no dicionário)
+    TABLE_NAMES = tuple(name.upper() for name, _ in TABLE_SPECS)
+
+    # Consulta de existência com binds, reaproveitada entre chamadas
+    EXISTING_TABLES_SQL = """
+        SELECT table_name
+        FROM user_tables
+        WHERE table_name IN (:1, :2, :3, :4, :5)
+    """
+
+    # Remove restrições e tabelas do esquema em uma única ida ao servidor
+    DROP_TABLES_PLSQL = """
+        DECLARE
+            names sys.odcivarchar2list :=
+                sys.odcivarchar2list(:1, :2, :3, :4, :5);
+        BEGIN
+            FOR c IN (SELECT constraint_name, table_name
+                      FROM user_constraints
+                      WHERE table_name IN (SELECT column_value
+                                           FROM TABLE(names))
+                      AND constraint_type = 'R') LOOP
+                EXECUTE IMMEDIATE 'ALTER TABLE ' || c.table_name ||
+                                  ' DROP CONSTRAINT ' || c.constraint_name;
+            END LOOP;
+            FOR t IN (SELECT table_name
+                      FROM user_tables
+                      WHERE table_name IN (SELECT column_value
+                                           FROM TABLE(names))) LOOP
+                EXECUTE IMMEDIATE 'DROP TABLE ' || t.table_name ||
+                                  ' CASCADE CONSTRAINTS PURGE';
+            END LOOP;
+        END;
+    """
+
+    # Cria um objeto apenas se ainda não existir no dicionário de dados;
+    # as chamadas a create_if_missing são geradas por ensure_schema
+    ENSURE_SCHEMA_PLSQL = """
+        DECLARE
+            PROCEDURE create_if_missing(p_name VARCHAR2, p_kind VARCHAR2,
+                                        p_ddl VARCHAR2) IS
+                n NUMBER;
+            BEGIN
+                IF p_kind = 'TABLE' THEN
+                    SELECT COUNT(*) INTO n FROM user_tables
+                    WHERE table_name = p_name;
+                ELSE
+                    SELECT COUNT(*) INTO n FROM user_indexes
+                    WHERE index_name = p_name;
+                END IF;
+                IF n = 0 THEN
+                    EXECUTE IMMEDIATE p_ddl;
+                END IF;
+            END;
+        BEGIN
+            {calls}
+        END;
+    """
+
     def __init__(self, host, port, service_name, username, password):
         """
         Inicializa o inicializador de esquema com os parâmetros de conexão.
@@ -49,90 +207,7 @@ class SchemaInitializer:
         self.username = username
         self.password = password
         self.connection = None
-
-        # Define esquemas SQL para criação de tabelas
-        self.table_schemas = {
-            'sessions': """
-                CREATE TABLE sessions (
-                    session_id VARCHAR2(50) PRIMARY KEY,
-                    start_timestamp TIMESTAMP,
-                    end_timestamp TIMESTAMP,
-                    status VARCHAR2(20),
-                    created_by VARCHAR2(30),
-                    last_updated TIMESTAMP,
-                    version NUMBER(10) DEFAULT 1
-                )
-            """,
-            'sensor_data': """
-                CREATE TABLE sensor_data (
-                    id NUMBER GENERATED ALWAYS AS IDENTITY,
-                    session_id VARCHAR2(50),
-                    timestamp TIMESTAMP,
-                    sensor_type VARCHAR2(30),
-                    sensor_value NUMBER(10,2),
-                    unit VARCHAR2(10),
-                    quality_flag VARCHAR2(10),
-                    PRIMARY KEY (id),
-                    FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-                )
-            """,
-            'ghg_emissions': """
-                CREATE TABLE ghg_emissions (
-                    id NUMBER GENERATED ALWAYS AS IDENTITY,
-                    session_id VARCHAR2(50),
-                    timestamp TIMESTAMP,
-                    scope NUMBER(1),
-                    category VARCHAR2(30),
-                    source VARCHAR2(50),
-                    gas VARCHAR2(10),
-                    value NUMBER(10,2),
-                    unit VARCHAR2(10),
-                    calculation_method VARCHAR2(20),
-                    uncertainty_percent NUMBER(5,2),
-                    PRIMARY KEY (id),
-                    FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-                )
-            """,
-            'carbon_stocks': """
-                CREATE TABLE carbon_stocks (
-                    id NUMBER GENERATED ALWAYS AS IDENTITY,
-                    session_id VARCHAR2(50),
-                    timestamp TIMESTAMP,
-                    stock_type VARCHAR2(30),
-                    change NUMBER(10,2),
-                    amortization_period NUMBER(3),
-                    unit VARCHAR2(10),
-                    measurement_method VARCHAR2(30),
-                    PRIMARY KEY (id),
-                    FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-                )
-            """,
-            'harvest_losses': """
-                CREATE TABLE harvest_losses (
-                    id NUMBER GENERATED ALWAYS AS IDENTITY,
-                    session_id VARCHAR2(50),
-                    timestamp TIMESTAMP,
-                    loss_percent NUMBER(5,2),
-                    factors VARCHAR2(4000),
-                    confidence_level VARCHAR2(10),
-                    field_conditions VARCHAR2(4000),
-                    PRIMARY KEY (id),
-                    FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-                )
-            """
-        }
-
-        # Define índices para otimização
-        self.indices = [
-            """CREATE INDEX idx_sensor_session_time
-               ON sensor_data(session_id, timestamp)""",
-            """CREATE INDEX idx_emissions_session
-               ON ghg_emissions(session_id)""",
-            """CREATE INDEX idx_carbon_session
-               ON carbon_stocks(session_id)""",
-            """CREATE INDEX idx_losses_session
-               ON harvest_losses(session_id)"""
-        ]
+        self._existence_cursor = None
 
     def connect(self):
         """
@@ -149,24 +224,40 @@ class SchemaInitializer:
                 service_name=self.service_name
             )
 
-            # Estabelece conexão
+            # Estabelece conexão (sem notificações AQ, que não são usadas)
             self.connection = cx_Oracle.connect(
                 user=self.username,
                 password=self.password,
-                dsn=dsn
+                dsn=dsn,
+                threaded=True,
+                events=False
             )
 
-            logger.info(f"Conectado ao Oracle em {self.host}:{self.port}")
+            # Cache de statements evita novo parse das consultas repetidas;
+            # autocommit desligado mantém commits explícitos
+            self.connection.stmtcachesize = 50
+            self.connection.autocommit = False
+
+            # Cursor dedicado à verificação de tabelas, mantido aberto para
+            # reaproveitar o statement já analisado pelo Oracle
+            self._existence_cursor = self.connection.cursor()
+            self._existence_cursor.arraysize = len(self.TABLE_NAMES)
+            self._existence_cursor.prefetchrows = len(self.TABLE_NAMES) + 1
+
+            logger.info("Conectado ao Oracle em %s:%s", self.host, self.port)
             return True
 
         except cx_Oracle.Error as e:
             error_obj, = e.args
-            logger.error(f"Erro ao conectar ao Oracle: {error_obj.message}")
+            logger.error("Erro ao conectar ao Oracle: %s", error_obj.message)
             return False
 
     def create_schema(self):
         """
-        Cria o esquema completo do banco de dados.
+        Cria as tabelas do esquema do banco de dados.
+
+        Os índices não são criados aqui: chame create_indices() após a
+        carga inicial de dados.
 
         Returns:
             bool: Sucesso da operação
@@ -179,15 +270,12 @@ class SchemaInitializer:
             cursor = self.connection.cursor()
 
             # Verifica tabelas existentes
-            cursor.execute("""
-                SELECT table_name
-                FROM user_tables
-                WHERE table_name IN ('SESSIONS', 'SENSOR_DATA', 'GHG_EMISSIONS',
-                                    'CARBON_STOCKS', 'HARVEST_LOSSES')
-            """)
+            self._existence_cursor.execute(self.EXISTING_TABLES_SQL,
+                                           self.TABLE_NAMES)
 
-            existing_tables = [row[0] for row in cursor.fetchall()]
-            logger.info(f"Tabelas existentes: {existing_tables}")
+            existing_tables = [row[0] for row in
+                               self._existence_cursor.fetchall()]
+            logger.info("Tabelas existentes: %s", existing_tables)
 
             # Remove tabelas existentes (se necessário)
             if existing_tables:
@@ -196,45 +284,135 @@ class SchemaInitializer:
 
             # Cria tabelas na ordem correta respeitando referências
             logger.info("Criando tabelas...")
-            for table_name in ['sessions', 'sensor_data', 'ghg_emissions',
-                              'carbon_stocks', 'harvest_losses']:
-
-                schema = self.table_schemas[table_name]
-                logger.info(f"Criando tabela {table_name}...")
+            for table_name, schema in self.TABLE_SPECS:
+                logger.info("Criando tabela %s...", table_name)
 
                 try:
                     cursor.execute(schema)
-                    logger.info(f"Tabela {table_name} criada com sucesso")
+                    logger.info("Tabela %s criada com sucesso", table_name)
                 except cx_Oracle.Error as e:
                     error_obj, = e.args
                     if error_obj.code == 955:  # ORA-00955: name already used
-                        logger.info(f"Tabela {table_name} já existe")
+                        logger.info("Tabela %s já existe", table_name)
                     else:
-                        logger.error(f"Erro ao criar tabela {table_name}: "
-                                    f"{error_obj.message}")
+                        logger.error("Erro ao criar tabela %s: %s",
+                                     table_name, error_obj.message)
                         raise
 
-            # Cria índices para otimização
+            self.connection.commit()
+            logger.info("Esquema criado com sucesso")
+            return True
+
+        except cx_Oracle.Error as e:
+            error_obj, = e.args
+            logger.error("Erro ao criar esquema: %s", error_obj.message)
+            self.connection.rollback()
+            return False
+        finally:
+            if cursor:
+                cursor.close()
+
+    def ensure_schema(self):
+        """
+        Cria tabelas e índices ausentes sem remover objetos existentes.
+
+        Toda a verificação de existência ocorre no servidor, em um único
+        bloco PL/SQL enviado com os DDLs como binds.
+
+        Returns:
+            bool: Sucesso da operação
+        """
+        if not self.connection:
+            logger.error("Sem conexão com o banco de dados")
+            return False
+
+        objects = [(name.upper(), 'TABLE', ddl)
+                   for name, ddl in self.TABLE_SPECS]
+        objects += [(name.upper(), 'INDEX', ddl)
+                    for name, ddl in self.INDEX_DDL]
+
+        binds = {}
+        calls = []
+        for i, (name, kind, ddl) in enumerate(objects):
+            calls.append(f"create_if_missing(:name{i}, :kind{i}, :ddl{i});")
+            binds[f"name{i}"] = name
+            binds[f"kind{i}"] = kind
+            binds[f"ddl{i}"] = ddl
+
+        plsql = self.ENSURE_SCHEMA_PLSQL.format(
+            calls="\n            ".join(calls)
+        )
+
+        cursor = None
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(plsql, binds)
+            logger.info("Esquema verificado com sucesso")
+            return True
+
+        except cx_Oracle.Error as e:
+            error_obj, = e.args
+            logger.error("Erro ao verificar esquema: %s", error_obj.message)
+            return False
+        finally:
+            if cursor:
+                cursor.close()
+
+    def create_indices(self, parallel=8, nologging=True):
+        """
+        Cria os índices de otimização do esquema.
+
+        Deve ser chamado após a carga inicial de dados, pois construir o
+        índice uma única vez sobre a tabela populada é mais barato que
+        mantê-lo a cada linha inserida. Ao final, os atributos de
+        paralelismo e logging de cada índice são restaurados ao padrão.
+
+        Args:
+            parallel: Grau de paralelismo na construção (1 desativa)
+            nologging: Se True, constrói os índices sem gerar redo
+
+        Returns:
+            bool: Sucesso da operação
+        """
+        if not self.connection:
+            logger.error("Sem conexão com o banco de dados")
+            return False
+
+        # Opções de construção e os atributos que as desfazem
+        build_options = []
+        reset_options = []
+        if nologging:
+            build_options.append("NOLOGGING")
+            reset_options.append("LOGGING")
+        if parallel > 1:
+            build_options.append(f"PARALLEL {int(parallel)}")
+            reset_options.append("NOPARALLEL")
+
+        cursor = None
+        try:
+            cursor = self.connection.cursor()
+
             logger.info("Criando índices...")
-            for index_sql in self.indices:
+            for index_name, index_sql in self.INDEX_DDL:
                 try:
-                    cursor.execute(index_sql)
-                    logger.info("Índice criado com sucesso")
+                    cursor.execute(" ".join([index_sql] + build_options))
+                    if reset_options:
+                        cursor.execute(f"ALTER INDEX {index_name} "
+                                       f"{' '.join(reset_options)}")
+                    logger.info("Índice %s criado com sucesso", index_name)
                 except cx_Oracle.Error as e:
                     error_obj, = e.args
                     if error_obj.code == 955:  # Índice já existe
-                        logger.info("Índice já existe")
+                        logger.info("Índice %s já existe", index_name)
                     else:
-                        logger.warning(f"Erro ao criar índice: {error_obj.message}")
+                        logger.warning("Erro ao criar índice %s: %s",
+                                       index_name, error_obj.message)
 
-            self.connection.commit()
-            logger.info("Esquema criado com sucesso")
             return True
 
         except cx_Oracle.Error as e:
             error_obj, = e.args
-            logger.error(f"Erro ao criar esquema: {error_obj.message}")
-            self.connection.rollback()
+            logger.error("Erro ao criar índices: %s", error_obj.message)
             return False
         finally:
             if cursor:
@@ -244,36 +422,19 @@ class SchemaInitializer:
         """
         Remove tabelas existentes para recriação.
 
+        Executa um único bloco PL/SQL no servidor que remove as chaves
+        estrangeiras e depois as tabelas do esquema.
+
         Args:
             cursor: Cursor Oracle
             existing_tables: Lista de tabelas existentes
         """
-        # Primeiro desabilita restrições de chaves estrangeiras
-        for table in existing_tables:
-            try:
-                cursor.execute(f"""
-                    BEGIN
-                        FOR c IN (SELECT constraint_name, table_name
-                                 FROM user_constraints
-                                 WHERE table_name = '{table}'
-                                 AND constraint_type = 'R') LOOP
-                            EXECUTE IMMEDIATE 'ALTER TABLE ' || c.table_name ||
-                                           ' DROP CONSTRAINT ' || c.constraint_name;
-                        END LOOP;
-                    END;
-                """)
-            except cx_Oracle.Error as e:
-                error_obj, = e.args
-                logger.warning(f"Erro ao desabilitar restrições: {error_obj.message}")
-
-        # Depois remove as tabelas em ordem inversa (para evitar problemas com FK)
-        for table in reversed(existing_tables):
-            try:
-                cursor.execute(f"DROP TABLE {table}")
-                logger.info(f"Tabela {table} removida")
-            except cx_Oracle.Error as e:
-                error_obj, = e.args
-                logger.warning(f"Erro ao remover tabela {table}: {error_obj.message}")
+        try:
+            cursor.execute(self.DROP_TABLES_PLSQL, self.TABLE_NAMES)
+            logger.info("Tabelas removidas: %s", existing_tables)
+        except cx_Oracle.Error as e:
+            error_obj, = e.args
+            logger.warning("Erro ao remover tabelas: %s", error_obj.message)
 
     def disconnect(self):
         """
@@ -284,12 +445,15 @@ class SchemaInitializer:
         """
         if self.connection:
             try:
+                if self._existence_cursor:
+                    self._existence_cursor.close()
+                    self._existence_cursor = None
                 self.connection.close()
                 logger.info("Conexão encerrada")
                 return True
             except cx_Oracle.Error as e:
                 error_obj, = e.args
-                logger.error(f"Erro ao desconectar: {error_obj.message}")
+                logger.error("Erro ao desconectar: %s", error_obj.message)
                 return False
         return True
 
@@ -337,7 +501,13 @@ def main():
     if initializer.connect():
         print("Conexão estabelecida com sucesso!")
 
-        if initializer.create_schema():
+        if args.force:
+            # Sem carga inicial de dados aqui: os índices são criados em seguida
+            success = initializer.create_schema() and initializer.create_indices()
+        else:
+            success = initializer.ensure_schema()
+
+        if success:
             print("\nEsquema criado com sucesso!")
             print("As tabelas agora estão prontas para receber dados.")
         else:
@@ -7,14 +7,22 @@ Gerencia operações de dados de sensores no banco de dados Oracle.
 Este módulo implementa operações CRUD para dados de sensores coletados
 durante o monitoramento da colheita mecanizada de cana-de-açúcar, incluindo
 sensores ambientais, operacionais e de emissões.
+
+As consultas dependem dos índices criados pelo SchemaInitializer:
+- idx_sensor_session_ts_type (session_id, timestamp, sensor_type): leituras
+  por sessão e por intervalo de tempo, já na ordem do ORDER BY
+- idx_sensor_session_type_time (session_id, sensor_type, timestamp DESC):
+  leituras por tipo, última leitura e agregações
 """
 
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterator
 
-import cx_Oracle
+import oracledb as cx_Oracle
+import numpy as np
 
+from persistence.oracle import sensor_kernels
 from persistence.oracle.connector import OracleConnector
 from persistence.oracle.error_handler import with_error_handling, with_retry
 from persistence.oracle.session_dao import SessionDAO
@@ -22,6 +30,54 @@ from persistence.oracle.session_dao import SessionDAO
 # Configuração de logging
 logger = logging.getLogger(__name__)
 
+# Linhas por ida ao servidor nas consultas (o padrão do driver é 100)
+DEFAULT_ARRAYSIZE = 10_000
+
+# Linhas por chamada de executemany, limitando a memória do array de binds
+BATCH_CHUNK = 5000
+
+# Larguras das colunas texto de sensor_data, usadas nos binds da inserção
+SESSION_ID_WIDTH = 50
+SENSOR_TYPE_WIDTH = 30
+UNIT_WIDTH = 10
+QUALITY_FLAG_WIDTH = 10
+
+# Resultados de estatísticas/agregações mantidos em cache por instância
+STATS_CACHE_SIZE = 256
+
+# Máximo de sessões com tipos de sensores mantidos em cache
+TYPES_CACHE_SIZE = 256
+
+# Registro de estatísticas por tipo de sensor (uma linha por tipo)
+STATISTICS_DTYPE = np.dtype([
+    ('sensor_type', f'U{SENSOR_TYPE_WIDTH}'),
+    ('count', np.int64),
+    ('min_value', np.float64),
+    ('max_value', np.float64),
+    ('avg_value', np.float64),
+    ('median_value', np.float64),
+    ('stddev_value', np.float64)
+])
+
+
+def statistics_to_dict(statistics: np.ndarray) -> Dict[str, Dict[str, Any]]:
+    """
+    Converte estatísticas em array estruturado para o formato de dicionário.
+
+    Mantém compatibilidade com consumidores de get_sensor_statistics.
+
+    Args:
+        statistics: Array com dtype STATISTICS_DTYPE
+
+    Returns:
+        Dict: Estatísticas por tipo de sensor
+    """
+    fields = STATISTICS_DTYPE.names[1:]
+    return {
+        row[0]: dict(zip(fields, row[1:]))
+        for row in statistics.tolist()
+    }
+
 
 class SensorDAO:
     """
@@ -31,16 +87,19 @@ class SensorDAO:
     pelos sensores durante o monitoramento da colheita.
     """
 
-    def __init__(self, connector: OracleConnector, session_dao: SessionDAO = None):
+    def __init__(self, connector: OracleConnector, session_dao: SessionDAO = None,
+                 arraysize: int = DEFAULT_ARRAYSIZE):
         """
         Inicializa DAO com conector Oracle.
 
         Args:
             connector: Conector Oracle já inicializado
             session_dao: DAO de sessões para validação (opcional)
+            arraysize: Linhas buscadas por ida ao servidor nas consultas
         """
         self.connector = connector
         self.session_dao = session_dao
+        self.arraysize = arraysize
 
         # Queries SQL para operações comuns
         self._queries = {
@@ -49,8 +108,7 @@ class SensorDAO:
                     session_id, timestamp, sensor_type,
                     sensor_value, unit, quality_flag
                 ) VALUES (
-                    :session_id, :timestamp, :sensor_type,
-                    :sensor_value, :unit, :quality_flag
+                    :1, :2, :3, :4, :5, :6
                 )
             """,
             'get_by_id': """
@@ -61,7 +119,7 @@ class SensorDAO:
                 WHERE id = :id
             """,
             'get_by_session': """
-                SELECT
+                SELECT /*+ INDEX(sensor_data idx_sensor_session_ts_type) */
                     id, timestamp, sensor_type,
                     sensor_value, unit, quality_flag
                 FROM sensor_data
@@ -77,7 +135,7 @@ class SensorDAO:
                 ORDER BY timestamp
             """,
             'get_by_time_range': """
-                SELECT
+                SELECT /*+ INDEX(sensor_data idx_sensor_session_ts_type) */
                     id, session_id, timestamp, sensor_type,
                     sensor_value, unit, quality_flag
                 FROM sensor_data
@@ -86,13 +144,16 @@ class SensorDAO:
                 ORDER BY timestamp, sensor_type
             """,
             'get_latest_by_type': """
-                SELECT
-                    id, timestamp, sensor_value, unit, quality_flag
-                FROM sensor_data
-                WHERE session_id = :session_id
-                  AND sensor_type = :sensor_type
-                  AND ROWNUM = 1
-                ORDER BY timestamp DESC
+                SELECT id, timestamp, sensor_value, unit, quality_flag
+                FROM (
+                    SELECT
+                        id, timestamp, sensor_value, unit, quality_flag
+                    FROM sensor_data
+                    WHERE session_id = :session_id
+                      AND sensor_type = :sensor_type
+                    ORDER BY timestamp DESC
+                )
+                WHERE ROWNUM = 1
             """,
             'get_statistics': """
                 SELECT
@@ -106,13 +167,86 @@ class SensorDAO:
                 FROM sensor_data
                 WHERE session_id = :session_id
                 GROUP BY sensor_type
+            """,
+            'count_by_session_and_type': """
+                SELECT COUNT(*)
+                FROM sensor_data
+                WHERE session_id = :session_id
+                  AND sensor_type = :sensor_type
+            """,
+            'get_values_by_session_and_type': """
+                SELECT timestamp, sensor_value
+                FROM sensor_data
+                WHERE session_id = :session_id
+                  AND sensor_type = :sensor_type
+                ORDER BY timestamp
+            """,
+            'get_watermark': """
+                SELECT MAX(timestamp), COUNT(*)
+                FROM sensor_data
+                WHERE session_id = :session_id
             """
         }
 
+        # Queries de agregação por intervalo, montadas uma única vez para que
+        # o texto SQL seja idêntico entre chamadas (cache de cursores)
+        self._agg_queries = {
+            interval: f"""
+                SELECT /*+ INDEX(sensor_data idx_sensor_session_type_time) */
+                    {trunc_format} as interval_start,
+                    COUNT(*) as sample_count,
+                    AVG(sensor_value) as avg_value,
+                    MIN(sensor_value) as min_value,
+                    MAX(sensor_value) as max_value,
+                    MEDIAN(sensor_value) as median_value,
+                    STDDEV(sensor_value) as stddev_value
+                FROM sensor_data
+                WHERE session_id = :session_id
+                  AND sensor_type = :sensor_type
+                GROUP BY {trunc_format}
+                ORDER BY interval_start
+            """
+            for interval, trunc_format in (
+                ('minute', "TRUNC(timestamp, 'MI')"),
+                ('hour', "TRUNC(timestamp, 'HH')"),
+                ('day', "TRUNC(timestamp, 'DD')")
+            )
+        }
+
+        # Cache de estatísticas: chave -> (marca d'água da sessão, resultado)
+        self._stats_cache = {}
+
+        # Cache LRU de tipos por sessão: session_id -> (lista, conjunto)
+        self._types_cache = {}
+
+        # Cursor de inserção reutilizado com a conexão fornecida pelo chamador
+        self._insert_cursor = None
+        self._insert_connection = None
+
+        # Nomes das colunas retornadas por cada consulta, na ordem do SELECT
+        self._columns = {
+            'get_by_id': ('id', 'session_id', 'timestamp', 'sensor_type',
+                          'sensor_value', 'unit', 'quality_flag'),
+            'get_by_session': ('id', 'timestamp', 'sensor_type',
+                               'sensor_value', 'unit', 'quality_flag'),
+            'get_by_session_and_type': ('id', 'timestamp', 'sensor_value',
+                                        'unit', 'quality_flag'),
+            'get_by_time_range': ('id', 'session_id', 'timestamp', 'sensor_type',
+                                  'sensor_value', 'unit', 'quality_flag'),
+            'get_latest_by_type': ('id', 'timestamp', 'sensor_value',
+                                   'unit', 'quality_flag'),
+            'get_statistics': ('sensor_type', 'count', 'min_value', 'max_value',
+                               'avg_value', 'median_value', 'stddev_value'),
+            'get_aggregated': ('interval_start', 'sample_count', 'avg_value',
+                               'min_value', 'max_value', 'median_value',
+                               'stddev_value')
+        }
+
     @with_error_handling
     @with_retry()
     def save_sensor_data(self, session_id: str,
-                        sensor_data: Dict[str, Any]) -> int:
+                        sensor_data: Dict[str, Any],
+                        connection=None) -> int:
         """
         Salva dados de sensores para uma sessão específica.
 
@@ -121,9 +255,17 @@ class SensorDAO:
         - Objeto completo: {"temperatura": {"value": 25.5, "unit": "°C",
                             "timestamp": "2023-01-01T12:00:00"}}
 
+        O timestamp pode ser fornecido como string ISO 8601 ou diretamente
+        como datetime, o que evita a conversão de texto por leitura.
+
+        Para ingestão contínua, o chamador pode fornecer uma conexão própria
+        (ex: obtida do pool e mantida aberta); nesse caso o DAO reutiliza um
+        cursor já preparado para a inserção entre as chamadas.
+
         Args:
             session_id: Identificador da sessão
             sensor_data: Dicionário com dados dos sensores
+            connection: Conexão de longa duração do chamador (opcional)
 
         Returns:
             int: Número de registros salvos
@@ -143,47 +285,63 @@ class SensorDAO:
             logger.warning("Nenhum dado de sensor fornecido para salvar")
             return 0
 
+        # Pré-classifica as leituras por formato, evitando verificações de
+        # tipo por leitura nos laços de montagem do lote
+        numeric = (int, float)
+        scalars = {
+            name: reading for name, reading in sensor_data.items()
+            if isinstance(reading, numeric)
+        }
+        complete = {
+            name: reading for name, reading in sensor_data.items()
+            if isinstance(reading, dict) and isinstance(reading.get('value'), numeric)
+        }
+
         # Prepara dados para inserção em lote
-        batch_data = []
         now = datetime.now()
 
-        for sensor_name, reading in sensor_data.items():
-            # Processa cada leitura de sensor
-            if isinstance(reading, dict) and 'value' in reading:
-                # Formato completo com timestamp e unidade
-                try:
-                    timestamp = datetime.fromisoformat(
-                        reading.get('timestamp', now.isoformat())
-                    )
-                except (ValueError, TypeError):
-                    timestamp = now
-
-                sensor_value = reading['value']
-                unit = reading.get('unit', '')
-                quality_flag = reading.get('quality_flag', 'GOOD')
-            else:
-                # Formato simplificado (apenas valor)
-                timestamp = now
-                sensor_value = reading
-                unit = ''
-                quality_flag = 'GOOD'
-
-            # Validação básica dos dados
-            if not isinstance(sensor_value, (int, float)):
-                logger.warning(
-                    f"Valor inválido para sensor {sensor_name}: {sensor_value}. "
-                    f"Ignorando."
-                )
-                continue
-
-            batch_data.append({
-                'session_id': session_id,
-                'timestamp': timestamp,
-                'sensor_type': sensor_name,
-                'sensor_value': sensor_value,
-                'unit': unit,
-                'quality_flag': quality_flag
-            })
+        # Formato simplificado (apenas valor)
+        batch_data = [
+            (session_id, now, sensor_name, float(sensor_value), '', 'GOOD')
+            for sensor_name, sensor_value in scalars.items()
+        ]
+
+        # Formato completo com timestamp e unidade
+        batch_data.extend(
+            (
+                session_id,
+                self._parse_timestamp(reading.get('timestamp'), now),
+                sensor_name,
+                float(reading['value']),
+                str(reading.get('unit') or ''),
+                str(reading.get('quality_flag') or 'GOOD')
+            )
+            for sensor_name, reading in complete.items()
+        )
+
+        if len(batch_data) < len(sensor_data):
+            invalid = [
+                name for name in sensor_data
+                if name not in scalars and name not in complete
+            ]
+            logger.warning(
+                f"Valores inválidos para sensores {', '.join(map(str, invalid))}. "
+                f"Ignorando."
+            )
+
+        # Textos maiores que as colunas seriam rejeitados pelo Oracle
+        oversized = [
+            row[2] for row in batch_data
+            if (len(row[2]) > SENSOR_TYPE_WIDTH or len(row[4]) > UNIT_WIDTH
+                or len(row[5]) > QUALITY_FLAG_WIDTH)
+        ]
+        if oversized:
+            logger.warning(
+                f"Leituras dos sensores {', '.join(oversized)} excedem o "
+                f"tamanho das colunas. Ignorando."
+            )
+            rejected = set(oversized)
+            batch_data = [row for row in batch_data if row[2] not in rejected]
 
         # Executa inserção em lote se houver dados
         if not batch_data:
@@ -191,23 +349,128 @@ class SensorDAO:
             return 0
 
         try:
-            with self.connector.get_connection() as conn:
-                cursor = conn.cursor()
+            if connection is not None:
+                records_saved = self._insert_batch(
+                    connection, self._get_insert_cursor(connection), batch_data
+                )
+            else:
+                with self.connector.get_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.prepare(self._queries['insert'])
+                    records_saved = self._insert_batch(conn, cursor, batch_data)
 
-                # Executa inserção em lote
-                cursor.executemany(self._queries['insert'], batch_data)
+            # Descarta tipos em cache apenas se surgiu um sensor novo
+            cached = self._types_cache.get(session_id)
+            if cached is not None and not cached[1].issuperset(
+                    row[2] for row in batch_data):
+                self.invalidate_types(session_id)
 
-                conn.commit()
-                records_saved = len(batch_data)
-                logger.info(f"Salvos {records_saved} registros de sensores "
-                          f"para sessão {session_id}")
-                return records_saved
+            logger.info(f"Salvos {records_saved} registros de sensores "
+                      f"para sessão {session_id}")
+            return records_saved
 
         except cx_Oracle.Error as e:
             error_obj, = e.args
             logger.error(f"Erro ao salvar dados de sensores: {error_obj.message}")
             raise RuntimeError(f"Falha ao salvar dados: {error_obj.message}") from e
 
+    @staticmethod
+    def _parse_timestamp(value: Any, default: datetime) -> datetime:
+        """
+        Converte o timestamp de uma leitura, sem formatar/reinterpretar o padrão.
+
+        Valores já do tipo datetime são usados diretamente (caminho rápido
+        para fontes tipadas); strings ISO 8601 são convertidas e valores
+        ausentes ou inválidos resultam no timestamp padrão.
+
+        Args:
+            value: Timestamp da leitura (datetime, string ISO ou None)
+            default: Timestamp usado quando o valor está ausente ou inválido
+
+        Returns:
+            datetime: Timestamp da leitura
+        """
+        if isinstance(value, datetime):
+            return value
+        if not value:
+            return default
+        try:
+            return datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            return default
+
+    def _get_insert_cursor(self, connection):
+        """
+        Obtém cursor de inserção preparado para a conexão do chamador.
+
+        O cursor é criado e preparado uma vez por conexão e reutilizado
+        nas chamadas seguintes.
+
+        Args:
+            connection: Conexão de longa duração do chamador
+
+        Returns:
+            Cursor: Cursor com a inserção já preparada
+        """
+        if self._insert_cursor is None or self._insert_connection is not connection:
+            self._insert_cursor = connection.cursor()
+            self._insert_cursor.prepare(self._queries['insert'])
+            self._insert_connection = connection
+        return self._insert_cursor
+
+    def _insert_batch(self, conn, cursor, batch_data: List[tuple]) -> int:
+        """
+        Insere leituras em lotes limitados, com um único commit.
+
+        Linhas rejeitadas pelo Oracle não invalidam o restante do lote. O
+        autocommit é desligado explicitamente para que os blocos do lote
+        formem uma única transação; chamadores não devem religá-lo.
+
+        Args:
+            conn: Conexão Oracle
+            cursor: Cursor com a inserção já preparada
+            batch_data: Tuplas com os valores de cada leitura
+
+        Returns:
+            int: Número de registros salvos
+        """
+        # Declara tipos e larguras dos binds, evitando inferência a partir
+        # dos valores de cada lote
+        cursor.setinputsizes(
+            SESSION_ID_WIDTH,       # session_id
+            cx_Oracle.TIMESTAMP,    # timestamp
+            SENSOR_TYPE_WIDTH,      # sensor_type
+            cx_Oracle.NUMBER,       # sensor_value
+            UNIT_WIDTH,             # unit
+            QUALITY_FLAG_WIDTH      # quality_flag
+        )
+
+        conn.autocommit = False
+
+        rejected = 0
+        try:
+            for start in range(0, len(batch_data), BATCH_CHUNK):
+                # Statement None reutiliza a inserção preparada no cursor
+                cursor.executemany(
+                    None,
+                    batch_data[start:start + BATCH_CHUNK],
+                    batcherrors=True
+                )
+                for error in cursor.getbatcherrors():
+                    logger.warning(
+                        f"Leitura {start + error.offset} rejeitada: "
+                        f"{error.message}"
+                    )
+                    rejected += 1
+
+            conn.commit()
+        except cx_Oracle.Error:
+            # Blocos já enviados não podem ficar pendentes na conexão
+            conn.rollback()
+            raise
+
+        return len(batch_data) - rejected
+
     @with_error_handling
     def get_sensor_data_by_session(self, session_id: str) -> List[Dict[str, Any]]:
         """
@@ -227,7 +490,7 @@ class SensorDAO:
 
         try:
             with self.connector.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self._query_cursor(conn)
 
                 cursor.execute(
                     self._queries['get_by_session'],
@@ -239,8 +502,8 @@ class SensorDAO:
                     return []
 
                 # Converte resultado para lista de dicionários
-                column_names = [col[0].lower() for col in cursor.description]
-                return [dict(zip(column_names, row)) for row in rows]
+                columns = self._columns['get_by_session']
+                return [dict(zip(columns, row)) for row in rows]
 
         except cx_Oracle.Error as e:
             error_obj, = e.args
@@ -269,7 +532,7 @@ class SensorDAO:
 
         try:
             with self.connector.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self._query_cursor(conn)
 
                 cursor.execute(
                     self._queries['get_by_session_and_type'],
@@ -282,8 +545,8 @@ class SensorDAO:
                     return []
 
                 # Converte resultado para lista de dicionários
-                column_names = [col[0].lower() for col in cursor.description]
-                return [dict(zip(column_names, row)) for row in rows]
+                columns = self._columns['get_by_session_and_type']
+                return [dict(zip(columns, row)) for row in rows]
 
         except cx_Oracle.Error as e:
             error_obj, = e.args
@@ -316,7 +579,7 @@ class SensorDAO:
 
         try:
             with self.connector.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self._query_cursor(conn)
 
                 cursor.execute(
                     self._queries['get_by_time_range'],
@@ -330,8 +593,8 @@ class SensorDAO:
                     return []
 
                 # Converte resultado para lista de dicionários
-                column_names = [col[0].lower() for col in cursor.description]
-                return [dict(zip(column_names, row)) for row in rows]
+                columns = self._columns['get_by_time_range']
+                return [dict(zip(columns, row)) for row in rows]
 
         except cx_Oracle.Error as e:
             error_obj, = e.args
@@ -339,6 +602,160 @@ class SensorDAO:
                        f"{error_obj.message}")
             raise RuntimeError(f"Falha ao consultar dados: {error_obj.message}") from e
 
+    def iter_sensor_data_by_session(self, session_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre os dados de sensores de uma sessão sem materializá-los.
+
+        Mantém em memória apenas um lote de arraysize linhas por vez,
+        adequado para sessões longas.
+
+        Args:
+            session_id: Identificador da sessão
+
+        Yields:
+            Dict: Registro de sensor
+
+        Raises:
+            RuntimeError: Se ocorrer erro ao consultar dados
+        """
+        return self._iter_rows('get_by_session', session_id=session_id)
+
+    def iter_sensor_data_by_type(self, session_id: str,
+                                 sensor_type: str) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre as leituras de um tipo de sensor sem materializá-las.
+
+        Args:
+            session_id: Identificador da sessão
+            sensor_type: Tipo de sensor (ex: 'temperature', 'humidity')
+
+        Yields:
+            Dict: Leitura do sensor
+
+        Raises:
+            RuntimeError: Se ocorrer erro ao consultar dados
+        """
+        return self._iter_rows('get_by_session_and_type',
+                               session_id=session_id, sensor_type=sensor_type)
+
+    def iter_sensor_data_by_time_range(self, session_id: str,
+                                       start_time: datetime,
+                                       end_time: datetime) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre as leituras de um intervalo de tempo sem materializá-las.
+
+        Args:
+            session_id: Identificador da sessão
+            start_time: Timestamp inicial
+            end_time: Timestamp final
+
+        Yields:
+            Dict: Leitura do sensor no intervalo
+
+        Raises:
+            RuntimeError: Se ocorrer erro ao consultar dados
+        """
+        return self._iter_rows('get_by_time_range', session_id=session_id,
+                               start_time=start_time, end_time=end_time)
+
+    @with_error_handling
+    def get_sensor_arrays(self, session_id: str,
+                          sensor_type: str) -> Dict[str, np.ndarray]:
+        """
+        Recupera as leituras de um sensor como arrays NumPy por coluna.
+
+        Evita um dicionário por linha em séries longas e entrega os dados
+        prontos para cálculos vetorizados.
+
+        Args:
+            session_id: Identificador da sessão
+            sensor_type: Tipo de sensor
+
+        Returns:
+            Dict: 'timestamp' (datetime64[us]) e 'sensor_value' (float64),
+                ordenados por timestamp
+
+        Raises:
+            RuntimeError: Se ocorrer erro ao consultar dados
+        """
+        if not self.connector.initialized and not self.connector.initialize():
+            raise RuntimeError("Conector Oracle não está inicializado")
+
+        params = {'session_id': session_id, 'sensor_type': sensor_type}
+
+        try:
+            with self.connector.get_connection() as conn:
+                cursor = self._query_cursor(conn)
+
+                # Pré-aloca os arrays com o total de leituras
+                cursor.execute(self._queries['count_by_session_and_type'], params)
+                capacity = cursor.fetchone()[0]
+                timestamps = np.empty(capacity, dtype='datetime64[us]')
+                values = np.empty(capacity, dtype=np.float64)
+
+                cursor.execute(self._queries['get_values_by_session_and_type'],
+                               params)
+
+                filled = 0
+                while True:
+                    rows = cursor.fetchmany(cursor.arraysize)
+                    if not rows:
+                        break
+
+                    end = filled + len(rows)
+                    # Leituras inseridas após a contagem ampliam os arrays
+                    if end > capacity:
+                        capacity = max(end, 2 * capacity)
+                        timestamps = np.resize(timestamps, capacity)
+                        values = np.resize(values, capacity)
+
+                    batch_ts, batch_values = zip(*rows)
+                    timestamps[filled:end] = batch_ts
+                    values[filled:end] = batch_values
+                    filled = end
+
+                return {
+                    'timestamp': timestamps[:filled],
+                    'sensor_value': values[:filled]
+                }
+
+        except cx_Oracle.Error as e:
+            error_obj, = e.args
+            logger.error(f"Erro ao consultar arrays do sensor {sensor_type}: "
+                       f"{error_obj.message}")
+            raise RuntimeError(f"Falha ao consultar dados: {error_obj.message}") from e
+
+    def get_sensor_features(self, session_id: str, sensor_type: str,
+                            window: int = 10,
+                            threshold: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Recupera a série de um sensor com atributos derivados vetorizados.
+
+        Args:
+            session_id: Identificador da sessão
+            sensor_type: Tipo de sensor
+            window: Leituras por janela da média móvel
+            threshold: Limiar para detecção de trechos (opcional)
+
+        Returns:
+            Dict: Arrays de get_sensor_arrays acrescidos de 'rolling_mean',
+                'zscore' e, se houver limiar, 'above_threshold_runs'
+
+        Raises:
+            ValueError: Se a janela não for positiva
+            RuntimeError: Se ocorrer erro ao consultar dados
+        """
+        arrays = self.get_sensor_arrays(session_id, sensor_type)
+        values = arrays['sensor_value']
+
+        arrays['rolling_mean'] = sensor_kernels.rolling_mean(values, window)
+        arrays['zscore'] = sensor_kernels.zscore(values)
+        if threshold is not None:
+            arrays['above_threshold_runs'] = sensor_kernels.above_threshold_runs(
+                values, threshold
+            )
+        return arrays
+
     @with_error_handling
     def get_latest_sensor_reading(self, session_id: str,
                                  sensor_type: str) -> Optional[Dict[str, Any]]:
@@ -362,7 +779,7 @@ class SensorDAO:
 
         try:
             with self.connector.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self._query_cursor(conn, arraysize=1)
 
                 cursor.execute(
                     self._queries['get_latest_by_type'],
@@ -375,8 +792,7 @@ class SensorDAO:
                     return None
 
                 # Converte resultado para dicionário
-                column_names = [col[0].lower() for col in cursor.description]
-                return dict(zip(column_names, row))
+                return dict(zip(self._columns['get_latest_by_type'], row))
 
         except cx_Oracle.Error as e:
             error_obj, = e.args
@@ -390,6 +806,7 @@ class SensorDAO:
         Calcula estatísticas para todos os tipos de sensores na sessão.
 
         Utiliza funções estatísticas do Oracle para cálculos eficientes.
+        O resultado fica em cache até que a sessão receba novas leituras.
 
         Args:
             session_id: Identificador da sessão
@@ -405,27 +822,77 @@ class SensorDAO:
 
         try:
             with self.connector.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self._query_cursor(conn)
+
+                cache_key = ('statistics', session_id)
+                watermark = self._get_watermark(cursor, session_id)
+                cached = self._cache_lookup(cache_key, watermark)
+                if cached is not None:
+                    return {k: dict(v) for k, v in cached.items()}
 
                 cursor.execute(
                     self._queries['get_statistics'],
                     session_id=session_id
                 )
 
-                rows = cursor.fetchall()
-                if not rows:
-                    return {}
+                # Converte resultado para dicionário aninhado por sensor_type
+                columns = self._columns['get_statistics'][1:]
+                result = {row[0]: dict(zip(columns, row[1:]))
+                          for row in cursor.fetchall()}
+
+                self._cache_store(cache_key, watermark, result)
+                return {k: dict(v) for k, v in result.items()}
+
+        except cx_Oracle.Error as e:
+            error_obj, = e.args
+            logger.error(f"Erro ao calcular estatísticas de sensores: "
+                       f"{error_obj.message}")
+            raise RuntimeError(f"Falha ao calcular estatísticas: {error_obj.message}") from e
+
+    @with_error_handling
+    def get_sensor_statistics_array(self, session_id: str) -> np.ndarray:
+        """
+        Calcula estatísticas por tipo de sensor como array estruturado NumPy.
+
+        Alternativa compacta a get_sensor_statistics para muitos tipos de
+        sensores: uma linha por tipo, colunas acessíveis de forma vetorizada
+        (ex: stats['avg_value']). Valores nulos tornam-se NaN. Use
+        statistics_to_dict para obter o formato de dicionário.
+
+        Args:
+            session_id: Identificador da sessão
+
+        Returns:
+            np.ndarray: Estatísticas com dtype STATISTICS_DTYPE
+
+        Raises:
+            RuntimeError: Se ocorrer erro ao calcular estatísticas
+        """
+        if not self.connector.initialized and not self.connector.initialize():
+            raise RuntimeError("Conector Oracle não está inicializado")
 
-                # Converte resultado para dicionário aninhado
-                column_names = [col[0].lower() for col in cursor.description]
-                result = {}
+        try:
+            with self.connector.get_connection() as conn:
+                cursor = self._query_cursor(conn)
 
-                for row in rows:
-                    row_dict = dict(zip(column_names, row))
-                    sensor_type = row_dict.pop('sensor_type')
-                    result[sensor_type] = row_dict
+                cache_key = ('statistics_array', session_id)
+                watermark = self._get_watermark(cursor, session_id)
+                cached = self._cache_lookup(cache_key, watermark)
+                if cached is not None:
+                    return cached.copy()
 
-                return result
+                cursor.execute(
+                    self._queries['get_statistics'],
+                    session_id=session_id
+                )
+                rows = cursor.fetchall()
+
+                result = np.empty(len(rows), dtype=STATISTICS_DTYPE)
+                for i, row in enumerate(rows):
+                    result[i] = tuple(np.nan if v is None else v for v in row)
+
+                self._cache_store(cache_key, watermark, result)
+                return result.copy()
 
         except cx_Oracle.Error as e:
             error_obj, = e.args
@@ -439,7 +906,8 @@ class SensorDAO:
         """
         Recupera dados agregados de sensores por intervalo de tempo.
 
-        Útil para visualizações e análises com dados reduzidos.
+        Útil para visualizações e análises com dados reduzidos. O resultado
+        fica em cache até que a sessão receba novas leituras.
 
         Args:
             session_id: Identificador da sessão
@@ -457,37 +925,22 @@ class SensorDAO:
             raise RuntimeError("Conector Oracle não está inicializado")
 
         # Valida intervalo
-        valid_intervals = {'minute', 'hour', 'day'}
-        if interval not in valid_intervals:
-            raise ValueError(f"Intervalo inválido. Use um dos: {', '.join(valid_intervals)}")
-
-        # Define formato de truncamento baseado no intervalo
-        trunc_format = {
-            'minute': "TRUNC(timestamp, 'MI')",
-            'hour': "TRUNC(timestamp, 'HH')",
-            'day': "TRUNC(timestamp, 'DD')"
-        }[interval]
-
-        # Constrói query dinâmica para agregação
-        query = f"""
-            SELECT
-                {trunc_format} as interval_start,
-                COUNT(*) as sample_count,
-                AVG(sensor_value) as avg_value,
-                MIN(sensor_value) as min_value,
-                MAX(sensor_value) as max_value,
-                MEDIAN(sensor_value) as median_value,
-                STDDEV(sensor_value) as stddev_value
-            FROM sensor_data
-            WHERE session_id = :session_id
-              AND sensor_type = :sensor_type
-            GROUP BY {trunc_format}
-            ORDER BY interval_start
-        """
+        if interval not in self._agg_queries:
+            raise ValueError(
+                f"Intervalo inválido. Use um dos: {', '.join(self._agg_queries)}"
+            )
+
+        query = self._agg_queries[interval]
 
         try:
             with self.connector.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self._query_cursor(conn)
+
+                cache_key = ('aggregated', session_id, sensor_type, interval)
+                watermark = self._get_watermark(cursor, session_id)
+                cached = self._cache_lookup(cache_key, watermark)
+                if cached is not None:
+                    return [dict(row) for row in cached]
 
                 cursor.execute(
                     query,
@@ -495,13 +948,12 @@ class SensorDAO:
                     sensor_type=sensor_type
                 )
 
-                rows = cursor.fetchall()
-                if not rows:
-                    return []
-
                 # Converte resultado para lista de dicionários
-                column_names = [col[0].lower() for col in cursor.description]
-                return [dict(zip(column_names, row)) for row in rows]
+                columns = self._columns['get_aggregated']
+                result = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+                self._cache_store(cache_key, watermark, result)
+                return [dict(row) for row in result]
 
         except cx_Oracle.Error as e:
             error_obj, = e.args
@@ -518,12 +970,18 @@ class SensorDAO:
         Returns:
             List: Lista de tipos de sensores
         """
+        cached = self._types_cache.pop(session_id, None)
+        if cached is not None:
+            # Reinsere ao final para manter a ordem de uso recente
+            self._types_cache[session_id] = cached
+            return list(cached[0])
+
         if not self.connector.initialized and not self.connector.initialize():
             raise RuntimeError("Conector Oracle não está inicializado")
 
         try:
             with self.connector.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self._query_cursor(conn)
 
                 cursor.execute("""
                     SELECT DISTINCT sensor_type
@@ -532,10 +990,142 @@ class SensorDAO:
                     ORDER BY sensor_type
                 """, session_id=session_id)
 
-                rows = cursor.fetchall()
-                return [row[0] for row in rows]
+                sensor_types = [row[0] for row in cursor.fetchall()]
 
         except cx_Oracle.Error as e:
             error_obj, = e.args
             logger.error(f"Erro ao consultar tipos de sensores: {error_obj.message}")
             raise RuntimeError(f"Falha ao consultar tipos: {error_obj.message}") from e
+
+        if len(self._types_cache) >= TYPES_CACHE_SIZE:
+            del self._types_cache[next(iter(self._types_cache))]
+        self._types_cache[session_id] = (sensor_types, frozenset(sensor_types))
+        return list(sensor_types)
+
+    def invalidate_types(self, session_id: Optional[str] = None) -> None:
+        """
+        Descarta tipos de sensores em cache.
+
+        Args:
+            session_id: Sessão a descartar; se None, limpa todo o cache
+        """
+        if session_id is None:
+            self._types_cache.clear()
+        else:
+            self._types_cache.pop(session_id, None)
+
+    def invalidate_statistics_cache(self, session_id: Optional[str] = None) -> None:
+        """
+        Descarta estatísticas em cache.
+
+        Args:
+            session_id: Sessão a descartar; se None, limpa todo o cache
+        """
+        if session_id is None:
+            self._stats_cache.clear()
+            return
+
+        for key in [k for k in self._stats_cache if k[1] == session_id]:
+            del self._stats_cache[key]
+
+    def _get_watermark(self, cursor, session_id: str) -> tuple:
+        """
+        Obtém marca d'água dos dados da sessão (último timestamp e total).
+
+        Qualquer nova leitura altera a marca, invalidando o cache.
+
+        Args:
+            cursor: Cursor Oracle
+            session_id: Identificador da sessão
+
+        Returns:
+            tuple: (timestamp mais recente, número de leituras)
+        """
+        cursor.execute(self._queries['get_watermark'], session_id=session_id)
+        return tuple(cursor.fetchone())
+
+    def _cache_lookup(self, key: tuple, watermark: tuple) -> Optional[Any]:
+        """
+        Busca resultado em cache ainda válido para a marca d'água.
+
+        Args:
+            key: Chave do resultado
+            watermark: Marca d'água atual da sessão
+
+        Returns:
+            Any: Resultado em cache ou None se ausente/desatualizado
+        """
+        entry = self._stats_cache.get(key)
+        if entry is None or entry[0] != watermark:
+            return None
+        return entry[1]
+
+    def _cache_store(self, key: tuple, watermark: tuple, result: Any) -> None:
+        """
+        Armazena resultado em cache, descartando o mais antigo se cheio.
+
+        Args:
+            key: Chave do resultado
+            watermark: Marca d'água da sessão no cálculo
+            result: Resultado calculado
+        """
+        self._stats_cache.pop(key, None)
+        if len(self._stats_cache) >= STATS_CACHE_SIZE:
+            del self._stats_cache[next(iter(self._stats_cache))]
+        self._stats_cache[key] = (watermark, result)
+
+    def _query_cursor(self, conn, arraysize: Optional[int] = None):
+        """
+        Cria cursor de consulta com busca de linhas em lotes grandes.
+
+        Args:
+            conn: Conexão Oracle
+            arraysize: Linhas por ida ao servidor (padrão: self.arraysize)
+
+        Returns:
+            Cursor: Cursor configurado
+        """
+        cursor = conn.cursor()
+        cursor.arraysize = arraysize or self.arraysize
+        # prefetchrows acima de arraysize evita uma ida extra ao servidor
+        cursor.prefetchrows = cursor.arraysize + 1
+        return cursor
+
+    def _iter_rows(self, query_key: str, **params) -> Iterator[Dict[str, Any]]:
+        """
+        Executa consulta e entrega as linhas em lotes via fetchmany.
+
+        A conexão permanece em uso até o fim da iteração.
+
+        Args:
+            query_key: Chave da consulta em self._queries e self._columns
+            **params: Parâmetros da consulta
+
+        Yields:
+            Dict: Linha convertida em dicionário
+
+        Raises:
+            RuntimeError: Se ocorrer erro ao consultar dados
+        """
+        if not self.connector.initialized and not self.connector.initialize():
+            raise RuntimeError("Conector Oracle não está inicializado")
+
+        columns = self._columns[query_key]
+
+        try:
+            with self.connector.get_connection() as conn:
+                cursor = self._query_cursor(conn)
+                cursor.execute(self._queries[query_key], params)
+
+                while True:
+                    rows = cursor.fetchmany(cursor.arraysize)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield dict(zip(columns, row))
+
+        except cx_Oracle.Error as e:
+            error_obj, = e.args
+            logger.error(f"Erro ao percorrer dados de sensores ({query_key}): "
+                       f"{error_obj.message}")
+            raise RuntimeError(f"Falha ao consultar dados: {error_obj.message}") from e
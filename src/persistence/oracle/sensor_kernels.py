@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Funções numéricas vetorizadas para séries de sensores.
+
+Operam sobre os arrays float64 retornados por SensorDAO.get_sensor_arrays,
+evitando laços Python no pós-processamento das leituras (médias móveis,
+normalização e detecção de trechos acima de um limiar).
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _as_values(values) -> np.ndarray:
+    """
+    Garante um array float64 contíguo para os cálculos.
+
+    Args:
+        values: Sequência de valores do sensor
+
+    Returns:
+        np.ndarray: Array float64 unidimensional
+    """
+    return np.ascontiguousarray(values, dtype=np.float64).ravel()
+
+
+def rolling_mean(values, window: int) -> np.ndarray:
+    """
+    Calcula a média móvel com janela fixa.
+
+    Cada janela é somada de forma independente sobre uma visão deslizante
+    (sem cópia): uma leitura NaN afeta apenas as janelas que a contêm, e a
+    média não acumula o cancelamento de somas acumuladas em valores grandes.
+    As primeiras window - 1 posições, sem janela completa, recebem NaN.
+
+    Args:
+        values: Valores do sensor em ordem temporal
+        window: Número de leituras por janela
+
+    Returns:
+        np.ndarray: Médias móveis, com o mesmo tamanho da entrada
+
+    Raises:
+        ValueError: Se a janela não for positiva
+    """
+    if window < 1:
+        raise ValueError("Janela deve ser um inteiro positivo")
+
+    values = _as_values(values)
+    result = np.full(values.shape, np.nan)
+    if values.size < window:
+        return result
+
+    result[window - 1:] = sliding_window_view(values, window).mean(axis=-1)
+    return result
+
+
+def zscore(values) -> np.ndarray:
+    """
+    Normaliza os valores pelo desvio em relação à média.
+
+    Média e desvio padrão ignoram leituras NaN, que permanecem NaN no
+    resultado. Séries constantes (desvio padrão zero) resultam em zeros e
+    séries sem nenhuma leitura válida, em NaN.
+
+    Args:
+        values: Valores do sensor
+
+    Returns:
+        np.ndarray: Escores z de cada leitura
+    """
+    values = _as_values(values)
+    valid = values[~np.isnan(values)]
+    if valid.size == 0:
+        return values.copy()
+
+    std = valid.std()
+    if std == 0:
+        return np.where(np.isnan(values), np.nan, 0.0)
+    return (values - valid.mean()) / std
+
+
+def above_threshold_runs(values, threshold: float) -> np.ndarray:
+    """
+    Localiza trechos contínuos de leituras acima de um limiar.
+
+    Args:
+        values: Valores do sensor em ordem temporal
+        threshold: Limiar a ser excedido
+
+    Returns:
+        np.ndarray: Array (n, 2) de índices [início, fim) de cada trecho
+    """
+    above = _as_values(values) > threshold
+
+    # Bordas de subida/descida na máscara delimitam cada trecho
+    edges = np.diff(above.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return np.column_stack((starts, ends))
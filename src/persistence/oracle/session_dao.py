@@ -10,18 +10,79 @@ de análise de perdas na colheita de cana-de-açúcar.
 """
 
 import logging
+import time
 import uuid
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Iterable, Iterator
 
-import cx_Oracle
+import oracledb as cx_Oracle
 
 from persistence.oracle.connector import OracleConnector
-from persistence.oracle.error_handler import with_error_handling, with_retry
+from persistence.oracle.error_handler import (
+    OptimisticLockConflict, with_error_handling, with_optimistic_retry,
+    with_retry
+)
 
 # Configuração de logging
 logger = logging.getLogger(__name__)
 
+# Statements mantidos no cache de cada conexão (cobre todas as queries do DAO)
+STMT_CACHE_SIZE = 20
+
+# Linhas por ida ao servidor nas listagens de sessões (o padrão do driver é 100)
+DEFAULT_ARRAYSIZE = 1000
+
+# Status aceitos na atualização e no encerramento de sessões
+VALID_UPDATE_STATUSES = frozenset({'active', 'paused', 'completed', 'aborted'})
+VALID_END_STATUSES = frozenset({'completed', 'aborted'})
+
+# Mensagens de status inválido (constantes, montadas uma única vez)
+INVALID_UPDATE_STATUS_MSG = (
+    "Status inválido. Use um dos: active, paused, completed, aborted"
+)
+INVALID_END_STATUS_MSG = (
+    "Status inválido para encerramento. Use um dos: completed, aborted"
+)
+
+# Cache de sessões lidas: máximo de entradas e validade (segundos)
+SESSION_CACHE_SIZE = 1024
+SESSION_CACHE_TTL = 5.0
+
+_UTC = timezone.utc
+
+
+def _now() -> datetime:
+    """
+    Retorna o instante atual em UTC, sem fuso anexado.
+
+    As colunas de data de sessions são TIMESTAMP WITH TIME ZONE, mas o
+    cx_Oracle descarta o tzinfo no bind; por isso o valor é enviado como
+    hora UTC "ingênua" e as queries o marcam com FROM_TZ(..., 'UTC'),
+    evitando ambiguidades em transições de horário de verão.
+
+    Returns:
+        datetime: Hora UTC atual
+    """
+    return datetime.fromtimestamp(time.time(), _UTC).replace(tzinfo=None)
+
+
+def _to_utc(value: datetime) -> datetime:
+    """
+    Converte um datetime para hora UTC sem fuso, como esperado nos binds.
+
+    Valores com fuso são convertidos para UTC; valores sem fuso são
+    considerados já em UTC, como os gravados por _now.
+
+    Args:
+        value: Data a converter
+
+    Returns:
+        datetime: Hora UTC sem tzinfo
+    """
+    if value.tzinfo is not None:
+        return value.astimezone(_UTC).replace(tzinfo=None)
+    return value
+
 
 class SessionDAO:
     """
@@ -31,14 +92,25 @@ class SessionDAO:
     de coleta de dados no banco Oracle.
     """
 
-    def __init__(self, connector: OracleConnector):
+    def __init__(self, connector: OracleConnector,
+                 arraysize: int = DEFAULT_ARRAYSIZE):
         """
         Inicializa DAO com conector Oracle.
 
         Args:
             connector: Conector Oracle já inicializado
+            arraysize: Linhas buscadas por ida ao servidor nas listagens
         """
         self.connector = connector
+        self.arraysize = arraysize
+
+        # Inicializa o conector uma única vez; se falhar aqui, a primeira
+        # obtenção de conexão tenta novamente
+        if not connector.initialized:
+            connector.initialize()
+
+        # Cache de get_session: session_id -> (instante de expiração, dados)
+        self._session_cache = {}
 
         # Queries SQL para operações comuns
         self._queries = {
@@ -47,8 +119,10 @@ class SessionDAO:
                     session_id, start_timestamp, status,
                     created_by, last_updated, version
                 ) VALUES (
-                    :session_id, :start_timestamp, :status,
-                    :created_by, :last_updated, 1
+                    :session_id,
+                    FROM_TZ(CAST(:start_timestamp AS TIMESTAMP), 'UTC'),
+                    :status, :created_by,
+                    FROM_TZ(CAST(:last_updated AS TIMESTAMP), 'UTC'), 1
                 )
             """,
             'get_by_id': """
@@ -61,38 +135,80 @@ class SessionDAO:
             'update_status': """
                 UPDATE sessions
                 SET status = :status,
-                    last_updated = :last_updated,
+                    last_updated = FROM_TZ(CAST(:last_updated AS TIMESTAMP), 'UTC'),
                     version = version + 1
                 WHERE session_id = :session_id
-                  AND version = :version
+                  AND (:version IS NULL OR version = :version)
+                  AND (:start_timestamp IS NULL OR start_timestamp =
+                       FROM_TZ(CAST(:start_timestamp AS TIMESTAMP), 'UTC'))
+                  AND (:created_by IS NULL OR created_by = :created_by)
+                RETURNING version INTO :new_version
             """,
             'end_session': """
                 UPDATE sessions
-                SET end_timestamp = :end_timestamp,
+                SET end_timestamp = FROM_TZ(CAST(:end_timestamp AS TIMESTAMP), 'UTC'),
                     status = :status,
-                    last_updated = :last_updated,
+                    last_updated = FROM_TZ(CAST(:last_updated AS TIMESTAMP), 'UTC'),
                     version = version + 1
                 WHERE session_id = :session_id
-                  AND version = :version
+                  AND (:version IS NULL OR version = :version)
+                  AND (:start_timestamp IS NULL OR start_timestamp =
+                       FROM_TZ(CAST(:start_timestamp AS TIMESTAMP), 'UTC'))
+                  AND (:created_by IS NULL OR created_by = :created_by)
+                  AND end_timestamp IS NULL
+                  AND (status IS NULL OR status NOT IN ('completed', 'aborted'))
+                RETURNING version INTO :new_version
             """,
+            'update_status_bulk': """
+                UPDATE sessions
+                SET status = :status,
+                    last_updated = FROM_TZ(CAST(:last_updated AS TIMESTAMP), 'UTC'),
+                    version = version + 1
+                WHERE session_id = :session_id
+            """,
+            'end_session_bulk': """
+                UPDATE sessions
+                SET end_timestamp = FROM_TZ(CAST(:end_timestamp AS TIMESTAMP), 'UTC'),
+                    status = :status,
+                    last_updated = FROM_TZ(CAST(:last_updated AS TIMESTAMP), 'UTC'),
+                    version = version + 1
+                WHERE session_id = :session_id
+                  AND end_timestamp IS NULL
+                  AND (status IS NULL OR status NOT IN ('completed', 'aborted'))
+            """,
+            # Expressão idêntica à de idx_sessions_active: a varredura do
+            # índice retorna só sessões ativas, já na ordem desejada
             'list_active': """
                 SELECT
                     session_id, start_timestamp, status,
                     created_by, last_updated
                 FROM sessions
-                WHERE status = 'active'
-                ORDER BY start_timestamp DESC
+                WHERE CASE WHEN status = 'active' THEN start_timestamp END IS NOT NULL
+                ORDER BY CASE WHEN status = 'active' THEN start_timestamp END DESC
             """,
             'list_by_date_range': """
                 SELECT
                     session_id, start_timestamp, end_timestamp,
                     status, created_by, last_updated
                 FROM sessions
-                WHERE start_timestamp BETWEEN :start_date AND :end_date
+                WHERE start_timestamp
+                    BETWEEN FROM_TZ(CAST(:start_date AS TIMESTAMP), 'UTC')
+                        AND FROM_TZ(CAST(:end_date AS TIMESTAMP), 'UTC')
                 ORDER BY start_timestamp DESC
             """
         }
 
+        # Nomes das colunas retornadas por cada consulta, na ordem do SELECT
+        self._columns = {
+            'get_by_id': ('session_id', 'start_timestamp', 'end_timestamp',
+                          'status', 'created_by', 'last_updated', 'version'),
+            'list_active': ('session_id', 'start_timestamp', 'status',
+                            'created_by', 'last_updated'),
+            'list_by_date_range': ('session_id', 'start_timestamp',
+                                   'end_timestamp', 'status', 'created_by',
+                                   'last_updated')
+        }
+
     @with_error_handling
     @with_retry()
     def create_session(self, metadata: Optional[Dict[str, Any]] = None) -> str:
@@ -111,36 +227,31 @@ class SessionDAO:
         Raises:
             RuntimeError: Se ocorrer erro ao criar sessão
         """
-        if not self.connector.initialized and not self.connector.initialize():
-            raise RuntimeError("Conector Oracle não está inicializado")
-
         metadata = metadata or {}
         session_id = metadata.get('session_id') or self._generate_session_id()
         created_by = metadata.get('created_by', 'system')
-        timestamp = datetime.now()
+        timestamp = _now()
 
         try:
             with self.connector.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Verifica se sessão já existe
-                cursor.execute(
-                    self._queries['get_by_id'],
-                    session_id=session_id
-                )
-
-                if cursor.fetchone():
-                    raise ValueError(f"Sessão {session_id} já existe")
-
-                # Insere nova sessão
-                cursor.execute(
-                    self._queries['create'],
-                    session_id=session_id,
-                    start_timestamp=timestamp,
-                    status='active',
-                    created_by=created_by,
-                    last_updated=timestamp
-                )
+                cursor = self._prepared_cursor(conn, 'create')
+
+                # Insere nova sessão; a chave primária detecta duplicidade
+                # sem consulta prévia (e sem janela entre verificar e inserir)
+                try:
+                    cursor.execute(
+                        None,
+                        session_id=session_id,
+                        start_timestamp=timestamp,
+                        status='active',
+                        created_by=created_by,
+                        last_updated=timestamp
+                    )
+                except cx_Oracle.IntegrityError as e:
+                    error_obj, = e.args
+                    if error_obj.code == 1:  # ORA-00001: unique constraint
+                        raise ValueError(f"Sessão {session_id} já existe") from e
+                    raise
 
                 conn.commit()
                 logger.info(f"Sessão {session_id} criada com sucesso")
@@ -156,6 +267,9 @@ class SessionDAO:
         """
         Recupera informações de uma sessão específica.
 
+        Sessões encontradas ficam em cache por SESSION_CACHE_TTL segundos;
+        alterações feitas por este DAO descartam a entrada imediatamente.
+
         Args:
             session_id: Identificador da sessão
 
@@ -165,97 +279,108 @@ class SessionDAO:
         Raises:
             RuntimeError: Se ocorrer erro ao consultar sessão
         """
-        if not self.connector.initialized and not self.connector.initialize():
-            raise RuntimeError("Conector Oracle não está inicializado")
+        entry = self._session_cache.get(session_id)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                return dict(entry[1])
+            self._session_cache.pop(session_id, None)
 
         try:
             with self.connector.get_connection() as conn:
-                cursor = conn.cursor()
-
-                cursor.execute(
-                    self._queries['get_by_id'],
-                    session_id=session_id
-                )
+                cursor = self._prepared_cursor(conn, 'get_by_id')
+                cursor.execute(None, session_id=session_id)
 
                 row = cursor.fetchone()
                 if not row:
                     return None
 
                 # Converte resultado para dicionário
-                column_names = [col[0].lower() for col in cursor.description]
-                return dict(zip(column_names, row))
+                session_data = dict(zip(self._columns['get_by_id'], row))
 
         except cx_Oracle.Error as e:
             error_obj, = e.args
             logger.error(f"Erro ao consultar sessão {session_id}: {error_obj.message}")
             raise RuntimeError(f"Falha ao consultar sessão: {error_obj.message}") from e
 
+        if len(self._session_cache) >= SESSION_CACHE_SIZE:
+            del self._session_cache[next(iter(self._session_cache))]
+        self._session_cache[session_id] = (
+            time.monotonic() + SESSION_CACHE_TTL, session_data
+        )
+        return dict(session_data)
+
+    def invalidate_session_cache(self, session_id: Optional[str] = None) -> None:
+        """
+        Descarta sessões em cache.
+
+        Args:
+            session_id: Sessão a descartar; se None, limpa todo o cache
+        """
+        if session_id is None:
+            self._session_cache.clear()
+        else:
+            self._session_cache.pop(session_id, None)
+
     @with_error_handling
     @with_retry()
-    def update_status(self, session_id: str, status: str) -> bool:
+    def update_status(self, session_id: str, status: str,
+                      expected_version: Optional[int] = None,
+                      expected_session: Optional[Dict[str, Any]] = None) -> bool:
         """
         Atualiza status de uma sessão.
 
-        Utiliza versioning para controle de concorrência otimista.
+        Executa um único UPDATE, sem leitura prévia da sessão. Para controle
+        de concorrência otimista, informe a versão lida pelo chamador em
+        expected_version, ou a sessão lida (get_session) em expected_session
+        para verificar também start_timestamp e created_by; a atualização só
+        ocorre se esses valores ainda forem os atuais.
 
         Args:
             session_id: Identificador da sessão
             status: Novo status (active, paused, completed, aborted)
+            expected_version: Versão esperada da sessão (opcional)
+            expected_session: Dados da sessão lidos pelo chamador (opcional)
 
         Returns:
             bool: True se atualização bem-sucedida, False caso contrário
 
         Raises:
+            OptimisticLockConflict: Se os valores esperados não forem os atuais
+            ValueError: Se expected_session não tiver os campos verificados
             RuntimeError: Se ocorrer erro ao atualizar sessão
         """
-        if not self.connector.initialized and not self.connector.initialize():
-            raise RuntimeError("Conector Oracle não está inicializado")
-
         # Valida status
-        valid_statuses = ['active', 'paused', 'completed', 'aborted']
-        if status not in valid_statuses:
-            raise ValueError(f"Status inválido. Use um dos: {', '.join(valid_statuses)}")
+        if status not in VALID_UPDATE_STATUSES:
+            raise ValueError(INVALID_UPDATE_STATUS_MSG)
+
+        expected = self._expected_values(expected_version, expected_session)
 
         try:
             with self.connector.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Primeiro consulta dados atuais para obter versão
-                cursor.execute(
-                    self._queries['get_by_id'],
-                    session_id=session_id
-                )
+                cursor = self._prepared_cursor(conn, 'update_status')
+                new_version = cursor.var(int)
 
-                row = cursor.fetchone()
-                if not row:
-                    logger.warning(f"Sessão {session_id} não encontrada")
-                    return False
-
-                # Extrai versão atual
-                column_names = [col[0].lower() for col in cursor.description]
-                session_data = dict(zip(column_names, row))
-                current_version = session_data.get('version', 1)
-
-                # Atualiza status com controle de versão
-                timestamp = datetime.now()
+                # Atualiza status com controle de versão opcional
+                timestamp = _now()
                 cursor.execute(
-                    self._queries['update_status'],
+                    None,
                     session_id=session_id,
                     status=status,
                     last_updated=timestamp,
-                    version=current_version
+                    new_version=new_version,
+                    **expected
                 )
 
                 # Verifica se realmente atualizou
                 if cursor.rowcount == 0:
-                    logger.warning(
-                        f"Conflito de concorrência ao atualizar sessão {session_id}. "
-                        f"Versão atual diferente de {current_version}."
-                    )
+                    self._handle_update_miss(cursor, session_id, expected,
+                                             "atualizar")
                     return False
 
                 conn.commit()
-                logger.info(f"Status da sessão {session_id} atualizado para {status}")
+                self._session_cache.pop(session_id, None)
+                logger.info(f"Status da sessão {session_id} atualizado para {status} "
+                          f"(versão {new_version.getvalue()[0]})")
                 return True
 
         except cx_Oracle.Error as e:
@@ -265,79 +390,63 @@ class SessionDAO:
 
     @with_error_handling
     @with_retry()
-    def end_session(self, session_id: str, status: str = 'completed') -> bool:
+    def end_session(self, session_id: str, status: str = 'completed',
+                    expected_version: Optional[int] = None,
+                    expected_session: Optional[Dict[str, Any]] = None) -> bool:
         """
         Encerra uma sessão de coleta de dados.
 
-        Define timestamp de término e status final da sessão.
+        Define timestamp de término e status final da sessão. A verificação
+        de sessão já encerrada faz parte do próprio UPDATE, evitando leitura
+        prévia da sessão. O controle de concorrência segue update_status.
 
         Args:
             session_id: Identificador da sessão
             status: Status final (completed ou aborted)
+            expected_version: Versão esperada da sessão (opcional)
+            expected_session: Dados da sessão lidos pelo chamador (opcional)
 
         Returns:
             bool: True se encerramento bem-sucedido, False caso contrário
 
         Raises:
+            OptimisticLockConflict: Se os valores esperados não forem os atuais
+            ValueError: Se expected_session não tiver os campos verificados
             RuntimeError: Se ocorrer erro ao encerrar sessão
         """
-        if not self.connector.initialized and not self.connector.initialize():
-            raise RuntimeError("Conector Oracle não está inicializado")
-
         # Valida status
-        valid_statuses = ['completed', 'aborted']
-        if status not in valid_statuses:
-            raise ValueError(f"Status inválido para encerramento. Use um dos: "
-                            f"{', '.join(valid_statuses)}")
+        if status not in VALID_END_STATUSES:
+            raise ValueError(INVALID_END_STATUS_MSG)
+
+        expected = self._expected_values(expected_version, expected_session)
 
         try:
             with self.connector.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self._prepared_cursor(conn, 'end_session')
+                new_version = cursor.var(int)
 
-                # Primeiro consulta dados atuais para verificar se pode encerrar
+                # Encerra sessão apenas se ainda não estiver encerrada
+                timestamp = _now()
                 cursor.execute(
-                    self._queries['get_by_id'],
-                    session_id=session_id
-                )
-
-                row = cursor.fetchone()
-                if not row:
-                    logger.warning(f"Sessão {session_id} não encontrada")
-                    return False
-
-                # Extrai dados atuais
-                column_names = [col[0].lower() for col in cursor.description]
-                session_data = dict(zip(column_names, row))
-                current_version = session_data.get('version', 1)
-                current_status = session_data.get('status')
-                end_timestamp = session_data.get('end_timestamp')
-
-                # Verifica se já está encerrada
-                if end_timestamp is not None or current_status in ['completed', 'aborted']:
-                    logger.warning(f"Sessão {session_id} já está encerrada")
-                    return False
-
-                # Encerra sessão
-                timestamp = datetime.now()
-                cursor.execute(
-                    self._queries['end_session'],
+                    None,
                     session_id=session_id,
                     end_timestamp=timestamp,
                     status=status,
                     last_updated=timestamp,
-                    version=current_version
+                    new_version=new_version,
+                    **expected
                 )
 
                 # Verifica se realmente atualizou
                 if cursor.rowcount == 0:
-                    logger.warning(
-                        f"Conflito de concorrência ao encerrar sessão {session_id}. "
-                        f"Versão atual diferente de {current_version}."
-                    )
+                    self._handle_update_miss(cursor, session_id, expected,
+                                             "encerrar")
                     return False
 
                 conn.commit()
-                logger.info(f"Sessão {session_id} encerrada com status {status}")
+                self._session_cache.pop(session_id, None)
+                logger.info(f"Sessão {session_id} encerrada com status {status} "
+                          f"(versão {new_version.getvalue()[0]})")
                 return True
 
         except cx_Oracle.Error as e:
@@ -345,6 +454,221 @@ class SessionDAO:
             logger.error(f"Erro ao encerrar sessão {session_id}: {error_obj.message}")
             raise RuntimeError(f"Falha ao encerrar sessão: {error_obj.message}") from e
 
+    @with_optimistic_retry()
+    def transition_status(self, session_id: str, status: str,
+                          allowed_from: Iterable[str]) -> bool:
+        """
+        Muda o status de uma sessão apenas a partir de status permitidos.
+
+        Lê a sessão, verifica o status atual e atualiza com a sessão lida
+        como valor esperado. Se outro escritor alterar a sessão entre a
+        leitura e o UPDATE, o conflito descarta a sessão do cache e a
+        operação inteira é repetida com uma nova leitura.
+
+        Args:
+            session_id: Identificador da sessão
+            status: Novo status (active, paused, completed, aborted)
+            allowed_from: Status atuais a partir dos quais a mudança é aceita
+
+        Returns:
+            bool: True se o status foi alterado, False se a sessão não existe
+                ou o status atual não permite a mudança
+
+        Raises:
+            OptimisticLockConflict: Se o conflito persistir após as tentativas
+            ValueError: Se o status for inválido
+            RuntimeError: Se ocorrer erro ao consultar ou atualizar a sessão
+        """
+        session = self.get_session(session_id)
+        if session is None:
+            logger.warning(f"Sessão {session_id} não encontrada")
+            return False
+
+        if session['status'] not in allowed_from:
+            logger.warning(f"Sessão {session_id} com status {session['status']} "
+                           f"não pode passar para {status}")
+            return False
+
+        return self.update_status(session_id, status, expected_session=session)
+
+    @staticmethod
+    def _expected_values(expected_version: Optional[int],
+                         expected_session: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Monta os binds de verificação de concorrência otimista.
+
+        Com expected_session, todos os valores verificados são obrigatórios:
+        um campo ausente não pode ser substituído por um padrão, pois o
+        UPDATE passaria a aceitar uma linha desatualizada.
+
+        Args:
+            expected_version: Versão esperada da sessão
+            expected_session: Dados da sessão lidos pelo chamador
+
+        Returns:
+            Dict: Binds version, start_timestamp e created_by (None = não verifica)
+
+        Raises:
+            ValueError: Se expected_session não tiver os campos verificados
+        """
+        if expected_session is None:
+            return {'version': expected_version, 'start_timestamp': None,
+                    'created_by': None}
+
+        try:
+            return {
+                'version': expected_session['version'],
+                'start_timestamp': expected_session['start_timestamp'],
+                'created_by': expected_session['created_by']
+            }
+        except KeyError as e:
+            raise ValueError(f"Sessão esperada sem o campo {e.args[0]}") from e
+
+    def _handle_update_miss(self, cursor, session_id: str,
+                            expected: Dict[str, Any], action: str) -> None:
+        """
+        Trata um UPDATE que não alterou nenhuma linha.
+
+        A sessão só é consultada neste caminho de exceção, para distinguir
+        sessão inexistente, conflito de concorrência e sessão já encerrada.
+
+        Args:
+            cursor: Cursor da conexão atual
+            session_id: Identificador da sessão
+            expected: Valores esperados (binds de _expected_values)
+            action: Operação tentada, para a mensagem de log
+
+        Raises:
+            OptimisticLockConflict: Se algum valor atual diferir do esperado
+        """
+        # A sessão em cache pode estar desatualizada em relação ao banco
+        self._session_cache.pop(session_id, None)
+
+        cursor.execute(self._queries['get_by_id'], session_id=session_id)
+        row = cursor.fetchone()
+        if not row:
+            logger.warning(f"Sessão {session_id} não encontrada")
+            return
+
+        current = dict(zip(self._columns['get_by_id'], row))
+        changed = [
+            field for field, value in expected.items()
+            if value is not None and current[field] != value
+        ]
+        if changed:
+            raise OptimisticLockConflict(
+                f"Conflito de concorrência ao {action} sessão {session_id}. "
+                f"Valores alterados: {', '.join(changed)} "
+                f"(versão atual {current['version']}).",
+                current_version=current['version']
+            )
+
+        logger.warning(f"Sessão {session_id} já está encerrada")
+
+    @with_error_handling
+    @with_retry()
+    def update_statuses_bulk(self, updates: List[tuple]) -> int:
+        """
+        Atualiza o status de várias sessões em uma única ida ao servidor.
+
+        Destinado a rotinas de manutenção; não aplica controle de versão.
+
+        Args:
+            updates: Pares (session_id, status)
+
+        Returns:
+            int: Número de sessões atualizadas
+
+        Raises:
+            RuntimeError: Se ocorrer erro ao atualizar sessões
+        """
+        if not VALID_UPDATE_STATUSES.issuperset(status for _, status in updates):
+            raise ValueError(INVALID_UPDATE_STATUS_MSG)
+
+        timestamp = _now()
+        params = [
+            {'session_id': session_id, 'status': status, 'last_updated': timestamp}
+            for session_id, status in updates
+        ]
+        return self._execute_bulk('update_status_bulk', params, "atualizar")
+
+    @with_error_handling
+    @with_retry()
+    def end_sessions_bulk(self, session_ids: List[str],
+                          status: str = 'completed') -> int:
+        """
+        Encerra várias sessões em uma única ida ao servidor.
+
+        Sessões inexistentes ou já encerradas são ignoradas.
+
+        Args:
+            session_ids: Identificadores das sessões
+            status: Status final (completed ou aborted)
+
+        Returns:
+            int: Número de sessões encerradas
+
+        Raises:
+            RuntimeError: Se ocorrer erro ao encerrar sessões
+        """
+        if status not in VALID_END_STATUSES:
+            raise ValueError(INVALID_END_STATUS_MSG)
+
+        timestamp = _now()
+        params = [
+            {'session_id': session_id, 'end_timestamp': timestamp,
+             'status': status, 'last_updated': timestamp}
+            for session_id in session_ids
+        ]
+        return self._execute_bulk('end_session_bulk', params, "encerrar")
+
+    def _execute_bulk(self, query_key: str, params: List[Dict[str, Any]],
+                      action: str) -> int:
+        """
+        Executa um UPDATE em lote com executemany e um único commit.
+
+        Linhas com erro são registradas sem invalidar o restante do lote.
+
+        Args:
+            query_key: Chave da query em self._queries
+            params: Binds de cada linha
+            action: Operação executada, para as mensagens de log
+
+        Returns:
+            int: Número de sessões alteradas
+
+        Raises:
+            RuntimeError: Se ocorrer erro ao executar o lote
+        """
+        if not params:
+            return 0
+
+        try:
+            with self.connector.get_connection() as conn:
+                cursor = self._prepared_cursor(conn, query_key)
+                cursor.executemany(None, params, batcherrors=True,
+                                   arraydmlrowcounts=True)
+
+                for error in cursor.getbatcherrors():
+                    logger.warning(
+                        f"Erro ao {action} sessão "
+                        f"{params[error.offset]['session_id']}: {error.message}"
+                    )
+
+                changed = sum(cursor.getarraydmlrowcounts())
+                conn.commit()
+
+        except cx_Oracle.Error as e:
+            error_obj, = e.args
+            logger.error(f"Erro ao {action} sessões em lote: {error_obj.message}")
+            raise RuntimeError(f"Falha ao {action} sessões: {error_obj.message}") from e
+
+        for row in params:
+            self._session_cache.pop(row['session_id'], None)
+
+        logger.info(f"{changed} de {len(params)} sessões processadas ao {action} em lote")
+        return changed
+
     @with_error_handling
     def list_active_sessions(self) -> List[Dict[str, Any]]:
         """
@@ -356,22 +680,15 @@ class SessionDAO:
         Raises:
             RuntimeError: Se ocorrer erro ao listar sessões
         """
-        if not self.connector.initialized and not self.connector.initialize():
-            raise RuntimeError("Conector Oracle não está inicializado")
-
         try:
             with self.connector.get_connection() as conn:
-                cursor = conn.cursor()
-
-                cursor.execute(self._queries['list_active'])
-
-                rows = cursor.fetchall()
-                if not rows:
-                    return []
+                cursor = self._prepared_cursor(conn, 'list_active',
+                                               arraysize=self.arraysize)
+                cursor.execute(None)
 
                 # Converte resultado para lista de dicionários
-                column_names = [col[0].lower() for col in cursor.description]
-                return [dict(zip(column_names, row)) for row in rows]
+                columns = self._columns['list_active']
+                return [dict(zip(columns, row)) for row in cursor.fetchall()]
 
         except cx_Oracle.Error as e:
             error_obj, = e.args
@@ -387,8 +704,8 @@ class SessionDAO:
         Útil para análises históricas e relatórios de período.
 
         Args:
-            start_date: Data inicial
-            end_date: Data final
+            start_date: Data inicial (sem fuso, interpretada como UTC)
+            end_date: Data final (sem fuso, interpretada como UTC)
 
         Returns:
             List: Lista de sessões no intervalo
@@ -396,32 +713,76 @@ class SessionDAO:
         Raises:
             RuntimeError: Se ocorrer erro ao consultar sessões
         """
-        if not self.connector.initialized and not self.connector.initialize():
-            raise RuntimeError("Conector Oracle não está inicializado")
+        return list(self.iter_sessions_by_date_range(start_date, end_date))
+
+    def iter_sessions_by_date_range(self, start_date: datetime,
+                                    end_date: datetime) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre sessões de um intervalo de datas sem materializá-las.
+
+        As linhas chegam do servidor em lotes de arraysize; apenas o lote
+        corrente fica em memória. A conexão permanece em uso até o fim da
+        iteração.
+
+        Args:
+            start_date: Data inicial (sem fuso, interpretada como UTC)
+            end_date: Data final (sem fuso, interpretada como UTC)
+
+        Yields:
+            Dict: Dados da sessão
+
+        Raises:
+            RuntimeError: Se ocorrer erro ao consultar sessões
+        """
+        columns = self._columns['list_by_date_range']
 
         try:
             with self.connector.get_connection() as conn:
-                cursor = conn.cursor()
-
+                cursor = self._prepared_cursor(conn, 'list_by_date_range',
+                                               arraysize=self.arraysize)
                 cursor.execute(
-                    self._queries['list_by_date_range'],
-                    start_date=start_date,
-                    end_date=end_date
+                    None,
+                    start_date=_to_utc(start_date),
+                    end_date=_to_utc(end_date)
                 )
 
-                rows = cursor.fetchall()
-                if not rows:
-                    return []
-
-                # Converte resultado para lista de dicionários
-                column_names = [col[0].lower() for col in cursor.description]
-                return [dict(zip(column_names, row)) for row in rows]
+                for row in cursor:
+                    yield dict(zip(columns, row))
 
         except cx_Oracle.Error as e:
             error_obj, = e.args
             logger.error(f"Erro ao listar sessões por data: {error_obj.message}")
             raise RuntimeError(f"Falha ao listar sessões: {error_obj.message}") from e
 
+    def _prepared_cursor(self, conn, query_key: str,
+                         arraysize: Optional[int] = None):
+        """
+        Cria cursor com um statement do DAO já preparado.
+
+        Garante que o cache de statements da conexão comporte todas as
+        queries do DAO, de modo que o preparo reaproveite o parse anterior
+        do mesmo texto SQL. O cursor é executado com statement None.
+
+        Args:
+            conn: Conexão Oracle
+            query_key: Chave da query em self._queries
+            arraysize: Linhas por ida ao servidor (padrão do driver se None)
+
+        Returns:
+            Cursor: Cursor com o statement preparado
+        """
+        if getattr(conn, 'stmtcachesize', STMT_CACHE_SIZE) < STMT_CACHE_SIZE:
+            conn.stmtcachesize = STMT_CACHE_SIZE
+
+        cursor = conn.cursor()
+        if arraysize is not None:
+            # Deve ser definido antes do execute; a pré-busca cobre o lote
+            # inteiro já na primeira ida ao servidor
+            cursor.arraysize = arraysize
+            cursor.prefetchrows = arraysize + 1
+        cursor.prepare(self._queries[query_key])
+        return cursor
+
     def _generate_session_id(self) -> str:
         """
         Gera identificador único para sessão.
@@ -431,8 +792,8 @@ class SessionDAO:
         Returns:
             str: Identificador único para sessão
         """
-        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
-        unique_id = str(uuid.uuid4())[:8]  # Primeiros 8 caracteres do UUID
+        timestamp = time.strftime('%Y%m%d-%H%M%S')
+        unique_id = uuid.uuid4().hex[:8]  # 8 dígitos hex, sem formatar o UUID
         return f"{timestamp}-{unique_id}"
 
     def validate_session(self, session_id: str) -> bool:
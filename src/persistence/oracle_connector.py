@@ -2,24 +2,304 @@
 # -*- coding: utf-8 -*-
 
 # Sistema de Persistência
-import cx_Oracle
-from datetime import datetime
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+
+# Configuração de logging
+logger = logging.getLogger(__name__)
+
+# Driver Oracle, importado sob demanda (o modo simulado não o carrega)
+_driver = None
+
+# Pools de sessões compartilhados entre instâncias, por (usuário, dsn)
+_pools = {}
+_pools_lock = threading.Lock()
+
+# Limite de saves simultâneos em save_session_data
+MAX_EXPORT_WORKERS = 5
+
+# Larguras (em bytes) das colunas VARCHAR2, usadas no DDL e nos binds
+SESSION_ID_WIDTH = 50
+STATUS_WIDTH = 20
+SENSOR_TYPE_WIDTH = 30
+UNIT_WIDTH = 10
+CATEGORY_WIDTH = 30
+SOURCE_WIDTH = 50
+GAS_WIDTH = 10
+CALCULATION_METHOD_WIDTH = 20
+STOCK_TYPE_WIDTH = 30
+FACTORS_WIDTH = 100
+
+
+def _utc_now():
+    """
+    Retorna o instante atual em UTC, sem fuso anexado.
+
+    Os horários de sessions seguem a convenção de SessionDAO: o bind leva
+    a hora UTC "ingênua" e o SQL a marca com FROM_TZ(..., 'UTC').
+
+    Returns:
+        datetime: Hora UTC atual
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _load_driver():
+    """
+    Importa o driver Oracle na primeira conexão real.
+
+    Usa python-oracledb em modo Thin (sem Oracle Instant Client) e define
+    os padrões de fetch para cursores que não os configuram explicitamente.
+
+    Returns:
+        module: Módulo oracledb
+    """
+    global _driver
+    if _driver is None:
+        import oracledb
+
+        oracledb.defaults.arraysize = 10000
+        oracledb.defaults.prefetchrows = 10001
+        _driver = oracledb
+    return _driver
+
+
+def _get_pool(username, password, dsn, min_sessions, max_sessions,
+              stmt_cache_size):
+    """
+    Obtém (ou cria) o pool de sessões para o usuário e dsn informados.
+
+    Args:
+        username (str): Usuário Oracle
+        password (str): Senha Oracle
+        dsn (str): String de conexão
+        min_sessions (int): Sessões mantidas abertas no pool
+        max_sessions (int): Limite de sessões do pool
+        stmt_cache_size (int): Statements em cache por conexão
+
+    Returns:
+        oracledb.SessionPool: Pool compartilhado
+    """
+    driver = _load_driver()
+    key = (username, dsn)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = driver.SessionPool(
+                user=username,
+                password=password,
+                dsn=dsn,
+                min=min_sessions,
+                max=max_sessions,
+                increment=1,
+                threaded=True,
+                getmode=driver.SPOOL_ATTRVAL_WAIT,
+                stmtcachesize=stmt_cache_size
+            )
+            _pools[key] = pool
+        return pool
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value):
+    """
+    Converte timestamp ISO 8601, reaproveitando strings já convertidas.
+
+    Leituras amostradas em conjunto compartilham o mesmo timestamp.
+
+    Args:
+        value (str): Timestamp em formato ISO 8601
+
+    Returns:
+        datetime: Instante correspondente
+    """
+    return datetime.fromisoformat(value)
+
 
 class OracleConnector:
     """
     Gerencia conexão e persistência com banco de dados Oracle.
     """
 
+    # Comandos SQL fixos: o mesmo texto a cada chamada permite reaproveitar
+    # o cache de statements da conexão
+    _SQL_START_SESSION = """
+            INSERT INTO sessions (session_id, start_timestamp, status)
+            VALUES (:session_id,
+                    FROM_TZ(CAST(:start_timestamp AS TIMESTAMP), 'UTC'),
+                    :status)
+    """
+
+    _SQL_END_SESSION = """
+            UPDATE sessions
+            SET end_timestamp = FROM_TZ(CAST(:end_timestamp AS TIMESTAMP), 'UTC'),
+                status = :status
+            WHERE session_id = :session_id
+    """
+
+    _SQL_INSERT_SENSOR = """
+            INSERT INTO sensor_data
+            (session_id, timestamp, sensor_type, sensor_value, unit)
+            VALUES (:session_id, :timestamp, :sensor_type, :sensor_value, :unit)
+    """
+
+    _SQL_INSERT_GHG = """
+            INSERT INTO ghg_emissions
+            (session_id, timestamp, scope, category, source,
+            gas, value, unit, calculation_method)
+            VALUES
+            (:session_id, :timestamp, :scope, :category, :source,
+            :gas, :value, :unit, :calculation_method)
+    """
+
+    _SQL_INSERT_CARBON = """
+            INSERT INTO carbon_stocks
+            (session_id, timestamp, stock_type, change, amortization_period, unit)
+            VALUES
+            (:session_id, :timestamp, :stock_type, :change,
+            :amortization_period, :unit)
+    """
+
+    _SQL_INSERT_HARVEST = """
+            INSERT INTO harvest_losses
+            (session_id, timestamp, loss_percent, factors)
+            VALUES
+            (:session_id, :timestamp, :loss_percent, :factors)
+    """
+
+    # Gases aceitos em ghg_emissions (demais chaves são metadados)
+    _GHG_GASES = frozenset(('CO2', 'CH4', 'N2O', 'CO2e'))
+
+    # Tipos e tamanhos dos binds, conforme as colunas das tabelas: fixam o
+    # layout dos buffers antes do executemany, sem inspecionar cada linha.
+    # Tipos do driver são indicados pelo nome e resolvidos em _bind_sizes
+    _SIZES_SENSOR = {
+        'session_id': SESSION_ID_WIDTH,
+        'timestamp': 'TIMESTAMP',
+        'sensor_type': SENSOR_TYPE_WIDTH,
+        'sensor_value': 'NUMBER',
+        'unit': UNIT_WIDTH
+    }
+
+    _SIZES_GHG = {
+        'session_id': SESSION_ID_WIDTH,
+        'timestamp': 'TIMESTAMP',
+        'scope': 'NUMBER',
+        'category': CATEGORY_WIDTH,
+        'source': SOURCE_WIDTH,
+        'gas': GAS_WIDTH,
+        'value': 'NUMBER',
+        'unit': UNIT_WIDTH,
+        'calculation_method': CALCULATION_METHOD_WIDTH
+    }
+
+    _SIZES_CARBON = {
+        'session_id': SESSION_ID_WIDTH,
+        'timestamp': 'TIMESTAMP',
+        'stock_type': STOCK_TYPE_WIDTH,
+        'change': 'NUMBER',
+        'amortization_period': 'NUMBER',
+        'unit': UNIT_WIDTH
+    }
+
+    _SIZES_HARVEST = {
+        'session_id': SESSION_ID_WIDTH,
+        'timestamp': 'TIMESTAMP',
+        'loss_percent': 'NUMBER',
+        'factors': FACTORS_WIDTH
+    }
+
+    # Esquemas SQL para criação de tabelas, na ordem que respeita as
+    # referências entre elas
+    _TABLE_SCHEMAS = (
+        ('sessions', f"""
+            CREATE TABLE sessions (
+                session_id VARCHAR2({SESSION_ID_WIDTH}) PRIMARY KEY,
+                start_timestamp TIMESTAMP,
+                end_timestamp TIMESTAMP,
+                status VARCHAR2({STATUS_WIDTH})
+            )
+        """),
+        ('sensor_data', f"""
+            CREATE TABLE sensor_data (
+                id NUMBER GENERATED ALWAYS AS IDENTITY,
+                session_id VARCHAR2({SESSION_ID_WIDTH}),
+                timestamp TIMESTAMP,
+                sensor_type VARCHAR2({SENSOR_TYPE_WIDTH}),
+                sensor_value NUMBER(10,2),
+                unit VARCHAR2({UNIT_WIDTH}),
+                PRIMARY KEY (id),
+                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+            )
+        """),
+        ('ghg_emissions', f"""
+            CREATE TABLE ghg_emissions (
+                id NUMBER GENERATED ALWAYS AS IDENTITY,
+                session_id VARCHAR2({SESSION_ID_WIDTH}),
+                timestamp TIMESTAMP,
+                scope NUMBER(1),
+                category VARCHAR2({CATEGORY_WIDTH}),
+                source VARCHAR2({SOURCE_WIDTH}),
+                gas VARCHAR2({GAS_WIDTH}),
+                value NUMBER(10,2),
+                unit VARCHAR2({UNIT_WIDTH}),
+                calculation_method VARCHAR2({CALCULATION_METHOD_WIDTH}),
+                PRIMARY KEY (id),
+                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+            )
+        """),
+        ('carbon_stocks', f"""
+            CREATE TABLE carbon_stocks (
+                id NUMBER GENERATED ALWAYS AS IDENTITY,
+                session_id VARCHAR2({SESSION_ID_WIDTH}),
+                timestamp TIMESTAMP,
+                stock_type VARCHAR2({STOCK_TYPE_WIDTH}),
+                change NUMBER(10,2),
+                amortization_period NUMBER(3),
+                unit VARCHAR2({UNIT_WIDTH}),
+                PRIMARY KEY (id),
+                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+            )
+        """),
+        ('harvest_losses', f"""
+            CREATE TABLE harvest_losses (
+                id NUMBER GENERATED ALWAYS AS IDENTITY,
+                session_id VARCHAR2({SESSION_ID_WIDTH}),
+                timestamp TIMESTAMP,
+                loss_percent NUMBER(5,2),
+                factors VARCHAR2({FACTORS_WIDTH}),
+                PRIMARY KEY (id),
+                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+            )
+        """)
+    )
+
+    # Tabelas do esquema já existentes, consultadas em uma única ida ao banco
+    _SQL_EXISTING_TABLES = """
+            SELECT table_name FROM user_tables
+            WHERE table_name IN ('SESSIONS', 'SENSOR_DATA', 'GHG_EMISSIONS',
+                                 'CARBON_STOCKS', 'HARVEST_LOSSES')
+    """
+
+    # Códigos ORA tolerados na criação (955: nome já usado por outro objeto)
+    _TABLE_EXISTS_ERRS = frozenset((955,))
+
     def __init__(self, config=None):
         """
         Inicializa o conector Oracle.
 
         Args:
             config (dict): Configurações de conexão com Oracle
+
+        Raises:
+            ValueError: Se batch_size não for um inteiro positivo
         """
         self.config = config or {}
-        self.connection = None
-        self.cursor = None
+        self.pool = None
 
         # Configurações de conexão
         self.host = self.config.get('host', 'localhost')
@@ -28,133 +308,144 @@ class OracleConnector:
         self.username = self.config.get('username', 'system')
         self.password = self.config.get('password', 'oracle')
 
+        # Tamanho da unidade de dados da sessão (SDU), em bytes
+        self.sdu = self.config.get('sdu', 65535)
+
+        # Tamanho do pool de sessões compartilhado
+        self.pool_min = self.config.get('pool_min', 2)
+        self.pool_max = self.config.get('pool_max', 6)
+
+        # Cache de statements por conexão: evita novo parse dos mesmos comandos
+        self.stmt_cache_size = self.config.get('stmt_cache_size', 40)
+
+        # Linhas por ida ao banco nas consultas (prefetch = arraysize + 1
+        # evita a ida extra que apenas confirma o fim dos dados)
+        self.array_size = self.config.get('array_size', 5000)
+        self.prefetch_rows = self.config.get('prefetch_rows', self.array_size + 1)
+
+        # Linhas por chamada de executemany (limita memória e o array de binds)
+        self.batch_size = self.config.get('batch_size', 10000)
+        if not isinstance(self.batch_size, int) or self.batch_size < 1:
+            raise ValueError("batch_size deve ser um inteiro positivo")
+
         # Flag para modo simulado (sem conexão real)
         self.simulated_mode = self.config.get('simulated_mode', False)
 
-        # Esquemas SQL para criação de tabelas
-        self.table_schemas = {
-            'sessions': """
-                CREATE TABLE sessions (
-                    session_id VARCHAR2(50) PRIMARY KEY,
-                    start_timestamp TIMESTAMP,
-                    end_timestamp TIMESTAMP,
-                    status VARCHAR2(20)
-                )
-            """,
-            'sensor_data': """
-                CREATE TABLE sensor_data (
-                    id NUMBER GENERATED ALWAYS AS IDENTITY,
-                    session_id VARCHAR2(50),
-                    timestamp TIMESTAMP,
-                    sensor_type VARCHAR2(30),
-                    sensor_value NUMBER(10,2),
-                    unit VARCHAR2(10),
-                    PRIMARY KEY (id),
-                    FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-                )
-            """,
-            'ghg_emissions': """
-                CREATE TABLE ghg_emissions (
-                    id NUMBER GENERATED ALWAYS AS IDENTITY,
-                    session_id VARCHAR2(50),
-                    timestamp TIMESTAMP,
-                    scope NUMBER(1),
-                    category VARCHAR2(30),
-                    source VARCHAR2(50),
-                    gas VARCHAR2(10),
-                    value NUMBER(10,2),
-                    unit VARCHAR2(10),
-                    calculation_method VARCHAR2(20),
-                    PRIMARY KEY (id),
-                    FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-                )
-            """,
-            'carbon_stocks': """
-                CREATE TABLE carbon_stocks (
-                    id NUMBER GENERATED ALWAYS AS IDENTITY,
-                    session_id VARCHAR2(50),
-                    timestamp TIMESTAMP,
-                    stock_type VARCHAR2(30),
-                    change NUMBER(10,2),
-                    amortization_period NUMBER(3),
-                    unit VARCHAR2(10),
-                    PRIMARY KEY (id),
-                    FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-                )
-            """,
-            'harvest_losses': """
-                CREATE TABLE harvest_losses (
-                    id NUMBER GENERATED ALWAYS AS IDENTITY,
-                    session_id VARCHAR2(50),
-                    timestamp TIMESTAMP,
-                    loss_percent NUMBER(5,2),
-                    factors VARCHAR2(100),
-                    PRIMARY KEY (id),
-                    FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-                )
-            """
-        }
+        # Driver Oracle; não é carregado em modo simulado
+        self._cx = None if self.simulated_mode else _load_driver()
 
     def connect(self):
         """
-        Estabelece conexão com o banco Oracle.
+        Prepara o pool de sessões compartilhado com o banco Oracle.
+
+        As operações obtêm uma conexão do pool a cada chamada (_acquire),
+        de modo que o conector pode ser usado por várias threads.
 
         Returns:
             bool: Sucesso da conexão
         """
         if self.simulated_mode:
-            print("Modo simulado: não conectando realmente ao Oracle")
+            logger.info("Modo simulado: não conectando realmente ao Oracle")
             return True
 
         try:
-            # Constrói string de conexão
-            dsn = cx_Oracle.makedsn(
-                self.host,
-                self.port,
-                service_name=self.service_name
-            )
-
-            # Estabelece conexão
-            self.connection = cx_Oracle.connect(
-                user=self.username,
-                password=self.password,
-                dsn=dsn
-            )
-
-            # Cria cursor
-            self.cursor = self.connection.cursor()
-
+            self._ensure_pool()
             return True
-        except cx_Oracle.Error as e:
+        except self._cx.Error as e:
             error, = e.args
-            print(f"Erro ao conectar ao Oracle: {error.message}")
+            logger.error("Erro ao conectar ao Oracle: %s", error.message)
             return False
 
-    def disconnect(self):
+    def _ensure_pool(self):
         """
-        Encerra conexão com o banco Oracle.
+        Obtém o pool de sessões compartilhado, criando-o se necessário.
 
         Returns:
-            bool: Sucesso da operação
+            oracledb.SessionPool: Pool de sessões
+
+        Raises:
+            oracledb.Error: Se o pool não puder ser criado
         """
-        if self.simulated_mode:
-            return True
+        if self.pool is None:
+            # Descritor explícito para definir o SDU (makedsn usa o padrão de
+            # 8 KB); o listener deve aceitar o mesmo valor no sqlnet.ora
+            dsn = (
+                f"(DESCRIPTION=(SDU={self.sdu})"
+                f"(ADDRESS=(PROTOCOL=TCP)(HOST={self.host})(PORT={self.port}))"
+                f"(CONNECT_DATA=(SERVICE_NAME={self.service_name})))"
+            )
 
+            self.pool = _get_pool(self.username, self.password, dsn,
+                                  self.pool_min, self.pool_max,
+                                  self.stmt_cache_size)
+        return self.pool
+
+    @contextmanager
+    def _acquire(self, arraysize=None):
+        """
+        Obtém conexão do pool e um cursor novo para uma operação.
+
+        Confirma a transação ao final do bloco ou a desfaz em caso de erro
+        Oracle; a conexão é sempre devolvida ao pool.
+
+        Args:
+            arraysize (int): Linhas por fetch; se omitido, usa array_size
+
+        Yields:
+            tuple: Conexão e cursor Oracle
+
+        Raises:
+            oracledb.Error: Se o pool não puder ser criado ou a operação falhar
+        """
+        pool = self._ensure_pool()
+        conn = pool.acquire()
+        cursor = None
         try:
-            if self.cursor:
-                self.cursor.close()
+            # Transações explícitas: cada operação faz um único commit ao final
+            conn.autocommit = False
+            cursor = self._new_cursor(conn, arraysize)
+            yield conn, cursor
+            conn.commit()
+        except self._cx.Error:
+            conn.rollback()
+            raise
+        finally:
+            if cursor is not None:
+                cursor.close()
+            pool.release(conn)
+
+    def _new_cursor(self, conn, arraysize=None):
+        """
+        Cria cursor com os tamanhos de fetch configurados.
 
-            if self.connection:
-                self.connection.close()
+        Args:
+            conn: Conexão Oracle
+            arraysize (int): Linhas por fetch; se omitido, usa array_size
 
-            self.cursor = None
-            self.connection = None
+        Returns:
+            oracledb.Cursor: Cursor da conexão
+        """
+        cursor = conn.cursor()
+        if arraysize is None:
+            cursor.arraysize = self.array_size
+            cursor.prefetchrows = self.prefetch_rows
+        else:
+            cursor.arraysize = arraysize
+            cursor.prefetchrows = arraysize + 1
+        return cursor
 
-            return True
-        except cx_Oracle.Error as e:
-            error, = e.args
-            print(f"Erro ao desconectar do Oracle: {error.message}")
-            return False
+    def disconnect(self):
+        """
+        Desvincula o conector do pool de sessões.
+
+        O pool é compartilhado entre instâncias e permanece aberto; as
+        conexões já foram devolvidas ao final de cada operação.
+
+        Returns:
+            bool: Sucesso da operação
+        """
+        self.pool = None
+        return True
 
     def create_tables(self):
         """
@@ -166,32 +457,30 @@ class OracleConnector:
         if self.simulated_mode:
             return True
 
-        if not self.connection or not self.cursor:
-            if not self.connect():
-                return False
-
         try:
-            # Cria tabelas na ordem correta respeitando referências
-            for table_name in ['sessions', 'sensor_data', 'ghg_emissions',
-                              'carbon_stocks', 'harvest_losses']:
-                schema = self.table_schemas[table_name]
-
-                try:
-                    self.cursor.execute(schema)
-                    self.connection.commit()
-                except cx_Oracle.Error as e:
-                    # Ignora erro se tabela já existir
-                    error, = e.args
-                    if 'ORA-00955' in error.message:  # Tabela já existe
-                        pass
-                    else:
-                        raise
+            with self._acquire(arraysize=10) as (conn, cursor):
+                # Consulta as tabelas existentes para executar só o DDL que falta
+                cursor.execute(self._SQL_EXISTING_TABLES)
+                existing = {name.lower() for name, in cursor}
+
+                # Cria tabelas na ordem correta respeitando referências
+                for table_name, schema in self._TABLE_SCHEMAS:
+                    if table_name in existing:
+                        continue
+
+                    try:
+                        # DDL é confirmado implicitamente pelo Oracle
+                        cursor.execute(schema)
+                    except self._cx.Error as e:
+                        # Ignora erro se a tabela foi criada desde a consulta
+                        error, = e.args
+                        if error.code not in self._TABLE_EXISTS_ERRS:
+                            raise
 
             return True
-        except cx_Oracle.Error as e:
+        except self._cx.Error as e:
             error, = e.args
-            print(f"Erro ao criar tabelas: {error.message}")
-            self.connection.rollback()
+            logger.error("Erro ao criar tabelas: %s", error.message)
             return False
 
     def start_session(self, session_id):
@@ -207,30 +496,20 @@ class OracleConnector:
         if self.simulated_mode:
             return True
 
-        if not self.connection or not self.cursor:
-            if not self.connect():
-                return False
-
         try:
-            # Insere nova sessão
-            sql = """
-                INSERT INTO sessions (session_id, start_timestamp, status)
-                VALUES (:session_id, :start_timestamp, :status)
-            """
-
-            self.cursor.execute(
-                sql,
-                session_id=session_id,
-                start_timestamp=datetime.now(),
-                status='active'
-            )
+            with self._acquire() as (conn, cursor):
+                # Insere nova sessão
+                cursor.execute(
+                    self._SQL_START_SESSION,
+                    session_id=session_id,
+                    start_timestamp=_utc_now(),
+                    status='active'
+                )
 
-            self.connection.commit()
             return True
-        except cx_Oracle.Error as e:
+        except self._cx.Error as e:
             error, = e.args
-            print(f"Erro ao iniciar sessão: {error.message}")
-            self.connection.rollback()
+            logger.error("Erro ao iniciar sessão: %s", error.message)
             return False
 
     def end_session(self, session_id):
@@ -246,31 +525,20 @@ class OracleConnector:
         if self.simulated_mode:
             return True
 
-        if not self.connection or not self.cursor:
-            if not self.connect():
-                return False
-
         try:
-            # Atualiza sessão existente
-            sql = """
-                UPDATE sessions
-                SET end_timestamp = :end_timestamp, status = :status
-                WHERE session_id = :session_id
-            """
-
-            self.cursor.execute(
-                sql,
-                end_timestamp=datetime.now(),
-                status='completed',
-                session_id=session_id
-            )
+            with self._acquire() as (conn, cursor):
+                # Atualiza sessão existente
+                cursor.execute(
+                    self._SQL_END_SESSION,
+                    end_timestamp=_utc_now(),
+                    status='completed',
+                    session_id=session_id
+                )
 
-            self.connection.commit()
             return True
-        except cx_Oracle.Error as e:
+        except self._cx.Error as e:
             error, = e.args
-            print(f"Erro ao finalizar sessão: {error.message}")
-            self.connection.rollback()
+            logger.error("Erro ao finalizar sessão: %s", error.message)
             return False
 
     def save_sensor_data(self, session_id, sensor_data):
@@ -287,49 +555,46 @@ class OracleConnector:
         if self.simulated_mode:
             return True
 
-        if not self.connection or not self.cursor:
-            if not self.connect():
-                return False
-
         try:
-            # Prepara SQL para inserção
-            sql = """
-                INSERT INTO sensor_data
-                (session_id, timestamp, sensor_type, sensor_value, unit)
-                VALUES (:session_id, :timestamp, :sensor_type, :sensor_value, :unit)
-            """
+            now = datetime.now()
+            rows = []
+
+            # Referências locais evitam buscas de atributo a cada leitura
+            append = rows.append
+            parse_iso = _parse_iso
 
             # Processa cada leitura de sensor
             for sensor_name, reading in sensor_data.items():
                 if isinstance(reading, dict) and 'value' in reading:
-                    # Formato completo com timestamp e unidade
-                    self.cursor.execute(
-                        sql,
-                        session_id=session_id,
-                        timestamp=datetime.fromisoformat(
-                            reading.get('timestamp', datetime.now().isoformat())
-                        ),
-                        sensor_type=sensor_name,
-                        sensor_value=reading['value'],
-                        unit=reading.get('unit', '')
-                    )
+                    # Formato completo com timestamp e unidade; sem
+                    # timestamp próprio, usa o instante único da chamada
+                    timestamp = reading.get('timestamp')
+                    append({
+                        'session_id': session_id,
+                        'timestamp': parse_iso(timestamp) if timestamp else now,
+                        'sensor_type': sensor_name,
+                        'sensor_value': reading['value'],
+                        'unit': reading.get('unit', '')
+                    })
                 else:
                     # Formato simplificado (apenas valor)
-                    self.cursor.execute(
-                        sql,
-                        session_id=session_id,
-                        timestamp=datetime.now(),
-                        sensor_type=sensor_name,
-                        sensor_value=reading,
-                        unit=''
-                    )
-
-            self.connection.commit()
+                    append({
+                        'session_id': session_id,
+                        'timestamp': now,
+                        'sensor_type': sensor_name,
+                        'sensor_value': reading,
+                        'unit': ''
+                    })
+
+            # Insere as leituras em lotes, com um único commit
+            with self._acquire() as (conn, cursor):
+                self._executemany(cursor, self._SQL_INSERT_SENSOR, rows,
+                                  self._SIZES_SENSOR)
+
             return True
-        except cx_Oracle.Error as e:
+        except self._cx.Error as e:
             error, = e.args
-            print(f"Erro ao salvar dados de sensores: {error.message}")
-            self.connection.rollback()
+            logger.error("Erro ao salvar dados de sensores: %s", error.message)
             return False
 
     def save_ghg_emissions(self, session_id, emissions_data):
@@ -346,76 +611,72 @@ class OracleConnector:
         if self.simulated_mode:
             return True
 
-        if not self.connection or not self.cursor:
-            if not self.connect():
-                return False
-
         try:
-            # Prepara SQL para inserção
-            sql = """
-                INSERT INTO ghg_emissions
-                (session_id, timestamp, scope, category, source,
-                gas, value, unit, calculation_method)
-                VALUES
-                (:session_id, :timestamp, :scope, :category, :source,
-                :gas, :value, :unit, :calculation_method)
-            """
-
-            # Processa cada escopo de emissões
-            for scope_name, scope_data in emissions_data.items():
-                scope_num = int(scope_name.replace('scope', ''))
-
-                if isinstance(scope_data, dict):
-                    # Escopo 1 tem categorias
-                    if scope_num == 1:
-                        for category, category_data in scope_data.items():
-                            for source, source_data in category_data.items():
-                                for gas, value in source_data.items():
-                                    # Pula entradas que não são gases
-                                    if gas not in ['CO2', 'CH4', 'N2O', 'CO2e']:
-                                        continue
-
-                                    self.cursor.execute(
-                                        sql,
-                                        session_id=session_id,
-                                        timestamp=datetime.now(),
-                                        scope=scope_num,
-                                        category=category,
-                                        source=source,
-                                        gas=gas,
-                                        value=value,
-                                        unit='kg',
-                                        calculation_method='tier1'
-                                    )
-                    else:
-                        # Escopos 2 e 3 são mais simples
-                        for source, source_data in scope_data.items():
-                            for gas, value in source_data.items():
-                                # Pula entradas que não são gases
-                                if gas not in ['CO2', 'CH4', 'N2O', 'CO2e']:
-                                    continue
-
-                                self.cursor.execute(
-                                    sql,
-                                    session_id=session_id,
-                                    timestamp=datetime.now(),
-                                    scope=scope_num,
-                                    category='',
-                                    source=source,
-                                    gas=gas,
-                                    value=value,
-                                    unit='kg',
-                                    calculation_method='tier1'
-                                )
-
-            self.connection.commit()
+            rows = list(self._iter_ghg_rows(session_id, emissions_data,
+                                            datetime.now()))
+
+            # Insere as emissões em lotes, com um único commit
+            with self._acquire() as (conn, cursor):
+                self._executemany(cursor, self._SQL_INSERT_GHG, rows,
+                                  self._SIZES_GHG)
+
             return True
-        except cx_Oracle.Error as e:
+        except self._cx.Error as e:
             error, = e.args
-            print(f"Erro ao salvar emissões GHG: {error.message}")
-            self.connection.rollback()
+            logger.error("Erro ao salvar emissões GHG: %s", error.message)
             return False
 
+    def _iter_ghg_rows(self, session_id, emissions_data, now):
+        """
+        Percorre os dados de emissões gerando os binds de cada gás.
+
+        Args:
+            session_id (str): Identificador da sessão
+            emissions_data (dict): Dados de emissões por escopo
+            now (datetime): Instante de inserção do lote
+
+        Yields:
+            dict: Valores de uma linha de ghg_emissions
+        """
+        gases = self._GHG_GASES
+
+        for scope_name, scope_data in emissions_data.items():
+            if not isinstance(scope_data, dict):
+                continue
+
+            scope_num = int(scope_name.replace('scope', ''))
+
+            # Escopo 1 tem categorias; escopos 2 e 3 são mais simples
+            if scope_num == 1:
+                sources = (
+                    (category, source, source_data)
+                    for category, category_data in scope_data.items()
+                    for source, source_data in category_data.items()
+                )
+            else:
+                sources = (
+                    ('', source, source_data)
+                    for source, source_data in scope_data.items()
+                )
+
+            for category, source, source_data in sources:
+                for gas, value in source_data.items():
+                    # Pula entradas que não são gases
+                    if gas not in gases:
+                        continue
+
+                    yield {
+                        'session_id': session_id,
+                        'timestamp': now,
+                        'scope': scope_num,
+                        'category': category,
+                        'source': source,
+                        'gas': gas,
+                        'value': value,
+                        'unit': 'kg',
+                        'calculation_method': 'tier1'
+                    }
+
     def save_carbon_stocks(self, session_id, carbon_data):
         """
         Salva dados de estoques de carbono no banco.
@@ -430,40 +691,106 @@ class OracleConnector:
         if self.simulated_mode:
             return True
 
-        if not self.connection or not self.cursor:
-            if not self.connect():
-                return False
-
         try:
-            # Prepara SQL para inserção
-            sql = """
-                INSERT INTO carbon_stocks
-                (session_id, timestamp, stock_type, change, amortization_period, unit)
-                VALUES
-                (:session_id, :timestamp, :stock_type, :change,
-                :amortization_period, :unit)
-            """
+            now = datetime.now()
 
             # Processa cada tipo de estoque
-            for stock_type, stock_data in carbon_data.items():
-                self.cursor.execute(
-                    sql,
-                    session_id=session_id,
-                    timestamp=datetime.now(),
-                    stock_type=stock_type,
-                    change=stock_data.get('change_co2', 0),
-                    amortization_period=stock_data.get('amortization_period', 20),
-                    unit='kg CO2e'
-                )
+            rows = [
+                {
+                    'session_id': session_id,
+                    'timestamp': now,
+                    'stock_type': stock_type,
+                    'change': stock_data.get('change_co2', 0),
+                    'amortization_period': stock_data.get('amortization_period', 20),
+                    'unit': 'kg CO2e'
+                }
+                for stock_type, stock_data in carbon_data.items()
+            ]
+
+            # Insere os estoques em lotes, com um único commit
+            with self._acquire() as (conn, cursor):
+                self._executemany(cursor, self._SQL_INSERT_CARBON, rows,
+                                  self._SIZES_CARBON)
 
-            self.connection.commit()
             return True
-        except cx_Oracle.Error as e:
+        except self._cx.Error as e:
             error, = e.args
-            print(f"Erro ao salvar estoques de carbono: {error.message}")
-            self.connection.rollback()
+            logger.error("Erro ao salvar estoques de carbono: %s", error.message)
             return False
 
+    def save_session_data(self, session_id, sensor_data=None, emissions_data=None,
+                          carbon_data=None, loss_data=None):
+        """
+        Salva em paralelo os dados de uma sessão nas tabelas independentes.
+
+        Cada save_* roda em uma thread e obtém sua própria conexão do pool
+        compartilhado.
+
+        Args:
+            session_id (str): Identificador da sessão
+            sensor_data (dict): Dados dos sensores
+            emissions_data (dict): Dados de emissões
+            carbon_data (dict): Dados de estoques de carbono
+            loss_data (dict): Dados de perdas na colheita
+
+        Returns:
+            bool: Sucesso de todas as operações
+        """
+        tasks = [
+            (save_fn, data) for save_fn, data in (
+                (self.save_sensor_data, sensor_data),
+                (self.save_ghg_emissions, emissions_data),
+                (self.save_carbon_stocks, carbon_data),
+                (self.save_harvest_losses, loss_data),
+            )
+            if data
+        ]
+        if not tasks:
+            return True
+
+        workers = min(len(tasks), self.pool_max, MAX_EXPORT_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(save_fn, session_id, data)
+                for save_fn, data in tasks
+            ]
+            return all([future.result() for future in futures])
+
+    def _executemany(self, cursor, sql, rows, input_sizes):
+        """
+        Executa inserção em lote fatiada em blocos de batch_size linhas.
+
+        Evita arrays de binds grandes demais (DPI-1015) em sessões longas.
+        O commit fica a cargo do chamador, após todos os blocos.
+
+        Args:
+            cursor: Cursor Oracle
+            sql (str): Comando SQL com binds nomeados
+            rows (list): Dicionários com os valores de cada linha
+            input_sizes (dict): Tipo ou tamanho de cada bind
+        """
+        batch_size = self.batch_size
+        input_sizes = self._bind_sizes(input_sizes)
+
+        for start in range(0, len(rows), batch_size):
+            cursor.setinputsizes(**input_sizes)
+            cursor.executemany(sql, rows[start:start + batch_size])
+
+    def _bind_sizes(self, sizes):
+        """
+        Resolve os nomes de tipo do driver em um mapa de binds.
+
+        Args:
+            sizes (dict): Tamanho ou nome do tipo do driver de cada bind
+
+        Returns:
+            dict: Argumentos para cursor.setinputsizes
+        """
+        return {
+            name: getattr(self._cx, size) if isinstance(size, str) else size
+            for name, size in sizes.items()
+        }
+
     def save_harvest_losses(self, session_id, loss_data):
         """
         Salva dados de perdas na colheita no banco.
@@ -478,35 +805,37 @@ class OracleConnector:
         if self.simulated_mode:
             return True
 
-        if not self.connection or not self.cursor:
-            if not self.connect():
-                return False
-
         try:
-            # Prepara SQL para inserção
-            sql = """
-                INSERT INTO harvest_losses
-                (session_id, timestamp, loss_percent, factors)
-                VALUES
-                (:session_id, :timestamp, :loss_percent, :factors)
-            """
-
-            # Extrai fatores problemáticos
-            problematic_factors = loss_data.get('problematic_factors', [])
-            factors_str = ','.join([f.get('factor', '') for f in problematic_factors])
-
-            self.cursor.execute(
-                sql,
-                session_id=session_id,
-                timestamp=datetime.now(),
-                loss_percent=loss_data.get('loss_estimate', 0),
-                factors=factors_str[:100]  # Limita a 100 caracteres
-            )
+            # Junta os fatores problemáticos até a largura da coluna, sem
+            # montar a lista completa nem cortar um fator ao meio
+            parts, total = [], 0
+            for factor in loss_data.get('problematic_factors', []):
+                name = factor.get('factor', '')
+                if not name:
+                    continue
+
+                part = f",{name}" if parts else name
+                size = len(part.encode('utf-8'))
+                if total + size > FACTORS_WIDTH:
+                    break
+
+                parts.append(part)
+                total += size
+
+            factors_str = ''.join(parts)
+
+            with self._acquire() as (conn, cursor):
+                cursor.setinputsizes(**self._bind_sizes(self._SIZES_HARVEST))
+                cursor.execute(
+                    self._SQL_INSERT_HARVEST,
+                    session_id=session_id,
+                    timestamp=datetime.now(),
+                    loss_percent=loss_data.get('loss_estimate', 0),
+                    factors=factors_str
+                )
 
-            self.connection.commit()
             return True
-        except cx_Oracle.Error as e:
+        except self._cx.Error as e:
             error, = e.args
-            print(f"Erro ao salvar perdas na colheita: {error.message}")
-            self.connection.rollback()
+            logger.error("Erro ao salvar perdas na colheita: %s", error.message)
             return False
@@ -10,6 +10,7 @@ para o banco de dados Oracle, com tratamento de erros e feedback
 detalhado sobre o processo.
 """
 
+import logging
 import os
 import sys
 import time
@@ -18,6 +19,9 @@ from typing import Dict, Any, List
 
 from persistence.oracle.oracle_service import OracleService
 
+# Configuração de logging
+logger = logging.getLogger(__name__)
+
 class OracleExporter:
     """
     Exporta dados de colheita para o banco de dados Oracle.
@@ -50,7 +54,7 @@ class OracleExporter:
             Dict: Resultado da exportação com estatísticas e erros
         """
         # Inicializa serviço Oracle
-        print("\nInicializando serviço Oracle...")
+        logger.info("Inicializando serviço Oracle...")
         if not self.service.initialize():
             return {
                 "success": False,
@@ -66,7 +70,7 @@ class OracleExporter:
             }
 
         # Verifica saúde da conexão
-        print("Verificando saúde da conexão...\n")
+        logger.info("Verificando saúde da conexão...")
         if not self.service.is_healthy():
             return {
                 "success": False,
@@ -83,18 +87,22 @@ class OracleExporter:
 
         # Exibe informações da conexão
         conn_info = self.service.get_connection_info()
-        print("Conectado ao banco Oracle:")
-        print(f"• Versão: {conn_info.get('version', 'Desconhecida')}")
-        print(f"• Instância: {conn_info.get('instance', 'Desconhecida')}")
-        print(f"• Servidor: {conn_info.get('server', 'Desconhecido')}")
+        logger.info("Conectado ao banco Oracle:")
+        logger.info("• Versão: %s", conn_info.get('version', 'Desconhecida'))
+        logger.info("• Instância: %s", conn_info.get('instance', 'Desconhecida'))
+        logger.info("• Servidor: %s", conn_info.get('server', 'Desconhecido'))
 
         # Exporta dados
-        print("\nExportando dados para o Oracle...")
-        print("Este processo pode levar alguns minutos dependendo da")
-        print("quantidade de dados e da velocidade da conexão.\n")
+        logger.info("Exportando dados para o Oracle...")
+        logger.info("Este processo pode levar alguns minutos dependendo da "
+                    "quantidade de dados e da velocidade da conexão.")
+
+        logger.info("Processando...")
 
-        print("Processando...\n")
-        time.sleep(1)  # Pausa para legibilidade da UI
+        # Pausa opcional para legibilidade, apenas em terminal interativo
+        ui_delay = self.config.get('ui_delay', 0)
+        if ui_delay and sys.stdout.isatty():
+            time.sleep(ui_delay)
 
         # Executa exportação
         result = self.service.export_session_data(session_id, self.data_path)
@@ -116,52 +124,81 @@ class OracleExporter:
         """
         counts = result.get("counts", {})
         errors = result.get("errors", [])
-
-        summary = []
-
-        # Título baseado no resultado
-        if result.get("success", False):
-            summary.append("-" * 80)
-            summary.append("EXPORTAÇÃO CONCLUÍDA COM SUCESSO".center(80))
-            summary.append("-" * 80)
-        else:
-            if errors:
-                summary.append("-" * 80)
-                summary.append("EXPORTAÇÃO CONCLUÍDA COM AVISOS".center(80))
-                summary.append("-" * 80)
-            else:
-                summary.append("-" * 80)
-                summary.append("EXPORTAÇÃO FALHOU".center(80))
-                summary.append("-" * 80)
-
-        # Dados exportados
-        summary.append("Dados exportados:")
-        summary.append(f"• Sessões: {counts.get('sessions', 0)}")
-        summary.append(f"• Dados de sensores: {counts.get('sensor_data', 0)} arquivos")
-        summary.append(f"• Análises de perdas: {counts.get('analysis', 0)} arquivos")
-        summary.append(f"• Dados de emissões: {counts.get('emissions', 0)} arquivos")
-        summary.append(f"• Estoques de carbono: {counts.get('carbon_stocks', 0)} arquivos")
+        separator = "-" * 80
+
+        # Título baseado no resultado, seguido dos dados exportados
+        parts = [
+            separator,
+            self._summary_header(result).center(80),
+            separator,
+            "Dados exportados:",
+            f"• Sessões: {counts.get('sessions', 0)}",
+            f"• Dados de sensores: {counts.get('sensor_data', 0)} arquivos",
+            f"• Análises de perdas: {counts.get('analysis', 0)} arquivos",
+            f"• Dados de emissões: {counts.get('emissions', 0)} arquivos",
+            f"• Estoques de carbono: {counts.get('carbon_stocks', 0)} arquivos",
+        ]
 
         # Erros ocorridos
         if errors:
-            summary.append(f"\nOcorreram {len(errors)} erros durante a exportação:")
+            parts.append(f"\nOcorreram {len(errors)} erros durante a exportação:")
 
             # Limita a exibição de erros para não sobrecarregar a tela
             max_errors = 5
-            for i, error in enumerate(errors[:max_errors], 1):
-                summary.append(f"{i}. {error}")
+            parts.extend([f"{i}. {error}"
+                          for i, error in enumerate(errors[:max_errors], 1)])
 
             if len(errors) > max_errors:
-                summary.append(f"...e mais {len(errors) - max_errors} erros não exibidos.")
+                parts.append(f"...e mais {len(errors) - max_errors} erros não exibidos.")
 
-            summary.append("\nAlguns dados foram exportados com sucesso, mas ocorreram erros.")
-            summary.append("Verifique os logs para mais detalhes.")
+            parts.append("\nAlguns dados foram exportados com sucesso, mas ocorreram erros.")
+            parts.append("Verifique os logs para mais detalhes.")
         elif not result.get("success", False):
             # Falha sem erros específicos
-            summary.append("\nA exportação falhou sem erros específicos registrados.")
-            summary.append("Verifique a conexão e as configurações do Oracle.")
+            parts.append("\nA exportação falhou sem erros específicos registrados.")
+            parts.append("Verifique a conexão e as configurações do Oracle.")
+
+        return "\n".join(parts)
+
+    @staticmethod
+    def _summary_header(result: Dict[str, Any]) -> str:
+        """
+        Define o título do resumo conforme o resultado da exportação.
+
+        Args:
+            result: Resultado da exportação
+
+        Returns:
+            str: Título do resumo
+        """
+        if result.get("success", False):
+            return "EXPORTAÇÃO CONCLUÍDA COM SUCESSO"
+        if result.get("errors"):
+            return "EXPORTAÇÃO CONCLUÍDA COM AVISOS"
+        return "EXPORTAÇÃO FALHOU"
+
+def _positive_int(value: str) -> int:
+    """
+    Converte um argumento de linha de comando em inteiro positivo.
+
+    Args:
+        value: Texto informado na linha de comando
+
+    Returns:
+        int: Valor convertido
+
+    Raises:
+        argparse.ArgumentTypeError: Se o valor não for um inteiro positivo
+    """
+    import argparse
 
-        return "\n".join(summary)
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"deve ser um inteiro positivo: {value!r}")
+    return number
 
 def main():
     """
@@ -207,6 +244,23 @@ def main():
         "--password",
         help="Senha Oracle (se omitida, será solicitada)"
     )
+    parser.add_argument(
+        "--batch-size",
+        type=_positive_int,
+        default=10000,
+        help="Linhas por lote de inserção"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Categorias exportadas em paralelo (máximo 5)"
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Exibir apenas avisos e erros durante a exportação"
+    )
     parser.add_argument(
         "--simulated",
         action="store_true",
@@ -215,6 +269,12 @@ def main():
 
     args = parser.parse_args()
 
+    # Progresso via logging; o resumo final continua impresso em stdout
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format="%(message)s"
+    )
+
     # Solicita senha se não fornecida
     password = args.password
     if not password and not args.simulated:
@@ -229,7 +289,9 @@ def main():
         "username": args.user,
         "password": password,
         "simulated_mode": args.simulated,
-        "validate_data": True
+        "validate_data": True,
+        "batch_size": args.batch_size,
+        "export_workers": args.workers
     }
 
     # Executa exportação
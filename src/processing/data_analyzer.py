@@ -2,20 +2,162 @@
 # -*- coding: utf-8 -*-
 
 # Processador de Dados e Motor de Recomendações
+import heapq
+import math
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
+
 import numpy as np
-from datetime import timedelta
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _as_datetime64(value):
+    """
+    Converte um datetime para datetime64[us] do histórico.
+
+    Datetimes com fuso são levados para UTC sem fuso, pois datetime64 não
+    representa fusos; datetimes sem fuso são gravados como recebidos.
+
+    Args:
+        value (datetime): Momento a converter
+
+    Returns:
+        np.datetime64: Momento com resolução de microssegundos
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(value, 'us')
+
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _as_epoch_us(value):
+    """
+    Converte um datetime para microssegundos desde a época Unix.
+
+    Equivale ao inteiro de _as_datetime64, sem o custo de construir um
+    escalar NumPy a cada leitura gravada no histórico.
+
+    Args:
+        value (datetime): Momento a converter
+
+    Returns:
+        int: Microssegundos desde 1970-01-01 (UTC para datetimes com fuso)
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _ONE_MICROSECOND
+
+
+def _severity_kernel(v, lo, hi, span_below, span_above):
+    """
+    Calcula a severidade do desvio de cada fator em relação à faixa ótima.
+
+    Args:
+        v (np.ndarray): Valores dos fatores (NaN para sensores ausentes)
+        lo (np.ndarray): Limites inferiores da faixa ótima
+        hi (np.ndarray): Limites superiores da faixa ótima
+        span_below (np.ndarray): lo - crítico inferior, NaN se não houver
+        span_above (np.ndarray): crítico superior - hi, NaN se não houver
+
+    Returns:
+        tuple: Severidades entre 0 e 1 (0 para sensores ausentes ou desvios
+            sem limite crítico) e máscara dos fatores abaixo da faixa ótima
+    """
+    # Sem seleção por ramo: o desvio do lado oposto é negativo e zera no
+    # limite inferior; fmax/fmin também convertem NaN (sensor ausente ou sem
+    # limite crítico) em 0. A divisão, e não o produto pelo inverso, mantém
+    # exatos os empates com o limiar de severidade
+    below_dev = np.fmin(np.fmax((lo - v) / span_below, 0.0), 1.0)
+    above_dev = np.fmin(np.fmax((v - hi) / span_above, 0.0), 1.0)
+    return below_dev + above_dev, v < lo
+
+
+def _score_reading(values, factor_params):
+    """
+    Calcula severidades e perda adicional ponderada de uma única leitura.
+
+    Laço escalar: com poucos fatores, aritmética de floats Python custa menos
+    que despachar ufuncs sobre vetores tão curtos. Segue a mesma ordem de
+    operações do kernel vetorizado do histórico.
+
+    Args:
+        values (list): Valores dos fatores (NaN para sensores ausentes)
+        factor_params (tuple): (peso * 10, ótimo mínimo, ótimo máximo,
+            extensão abaixo, extensão acima) de cada fator; extensões None
+            quando não há limite crítico
+
+    Returns:
+        tuple: Perda adicional, severidades entre 0 e 1 e indicadores dos
+            fatores abaixo da faixa ótima
+    """
+    additional_loss = 0.0
+    severity = []
+    below = []
+    for value, (w10, lo, hi, span_below, span_above) in zip(values,
+                                                            factor_params):
+        deviation = 0.0
+        is_below = value < lo
+        if is_below:
+            if span_below is not None:
+                deviation = (lo - value) / span_below
+        elif value > hi:
+            if span_above is not None:
+                deviation = (value - hi) / span_above
+        if deviation:
+            # Mesmo corte de max(0, min(1, desvio)), sem chamadas de função
+            if deviation > 1.0:
+                deviation = 1.0
+            elif deviation < 0.0:
+                deviation = 0.0
+            additional_loss += w10 * deviation
+        severity.append(deviation)
+        below.append(is_below)
+
+    return additional_loss, severity, below
+
+
+def _score_kernel(v, w10, lo, hi, span_below, span_above):
+    """
+    Calcula severidades e perda adicional ponderada de uma ou várias leituras.
+
+    Aceita uma leitura (vetor de fatores) ou um lote (matriz leituras x
+    fatores); a soma ponderada reduz cada linha em uma única chamada, na mesma
+    ordem de soma do cálculo por fator.
+
+    Args:
+        v (np.ndarray): Valores dos fatores, 1D ou 2D (NaN para ausentes)
+        w10 (np.ndarray): Pesos dos fatores multiplicados por 10
+        lo, hi, span_below, span_above (np.ndarray): Como em _severity_kernel
+
+    Returns:
+        tuple: Perda adicional (escalar ou uma por leitura), severidades e
+            máscara dos fatores abaixo da faixa ótima
+    """
+    severity, below = _severity_kernel(v, lo, hi, span_below, span_above)
+    return (severity * w10).sum(axis=-1), severity, below
+
 
 class DataAnalyzer:
     """
     Analisa dados dos sensores e identifica padrões relacionados a perdas.
     """
 
+    # Severidade a partir da qual um fator é reportado como problemático
+    _SEVERITY_THRESHOLD = 0.3
+
     def __init__(self, config=None):
         """
         Inicializa o analisador de dados.
 
         Args:
             config (dict): Configurações para análise
+
+        Raises:
+            ValueError: Se history_capacity não for um inteiro positivo
         """
         self.config = config or {}
         self.loss_thresholds = self.config.get('loss_thresholds', {
@@ -58,99 +200,429 @@ class DataAnalyzer:
             }
         }
 
-        # Histórico de dados
-        self.data_history = {
-            'timestamps': [],
-            'sensor_readings': {},
-            'calculated_losses': []
-        }
+        # Tabela de fatores congelada, na ordem de loss_factors: (nome, peso,
+        # ótimo mínimo, ótimo máximo, crítico abaixo, crítico acima)
+        self._factors_tuple = tuple(
+            (name, p['weight'], *p['optimal_range'],
+             p['critical_below'], p['critical_above'])
+            for name, p in self.loss_factors.items()
+        )
+        names, weights, lo, hi, cb, ca = zip(*self._factors_tuple)
+
+        # Mesmas propriedades em arrays float64 para o cálculo vetorizado sobre
+        # o histórico (None nos limites críticos vira NaN); o float32 fica
+        # restrito ao armazenamento das leituras
+        self._factor_names = names
+        self._w = np.array(weights, dtype=np.float64)
+        self._lo = np.array(lo, dtype=np.float64)
+        self._hi = np.array(hi, dtype=np.float64)
+        self._cb = np.array(cb, dtype=np.float64)
+        self._ca = np.array(ca, dtype=np.float64)
+
+        # Extensões entre a faixa ótima e os limites críticos, calculadas uma
+        # única vez; NaN (sem limite crítico) anula o desvio no kernel
+        self._span_below = self._lo - self._cb
+        self._span_above = self._ca - self._hi
+
+        # Pesos já escalados para pontos percentuais de perda
+        self._w10 = self._w * 10
+
+        # Mesma tabela em floats Python para o laço escalar de cada leitura
+        self._factor_params = tuple(
+            (weight * 10, min_optimal, max_optimal,
+             None if critical_below is None else min_optimal - critical_below,
+             None if critical_above is None else critical_above - max_optimal)
+            for _, weight, min_optimal, max_optimal, critical_below, critical_above
+            in self._factors_tuple
+        )
 
-    def process_sensor_data(self, timestamp, sensor_data):
+        # Histórico em ring buffer struct-of-arrays: capacidade fixa, com as
+        # leituras mais antigas sobrescritas quando o buffer enche
+        self._capacity = self.config.get('history_capacity', 65536)
+        if not isinstance(self._capacity, int) or self._capacity < 1:
+            raise ValueError("history_capacity deve ser um inteiro positivo")
+        self._ts = np.empty(self._capacity, dtype='datetime64[us]')
+        # Visão inteira do mesmo buffer, para gravar sem criar datetime64
+        self._ts_us = self._ts.view(np.int64)
+        self._losses = np.empty(self._capacity, dtype=np.float32)
+        self._sensor_mat = np.empty((self._capacity, len(self._factor_names)),
+                                    dtype=np.float32)
+
+        # Soma acumulada das perdas até cada leitura (inclusive): médias de
+        # qualquer trecho contíguo saem de duas subtrações. Fica em float64,
+        # pois acumula o histórico inteiro
+        self._cum_loss = np.empty(self._capacity, dtype=np.float64)
+        self._loss_total = 0.0
+
+        # Fatores problemáticos de cada leitura: coluna k = fator k reportado
+        self._problem_bool = np.zeros((self._capacity, len(self._factor_names)),
+                                      dtype=np.bool_)
+        self._head = 0  # Próxima posição de escrita
+        self._n = 0     # Leituras armazenadas
+
+        # Memo opcional da estimativa de perda por leitura arredondada. Só
+        # compensa com arredondamento: com valores exatos as chaves quase
+        # nunca se repetem, e montar e consultar a chave custa mais que o
+        # cálculo direto. None (padrão) desativa o memo e mantém os resultados
+        # exatos; um inteiro arredonda as leituras a essa quantidade de casas,
+        # elevando a taxa de acerto à custa de perdas aproximadas
+        self._loss_cache_decimals = self.config.get('loss_cache_decimals')
+        if self._loss_cache_decimals is not None:
+            # Cache da instância, para não reter o analisador em um memo global
+            self._loss_from_key = lru_cache(maxsize=512)(self._loss_from_tuple)
+
+    def process_sensor_data(self, timestamp, sensor_data, format_ts=True):
         """
         Processa dados dos sensores e estima perdas.
 
         Args:
             timestamp (datetime): Momento da leitura
             sensor_data (dict): Leituras dos sensores
+            format_ts (bool): Se False, devolve o timestamp sem convertê-lo
+                para texto ISO, para chamadores que não serializam o resultado
 
         Returns:
             dict: Resultados da análise
         """
-        # Armazena dados no histórico
-        self.data_history['timestamps'].append(timestamp)
-
-        # Inicializa entrada para este timestamp se necessário
-        for sensor, reading in sensor_data.items():
-            if sensor not in self.data_history['sensor_readings']:
-                self.data_history['sensor_readings'][sensor] = []
+        # Leituras no formato {'value': x} são desembrulhadas uma única vez
+        sensor_data = self._flatten_readings(sensor_data)
 
-            # Armazena valor numérico do sensor
-            if isinstance(reading, dict) and 'value' in reading:
-                self.data_history['sensor_readings'][sensor].append(reading['value'])
-            else:
-                self.data_history['sensor_readings'][sensor].append(reading)
-
-        # Calcula estimativa de perda
-        loss_estimate = self._calculate_loss_estimate(sensor_data)
-        self.data_history['calculated_losses'].append(loss_estimate)
+        # Estimativa de perda e severidades dos fatores em uma única passada
+        values, loss_estimate, severity, below = self._score(sensor_data)
 
         # Identifica fatores problemáticos
-        problematic_factors = self._identify_problematic_factors(sensor_data)
+        problematic_factors = self._report_factors(sensor_data, severity, below)
+
+        # Armazena dados no histórico, com os fatores já identificados
+        threshold = self._SEVERITY_THRESHOLD
+        self._append_history(timestamp, values, loss_estimate,
+                             [level > threshold for level in severity])
 
         return {
-            'timestamp': timestamp.isoformat(),
+            'timestamp': timestamp.isoformat() if format_ts else timestamp,
             'loss_estimate': loss_estimate,
             'loss_category': self._categorize_loss(loss_estimate),
             'problematic_factors': problematic_factors
         }
 
+    def _append_history(self, timestamp, values, loss_estimate, problems):
+        """
+        Grava uma leitura na próxima posição do histórico circular.
+
+        Args:
+            timestamp (datetime): Momento da leitura
+            values (list): Valores dos fatores de perda
+            loss_estimate (float): Perda estimada para a leitura
+            problems (list): Indicadores dos fatores problemáticos da leitura
+        """
+        i = self._head
+        self._ts_us[i] = _as_epoch_us(timestamp)
+        self._losses[i] = loss_estimate
+        self._loss_total += loss_estimate
+        self._cum_loss[i] = self._loss_total
+        self._sensor_mat[i] = values
+        self._problem_bool[i] = problems
+
+        self._head = (i + 1) % self._capacity
+        self._n = min(self._n + 1, self._capacity)
+
+    def losses_view(self):
+        """
+        Devolve as perdas registradas no histórico em ordem cronológica.
+
+        Enquanto o buffer circular não dá a volta, o resultado é uma visão
+        direta do histórico, sem cópia; depois disso, uma cópia reordenada.
+
+        Returns:
+            np.ndarray: Perdas estimadas (float32, somente leitura)
+        """
+        if self._n < self._capacity:
+            view = self._losses[:self._n]
+        else:
+            view = np.concatenate((self._losses[self._head:],
+                                   self._losses[:self._head]))
+        view.setflags(write=False)
+        return view
+
+    def _history_window(self, time_window, current_time=None):
+        """
+        Seleciona as leituras do histórico dentro de uma janela de tempo.
+
+        Os limites são localizados por busca binária em cada segmento
+        ordenado do buffer circular; leituras só são copiadas quando a
+        janela cruza o ponto de volta do buffer.
+
+        Args:
+            time_window (float): Janela em horas
+            current_time (datetime): Fim da janela (padrão: última leitura)
+
+        Returns:
+            tuple: Timestamps, perdas, somas acumuladas das perdas, matriz das
+                leituras e matriz dos fatores problemáticos da janela (uma
+                linha por leitura nas matrizes)
+        """
+        arrays = (self._ts, self._losses, self._cum_loss, self._sensor_mat,
+                  self._problem_bool)
+        if self._n == 0:
+            return tuple(a[:0] for a in arrays)
+
+        # Após a volta, [head, capacidade) precede [0, head) no tempo
+        head = self._head
+        if self._n < self._capacity:
+            segments = ((0, self._n),)
+        else:
+            segments = ((head, self._capacity), (0, head))
+
+        if current_time is None:
+            end_time = self._ts[head - 1]
+        else:
+            end_time = _as_datetime64(current_time)
+        cutoff = end_time - np.timedelta64(timedelta(hours=time_window))
+
+        slices = []
+        for seg_start, seg_end in segments:
+            ts = self._ts[seg_start:seg_end]
+            start = seg_start + int(np.searchsorted(ts, cutoff, side='left'))
+            end = seg_start + int(np.searchsorted(ts, end_time, side='right'))
+            if start < end:
+                slices.append(slice(start, end))
+
+        if len(slices) == 1:
+            return tuple(a[slices[0]] for a in arrays)
+        return tuple(np.concatenate([a[sl] for sl in slices] or [a[:0]])
+                     for a in arrays)
+
+    def analyze_recent_trends(self, time_window=1.0, current_time=None):
+        """
+        Analisa a tendência das perdas registradas no histórico recente.
+
+        Pressupõe leituras em ordem cronológica, como na simulação.
+
+        Args:
+            time_window (float): Janela de análise em horas
+            current_time (datetime): Fim da janela (padrão: última leitura)
+
+        Returns:
+            dict: Estatísticas, direção da tendência e fatores problemáticos
+                mais frequentes na janela
+        """
+        ts, window, cum, values, problems = self._history_window(time_window,
+                                                                 current_time)
+        if window.size < 3:
+            return {"error": "Dados insuficientes para análise de tendências"}
+
+        # Médias das metades pelas somas acumuladas, sem percorrer a janela
+        size = window.size
+        half = size // 2
+        before = cum[0] - window[0]
+        first_avg = (cum[half - 1] - before) / half
+        second_avg = (cum[-1] - cum[half - 1]) / (size - half)
+
+        trend_direction = "stable"
+        if second_avg > first_avg * 1.1:
+            trend_direction = "increasing"
+        elif second_avg < first_avg * 0.9:
+            trend_direction = "decreasing"
+
+        # Contagem dos fatores a partir da matriz gravada na ingestão, em uma
+        # única redução e sem recalcular severidades
+        counts = problems.sum(axis=0)
+
+        # Severidades de toda a janela em uma chamada: o kernel se estende
+        # à matriz (leituras x fatores) por broadcasting
+        _, severity, below = _score_kernel(values, self._w10, self._lo,
+                                           self._hi, self._span_below,
+                                           self._span_above)
+        severity_sums = np.where(problems, severity, 0.0).sum(axis=0)
+        below_counts = (below & problems).sum(axis=0)
+
+        common_factors = []
+        for k in np.argsort(-counts, kind='stable')[:3]:
+            count = int(counts[k])
+            if not count:
+                break
+
+            # Direção predominante entre as leituras em que o fator foi reportado
+            below_count = int(below_counts[k])
+            if below_count * 2 > count:
+                direction = "below"
+            elif below_count * 2 < count:
+                direction = "above"
+            else:
+                direction = "variable"
+
+            common_factors.append({
+                'factor': self._factor_names[k],
+                'count': count,
+                'frequency': count / window.size,
+                'severity': float(severity_sums[k]) / count,
+                'direction': direction
+            })
+
+        # Limites da janela convertidos para texto em uma única chamada
+        start_time, end_time = np.datetime_as_string(ts[[0, -1]], unit='s')
+
+        return {
+            'samples': int(window.size),
+            'start_time': str(start_time),
+            'end_time': str(end_time),
+            'avg_loss': float((cum[-1] - before) / size),
+            'min_loss': float(window.min()),
+            'max_loss': float(window.max()),
+            'trend_direction': trend_direction,
+            'common_problematic_factors': common_factors
+        }
+
+    def analyze_rolling_losses(self, window=10, time_window=1.0,
+                               current_time=None):
+        """
+        Calcula média e desvio padrão móveis das perdas do histórico recente.
+
+        Cada posição cobre as window leituras que terminam nela; só entram
+        posições com janela completa.
+
+        Args:
+            window (int): Número de leituras por janela móvel
+            time_window (float): Período analisado em horas
+            current_time (datetime): Fim do período (padrão: última leitura)
+
+        Returns:
+            dict: Timestamps do fim de cada janela, médias e desvios móveis
+
+        Raises:
+            ValueError: Se a janela não for positiva
+        """
+        if window < 1:
+            raise ValueError("Janela deve ser um inteiro positivo")
+
+        ts, losses, cum, _, _ = self._history_window(time_window, current_time)
+        if losses.size < window:
+            return {"error": "Dados insuficientes para médias móveis"}
+
+        # Médias pelas somas acumuladas: total até o fim de cada janela menos
+        # o total anterior ao seu início
+        before = cum[0] - losses[0]
+        totals_before = np.concatenate(([before], cum[:losses.size - window]))
+        means = (cum[window - 1:] - totals_before) / window
+
+        # Desvios sobre visões das janelas, sem copiar o histórico
+        stds = sliding_window_view(losses, window).std(axis=1, dtype=np.float64)
+
+        return {
+            'window': window,
+            'timestamps': np.datetime_as_string(ts[window - 1:], unit='s').tolist(),
+            'rolling_mean': means.tolist(),
+            'rolling_std': stds.tolist()
+        }
+
     def _calculate_loss_estimate(self, sensor_data):
         """
         Calcula estimativa de perda baseada nos dados dos sensores.
 
         Args:
-            sensor_data (dict): Leituras dos sensores
+            sensor_data (dict): Leituras dos sensores já normalizadas
+
+        Returns:
+            float: Estimativa de perda em percentual
+        """
+        return self._score(sensor_data)[1]
+
+    def _score(self, sensor_data):
+        """
+        Calcula a perda estimada e a severidade de cada fator.
+
+        As severidades vêm sempre dos valores recebidos e a perda sai delas
+        mesmas; o memo só é consultado quando a chave arredondada está
+        configurada.
+
+        Args:
+            sensor_data (dict): Leituras dos sensores já normalizadas
+
+        Returns:
+            tuple: Valores dos fatores, estimativa de perda em percentual,
+                severidades e máscara dos fatores abaixo da faixa ótima
+        """
+        values = self._factor_values(sensor_data)
+        additional_loss, severity, below = _score_reading(values,
+                                                          self._factor_params)
+        is_raining = bool(sensor_data.get('is_raining'))
+
+        decimals = self._loss_cache_decimals
+        if decimals is None:
+            loss = self._total_loss(additional_loss, is_raining)
+        else:
+            # Sensores ausentes usam o objeto math.nan, cuja identidade
+            # mantém a chave comparável
+            key = tuple([math.nan if x != x else round(x, decimals)
+                         for x in values])
+            loss = self._loss_from_key(key + (is_raining,))
+
+        return values, loss, severity, below
+
+    def _loss_from_tuple(self, key):
+        """
+        Calcula a estimativa de perda a partir da chave arredondada do memo.
+
+        Args:
+            key (tuple): Valores arredondados dos fatores, na ordem de
+                _factor_names, seguidos do indicador de chuva
+
+        Returns:
+            float: Estimativa de perda em percentual
+        """
+        additional_loss = _score_reading(key[:-1], self._factor_params)[0]
+        return self._total_loss(additional_loss, key[-1])
+
+    @staticmethod
+    def _total_loss(additional_loss, is_raining):
+        """
+        Soma a perda base e o efeito da chuva à perda dos fatores.
+
+        Args:
+            additional_loss (float): Perda ponderada pelos desvios dos fatores
+            is_raining (bool): Se está chovendo
 
         Returns:
             float: Estimativa de perda em percentual
         """
         base_loss = 5.0  # Perda base mesmo em condições ideais
-        additional_loss = 0.0
-
-        for factor, properties in self.loss_factors.items():
-            # Verifica se há dados para este fator
-            if factor not in sensor_data:
-                continue
-
-            value = sensor_data[factor]
-            if isinstance(value, dict) and 'value' in value:
-                value = value['value']
-
-            # Calcula desvio do valor ótimo
-            min_optimal, max_optimal = properties['optimal_range']
-
-            if value < min_optimal:
-                # Desvio abaixo do ótimo
-                if properties['critical_below'] is not None:
-                    deviation = (min_optimal - value) / (min_optimal -
-                                                        properties['critical_below'])
-                    deviation = max(0, min(1, deviation))
-                    additional_loss += properties['weight'] * 10 * deviation
-            elif value > max_optimal:
-                # Desvio acima do ótimo
-                if properties['critical_above'] is not None:
-                    deviation = (value - max_optimal) / (properties['critical_above'] -
-                                                       max_optimal)
-                    deviation = max(0, min(1, deviation))
-                    additional_loss += properties['weight'] * 10 * deviation
 
         # Considerar fatores adicionais que podem reduzir ou aumentar perdas
-        if 'is_raining' in sensor_data and sensor_data['is_raining']:
+        if is_raining:
             additional_loss += 2.0  # Chuva aumenta perdas
 
         total_loss = base_loss + additional_loss
         return min(total_loss, 25.0)  # Limita a 25% de perda máxima
 
+    @staticmethod
+    def _flatten_readings(sensor_data):
+        """
+        Normaliza as leituras para um dicionário plano de valores.
+
+        Args:
+            sensor_data (dict): Leituras dos sensores, com valores simples ou
+                no formato {'value': x, ...}
+
+        Returns:
+            dict: Leituras com os valores já desembrulhados
+        """
+        return {name: (value.get('value', value) if type(value) is dict else value)
+                for name, value in sensor_data.items()}
+
+    def _factor_values(self, sensor_data):
+        """
+        Extrai os valores dos fatores de perda na ordem de _factor_names.
+
+        Args:
+            sensor_data (dict): Leituras dos sensores já normalizadas por
+                _flatten_readings
+
+        Returns:
+            list: Valores dos fatores (NaN para sensores ausentes)
+        """
+        values = [sensor_data.get(factor) for factor in self._factor_names]
+        return [math.nan if value is None else value for value in values]
+
     def _categorize_loss(self, loss_value):
         """
         Categoriza a perda estimada.
@@ -175,53 +647,44 @@ class DataAnalyzer:
         Identifica fatores que mais contribuem para as perdas.
 
         Args:
-            sensor_data (dict): Leituras dos sensores
+            sensor_data (dict): Leituras dos sensores já normalizadas
 
         Returns:
             list: Fatores problemáticos ordenados por severidade
         """
-        problematic_factors = []
+        _, _, severity, below = self._score(sensor_data)
+        return self._report_factors(sensor_data, severity, below)
+
+    def _report_factors(self, sensor_data, severity, below):
+        """
+        Monta o relatório dos fatores com severidade significativa.
+
+        Os valores reportados são os recebidos do chamador.
 
-        for factor, properties in self.loss_factors.items():
-            if factor not in sensor_data:
-                continue
-
-            value = sensor_data[factor]
-            if isinstance(value, dict) and 'value' in value:
-                value = value['value']
-
-            min_optimal, max_optimal = properties['optimal_range']
-
-            # Verifica se está fora da faixa ótima
-            if value < min_optimal and properties['critical_below'] is not None:
-                severity = (min_optimal - value) / (min_optimal -
-                                                  properties['critical_below'])
-                severity = max(0, min(1, severity))
-
-                if severity > 0.3:  # Significativo o suficiente para reportar
-                    problematic_factors.append({
-                        'factor': factor,
-                        'value': value,
-                        'optimal_range': properties['optimal_range'],
-                        'severity': severity,
-                        'direction': 'below'
-                    })
-            elif value > max_optimal and properties['critical_above'] is not None:
-                severity = (value - max_optimal) / (properties['critical_above'] -
-                                                  max_optimal)
-                severity = max(0, min(1, severity))
-
-                if severity > 0.3:  # Significativo o suficiente para reportar
-                    problematic_factors.append({
-                        'factor': factor,
-                        'value': value,
-                        'optimal_range': properties['optimal_range'],
-                        'severity': severity,
-                        'direction': 'above'
-                    })
-
-        # Ordena por severidade (mais severo primeiro)
-        problematic_factors.sort(key=lambda x: x['severity'], reverse=True)
+        Args:
+            sensor_data (dict): Leituras dos sensores já normalizadas
+            severity (list): Severidade de cada fator
+            below (list): Indicadores dos fatores abaixo da faixa ótima
+
+        Returns:
+            list: Fatores problemáticos ordenados por severidade
+        """
+        # Significativo o suficiente para reportar, já na ordem de severidade
+        # (mais severo primeiro; empates mantêm a ordem dos fatores)
+        threshold = self._SEVERITY_THRESHOLD
+        hits = [i for i, level in enumerate(severity) if level > threshold]
+        order = sorted(hits, key=severity.__getitem__, reverse=True)
+
+        problematic_factors = []
+        for i in order:
+            factor, _, min_optimal, max_optimal, _, _ = self._factors_tuple[i]
+            problematic_factors.append({
+                'factor': factor,
+                'value': sensor_data[factor],
+                'optimal_range': (min_optimal, max_optimal),
+                'severity': severity[i],
+                'direction': 'below' if below[i] else 'above'
+            })
 
         return problematic_factors
 
@@ -255,31 +718,26 @@ class DataAnalyzer:
         if not loss_values:
             return {"error": "Nenhum valor de perda encontrado nos dados"}
 
+        # Médias das metades calculadas uma vez, por soma sequencial como em
+        # analyze_harvest_losses; servem tanto à tendência quanto à previsão
+        count = len(loss_values)
+        half = count // 2
+        if half:
+            first_avg = sum(loss_values[:half]) / half
+            last_avg = sum(loss_values[half:]) / (count - half)
+
         # Análise de tendência
         trend_direction = "stable"
-        if len(loss_values) >= 3:
-            half = len(loss_values) // 2
-            first_half = loss_values[:half]
-            second_half = loss_values[half:]
-
-            first_avg = sum(first_half) / len(first_half)
-            second_avg = sum(second_half) / len(second_half)
-
-            if second_avg > first_avg * 1.1:
+        if count >= 3:
+            if last_avg > first_avg * 1.1:
                 trend_direction = "increasing"
-            elif second_avg < first_avg * 0.9:
+            elif last_avg < first_avg * 0.9:
                 trend_direction = "decreasing"
 
         # Calcular previsão simples (tendência linear)
         prediction = None
-        if len(loss_values) >= 6:
-            first_half = loss_values[:len(loss_values)//2]
-            last_half = loss_values[len(loss_values)//2:]
-
-            first_avg = sum(first_half) / len(first_half)
-            last_avg = sum(last_half) / len(last_half)
-
-            rate = (last_avg - first_avg) / (len(loss_values)//2)
+        if count >= 6:
+            rate = (last_avg - first_avg) / half
 
             if abs(rate) > 0.01:  # Mudança significativa
                 prediction = last_avg + rate * 5  # Previsão para 5 ciclos à frente
@@ -332,15 +790,15 @@ class DataAnalyzer:
                 'direction': direction
             })
 
-        # Ordena por frequência
-        common_factors.sort(key=lambda x: x['frequency'], reverse=True)
+        # Seleciona os 3 mais frequentes sem ordenar a lista inteira
+        top_factors = heapq.nlargest(3, common_factors, key=itemgetter('frequency'))
 
         return {
             'loss_values': loss_values,           # Lista de valores de perda
             'timestamps': timestamps,             # Lista de timestamps
             'trend_direction': trend_direction,   # increasing, decreasing, stable
             'prediction': prediction,             # Previsão para próximos ciclos
-            'common_factors': common_factors[:3]  # Top 3 fatores mais comuns
+            'common_factors': top_factors         # Top 3 fatores mais comuns
         }
 
 
@@ -349,55 +807,67 @@ class DataAnalyzer:
         Analisa estatísticas detalhadas de perdas na colheita.
 
         Args:
-            loss_data (list): Lista de registros com dados de perdas
+            loss_data (list | np.ndarray): Lista de registros com dados de
+                perdas ou array de perdas em ordem cronológica, como o de
+                losses_view
 
         Returns:
             dict: Resultados da análise de perdas
         """
-        if not loss_data:
+        if loss_data is None or len(loss_data) == 0:
             return {"error": "Dados insuficientes para análise"}
 
         # Extrai valores de perda
-        loss_values = [data['analysis']['loss_estimate']
-                     for data in loss_data
-                     if 'analysis' in data and 'loss_estimate' in data['analysis']]
+        if isinstance(loss_data, np.ndarray):
+            losses = loss_data.astype(np.float64)
+        else:
+            losses = np.array([data['analysis']['loss_estimate']
+                               for data in loss_data
+                               if 'analysis' in data
+                               and 'loss_estimate' in data['analysis']],
+                              dtype=np.float64)
 
-        if not loss_values:
+        if not losses.size:
             return {"error": "Nenhum valor de perda encontrado nos dados"}
 
+        # Médias por soma sequencial, na mesma ordem de arredondamento de
+        # sum(): a soma em pares de ndarray.mean() pode levar uma média no
+        # limite de uma faixa para a categoria vizinha
+        values = losses.tolist()
+        total = len(values)
+
         # Calcula estatísticas
-        avg_loss = sum(loss_values) / len(loss_values)
-        min_loss = min(loss_values)
-        max_loss = max(loss_values)
+        avg_loss = sum(values) / total
+        min_loss = float(losses.min())
+        max_loss = float(losses.max())
 
         # Determina categoria média
         loss_category = self._categorize_loss(avg_loss)
 
         # Análise de tendência
         trend = "estável"
-        if len(loss_values) >= 3:
-            half = len(loss_values) // 2
-            first_half = loss_values[:half]
-            second_half = loss_values[half:]
-
-            first_avg = sum(first_half) / len(first_half)
-            second_avg = sum(second_half) / len(second_half)
+        if total >= 3:
+            half = total // 2
+            first_avg = sum(values[:half]) / half
+            second_avg = sum(values[half:]) / (total - half)
 
             if second_avg > first_avg * 1.1:
                 trend = "aumentando"
             elif second_avg < first_avg * 0.9:
                 trend = "diminuindo"
 
-        # Distribuição por categorias
+        # Distribuição por categorias: faixa de cada perda por busca binária
+        # nos limites [5, 10, 15) e contagem em uma única passada
+        bins = np.searchsorted((5.0, 10.0, 15.0), losses, side='right')
+        minimal, low, medium, high = np.bincount(bins, minlength=4).tolist()
         categories = {
-            'high': sum(1 for x in loss_values if x >= 15),
-            'medium': sum(1 for x in loss_values if 10 <= x < 15),
-            'low': sum(1 for x in loss_values if 5 <= x < 10),
-            'minimal': sum(1 for x in loss_values if x < 5)
+            'high': high,
+            'medium': medium,
+            'low': low,
+            'minimal': minimal
         }
 
         # Percentuais de cada categoria
-        total = len(loss_values)
         category_percentages = {
             cat: (count / total * 100) for cat, count in categories.items()
         }
@@ -412,7 +882,7 @@ class DataAnalyzer:
         loss_value = (potential_yield - actual_yield) * avg_price
 
         return {
-            "count": len(loss_values),
+            "count": total,
             "avg_loss": avg_loss,
             "min_loss": min_loss,
             "max_loss": max_loss,